@@ -1,10 +1,15 @@
 from datetime import date
 from datetime import datetime
 from datetime import timezone
+from unittest.mock import patch
 
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 from app.custom_field.models import CustomField
+from app.custom_field.models import CustomValue
 from app.custom_field.tests.factories import CustomFieldFactory
 from app.custom_field.tests.factories import CustomValueFactory
 from app.models import Person
@@ -169,3 +174,214 @@ class CustomFieldBaseModelManagerTest(APITestCase):
             ],
             Person.objects.first().multiple_choice_value,
         )
+
+
+@override_settings(CUSTOM_FIELD_JSON_AGGREGATION=True)
+class CustomFieldBaseModelManagerJSONAggregationTest(CustomFieldBaseModelManagerTest):
+    # Runs all manager tests again with the json aggregation mode.
+
+    def test_custom_field_base_manager_json_aggregation_uses_one_subquery(
+        self,
+    ) -> None:
+        for i in range(5):
+            CustomFieldFactory(identifier=f"field_{i}", content_type=self.person_ct)
+        sql = str(Person.objects.with_custom_fields().query)
+        self.assertEqual(1, sql.count("JSONB_AGG"))
+        self.assertEqual(2, sql.count("SELECT"))
+
+    def test_custom_field_base_manager_json_aggregation_missing_values(self) -> None:
+        CustomFieldFactory(identifier="char_value", content_type=self.person_ct)
+        CustomFieldFactory(
+            identifier="multiple_choice_value",
+            content_type=self.person_ct,
+            choice_field=True,
+            multiple=True,
+        )
+        person = Person.objects.first()
+        self.assertIsNone(person.char_value)
+        self.assertEqual([], person.multiple_choice_value)
+
+
+@override_settings(CUSTOM_FIELD_GENERATION_CHECK_INTERVAL=60)
+class CustomFieldBaseModelQuerySetTest(APITestCase):
+    def setUp(self) -> None:
+        self.person_ct = ContentType.objects.get_for_model(Person)
+        self.person: Person = PersonFactory()  # type: ignore
+        CustomFieldFactory(identifier="char_value", content_type=self.person_ct)
+        CustomFieldFactory(identifier="text_value", content_type=self.person_ct)
+        self.person.refresh_with_custom_fields()
+        self.person.char_value = "Char value"
+        self.person.text_value = "Text value"
+        self.person.save()
+
+    def test_custom_field_queryset_annotates_nothing_by_default(self) -> None:
+        sql = str(Person.objects.all().query)
+        self.assertNotIn("char_value", sql)
+        self.assertNotIn("custom_field_keys", sql)
+        self.assertEqual(1, sql.count("SELECT"))
+
+    def test_custom_field_queryset_with_custom_fields(self) -> None:
+        query = Person.objects.with_custom_fields().query
+        self.assertEqual(
+            {"char_value", "text_value", "custom_field_keys"},
+            set(query.annotations),
+        )
+
+    def test_custom_field_queryset_with_selected_custom_fields(self) -> None:
+        queryset = Person.objects.with_custom_fields("char_value")
+        self.assertEqual(
+            {"char_value", "custom_field_keys"}, set(queryset.query.annotations)
+        )
+        with self.assertNumQueries(1):
+            person = queryset.get()
+            self.assertEqual("Char value", person.char_value)
+
+    def test_custom_field_queryset_without_custom_fields(self) -> None:
+        queryset = Person.objects.with_custom_fields().without_custom_fields()
+        self.assertEqual({}, queryset.query.annotations)
+        self.assertEqual(self.person, queryset.get())
+
+    def test_custom_field_queryset_loads_custom_fields_lazily(self) -> None:
+        person = Person.objects.get()
+        self.assertNotIn("char_value", person.__dict__)
+        with self.assertNumQueries(1):
+            self.assertEqual("Char value", person.char_value)
+            self.assertEqual("Text value", person.text_value)
+            self.assertEqual(["char_value", "text_value"], person.custom_field_keys)
+
+    def test_custom_field_queryset_loads_custom_fields_of_result_lazily(
+        self,
+    ) -> None:
+        other = PersonFactory()
+        other.refresh_with_custom_fields()
+        other.char_value = "Other char value"
+        other.save()
+        persons = list(Person.objects.order_by("pk"))
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                ["Char value", "Other char value"],
+                [person.char_value for person in persons],
+            )
+            self.assertIsNone(persons[1].text_value)
+
+        persons = list(Person.objects.order_by("pk").iterator(chunk_size=1))
+        with self.assertNumQueries(2):
+            self.assertEqual(
+                ["Char value", "Other char value"],
+                [person.char_value for person in persons],
+            )
+        self.assertNotIn("_custom_field_group", persons[0].__getstate__())
+
+    def test_custom_field_queryset_unknown_attribute(self) -> None:
+        person = Person.objects.get()
+        with self.assertNumQueries(0):
+            self.assertFalse(hasattr(person, "unknown_value"))
+
+    def test_custom_field_manager_annotate_custom_fields(self) -> None:
+        with patch.object(Person.objects, "annotate_custom_fields", True):
+            self.assertIn("char_value", Person.objects.all().query.annotations)
+
+
+@override_settings(CUSTOM_FIELD_GENERATION_CHECK_INTERVAL=60)
+class CustomFieldBaseModelBulkTest(APITestCase):
+    def setUp(self) -> None:
+        self.person_ct = ContentType.objects.get_for_model(Person)
+        CustomFieldFactory(
+            identifier="char_value",
+            content_type=self.person_ct,
+            field_type=CustomField.FIELD_TYPES.CHAR,
+        )
+        CustomFieldFactory(
+            identifier="date_value",
+            content_type=self.person_ct,
+            field_type=CustomField.FIELD_TYPES.DATE,
+        )
+        choice_field = CustomFieldFactory(
+            identifier="multiple_choice_value",
+            content_type=self.person_ct,
+            choice_field=True,
+            multiple=True,
+        )
+        self.choice_1 = CustomValueFactory(field=choice_field, value="choice_1")
+        self.choice_2 = CustomValueFactory(field=choice_field, value="choice_2")
+
+    def _create_persons(self, count: int) -> list[Person]:
+        return Person.objects.bulk_create_with_custom_values(
+            [PersonFactory.build() for _ in range(count)],
+            [
+                {
+                    "char_value": f"Char value {i}",
+                    "date_value": date(2000 + i, 1, 1),
+                    "multiple_choice_value": [self.choice_1],
+                }
+                for i in range(count)
+            ],
+        )
+
+    def test_custom_field_bulk_create_with_custom_values(self) -> None:
+        persons = self._create_persons(3)
+
+        self.assertEqual(3, Person.objects.count())
+        person = Person.objects.get(pk=persons[2].pk)
+        self.assertEqual("Char value 2", person.char_value)
+        self.assertEqual(date(2002, 1, 1), person.date_value)
+        self.assertEqual(
+            [self.choice_1.id], [c["id"] for c in person.multiple_choice_value]
+        )
+
+    def test_custom_field_bulk_create_with_custom_values_constant_queries(
+        self,
+    ) -> None:
+        self._create_persons(1)
+        with CaptureQueriesContext(connection) as context_1:
+            self._create_persons(1)
+        with CaptureQueriesContext(connection) as context_50:
+            self._create_persons(50)
+        self.assertEqual(len(context_1), len(context_50))
+
+    def test_custom_field_bulk_create_with_unknown_custom_field(self) -> None:
+        with self.assertRaises(ValueError):
+            Person.objects.bulk_create_with_custom_values(
+                [PersonFactory.build()], [{"unknown_value": "Value"}]
+            )
+        self.assertEqual(0, Person.objects.count())
+
+    def test_custom_field_bulk_update_custom_values(self) -> None:
+        persons = self._create_persons(2)
+        persons[0].firstname = "Changed"
+
+        Person.objects.bulk_update_custom_values(
+            persons,
+            [
+                {"char_value": "Changed", "multiple_choice_value": [self.choice_2]},
+                {"date_value": None, "multiple_choice_value": None},
+            ],
+            fields=["firstname"],
+        )
+
+        person_1, person_2 = Person.objects.order_by("pk")
+        self.assertEqual("Changed", person_1.firstname)
+        self.assertEqual("Changed", person_1.char_value)
+        self.assertEqual(date(2000, 1, 1), person_1.date_value)
+        self.assertEqual(
+            [self.choice_2.id], [c["id"] for c in person_1.multiple_choice_value]
+        )
+        self.assertEqual("Char value 1", person_2.char_value)
+        self.assertIsNone(person_2.date_value)
+        self.assertEqual([], person_2.multiple_choice_value)
+        # The choices are kept and the removed date value is deleted
+        self.assertEqual(5, CustomValue.objects.count())
+
+    def test_custom_field_bulk_update_custom_values_constant_queries(self) -> None:
+        persons_1 = self._create_persons(1)
+        persons_50 = self._create_persons(50)
+
+        def update(persons: list[Person]) -> int:
+            with CaptureQueriesContext(connection) as context:
+                Person.objects.bulk_update_custom_values(
+                    persons,
+                    [{"char_value": "Changed", "date_value": None} for _ in persons],
+                )
+            return len(context)
+
+        self.assertEqual(update(persons_1), update(persons_50))
@@ -3,6 +3,9 @@ from datetime import datetime
 from datetime import timezone
 
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 from app.custom_field.models import CustomField
 from app.custom_field.models import CustomValue
@@ -13,6 +16,7 @@ from app.models import PersonType
 from app.tests import APITestCase
 from app.tests.factories import PersonFactory
 from app.tests.factories import PersonTypeFactory
+from django_features.custom_fields.registry import custom_field_registry
 
 
 class CustomFieldBaseModelTest(APITestCase):
@@ -436,3 +440,94 @@ class CustomFieldBaseModelTest(APITestCase):
 
         self.assertFalse(hasattr(self.person, "char_value"))
         self.assertEqual("Char value", self.person.get_custom_attr("char_value"))
+
+    @override_settings(CUSTOM_FIELD_GENERATION_CHECK_INTERVAL=60)
+    def test_custom_field_base_model_set_values_with_one_query(self) -> None:
+        fields = [
+            CustomFieldFactory(
+                identifier=f"char_value_{i}",
+                content_type=self.person_ct,
+                field_type=CustomField.FIELD_TYPES.CHAR,
+            )
+            for i in range(10)
+        ]
+        self.person.custom_values.add(
+            CustomValueFactory(field=fields[0], value="Old value")
+        )
+        person = Person.objects.get()
+        custom_field_registry.get_fields(Person)
+
+        with self.assertNumQueries(1):
+            for i in range(10):
+                setattr(person, f"char_value_{i}", f"Char value {i}")
+        self.assertEqual(10, len(person._custom_values_to_save))
+        person.save()
+
+        self.assertEqual(10, CustomValue.objects.count())
+        self.assertEqual("Char value 0", Person.objects.get().char_value_0)
+
+    def test_custom_field_base_model_save_value_of_deleted_field(self) -> None:
+        field = CustomFieldFactory(
+            identifier="char_value",
+            content_type=self.person_ct,
+            field_type=CustomField.FIELD_TYPES.CHAR,
+        )
+        self.person.refresh_with_custom_fields()
+        self.person.char_value = "Char value"
+        field.delete()
+
+        self.person.save()
+        self.assertEqual(0, CustomValue.objects.count())
+
+    @override_settings(CUSTOM_FIELD_GENERATION_CHECK_INTERVAL=60)
+    def test_custom_field_base_model_save_value_of_unknown_field(self) -> None:
+        custom_field_registry.get_fields(Person)
+        # The registry isn't notified of fields created without signals.
+        field = CustomField.objects.bulk_create(
+            [
+                CustomField(
+                    identifier="char_value",
+                    content_type=self.person_ct,
+                    field_type=CustomField.FIELD_TYPES.CHAR,
+                )
+            ]
+        )[0]
+        self.person._custom_values_to_save.append(
+            CustomValue(field=field, value="Char value")
+        )
+
+        self.person.save()
+        self.assertEqual(
+            ["Char value"], [v.value for v in self.person.custom_values.all()]
+        )
+
+    @override_settings(CUSTOM_FIELD_GENERATION_CHECK_INTERVAL=60)
+    def test_custom_field_base_model_save_values_with_constant_queries(self) -> None:
+        for i in range(20):
+            CustomFieldFactory(
+                identifier=f"char_value_{i}",
+                content_type=self.person_ct,
+                field_type=CustomField.FIELD_TYPES.CHAR,
+            )
+
+        def save_values(pk: int, count: int) -> int:
+            person = Person.objects.get(pk=pk)
+            for i in range(count):
+                setattr(person, f"char_value_{i}", f"Char value {count}")
+            with CaptureQueriesContext(connection) as context:
+                person.save()
+            return len(context.captured_queries)
+
+        other_person: Person = PersonFactory()  # type: ignore
+        # The first calls create the values, the second calls update them.
+        self.assertEqual(
+            save_values(self.person.pk, 20), save_values(other_person.pk, 2)
+        )
+        self.assertEqual(
+            save_values(self.person.pk, 20), save_values(other_person.pk, 2)
+        )
+
+        person = Person.objects.get(pk=self.person.pk)
+        self.assertEqual("Char value 20", person.char_value_19)
+        self.assertEqual(20, person.custom_values.count())
+        self.assertEqual(22, CustomValue.objects.count())
@@ -0,0 +1,272 @@
+from datetime import date
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from app.custom_field.models import CustomField
+from app.custom_field.tests.factories import CustomFieldFactory
+from app.custom_field.tests.factories import CustomValueFactory
+from app.models import Address
+from app.models import Person
+from app.tests import APITestCase
+from app.tests.factories import AddressFactory
+from app.tests.factories import PersonFactory
+from django_features.custom_fields.filters import custom_field_filterset_factory
+from django_features.custom_fields.filters import CustomFieldOrderingFilter
+from django_features.custom_fields.indexes import get_custom_field_index_name
+from django_features.custom_fields.indexes import sync_custom_field_indexes
+
+
+PersonFilterSet = custom_field_filterset_factory(Person, fields=["firstname"])
+AddressFilterSet = custom_field_filterset_factory(Address)
+
+
+class CustomFieldFilterSetTest(APITestCase):
+    def setUp(self) -> None:
+        self.person_ct = ContentType.objects.get_for_model(Person)
+        CustomFieldFactory(
+            identifier="birthday",
+            content_type=self.person_ct,
+            field_type=CustomField.FIELD_TYPES.DATE,
+            filterable=True,
+        )
+        CustomFieldFactory(
+            identifier="hobbies",
+            content_type=self.person_ct,
+            multiple=True,
+            filterable=True,
+        )
+        choice_field = CustomFieldFactory(
+            identifier="color",
+            content_type=self.person_ct,
+            choice_field=True,
+            filterable=True,
+        )
+        CustomFieldFactory(identifier="nickname", content_type=self.person_ct)
+        self.red = CustomValueFactory(field=choice_field, value="red")
+        self.blue = CustomValueFactory(field=choice_field, value="blue")
+
+        self.person_1 = PersonFactory()
+        self.person_1.refresh_with_custom_fields()
+        self.person_1.birthday = date(2000, 1, 1)
+        self.person_1.hobbies = ["chess", "golf"]
+        self.person_1.color = self.red
+        self.person_1.save()
+
+        self.person_2 = PersonFactory()
+        self.person_2.refresh_with_custom_fields()
+        self.person_2.birthday = date(2010, 1, 1)
+        self.person_2.color = self.blue
+        self.person_2.save()
+
+        self.person_3 = PersonFactory()
+
+    def filter(self, data: dict) -> list[Person]:
+        filterset = PersonFilterSet(data=data, queryset=Person.objects.order_by("id"))
+        self.assertTrue(filterset.is_valid(), filterset.errors)
+        return list(filterset.qs)
+
+    def test_custom_field_filterset_filters(self) -> None:
+        filterset = PersonFilterSet(queryset=Person.objects.all())
+        self.assertEqual(
+            [
+                "birthday",
+                "birthday__in",
+                "birthday__isnull",
+                "birthday__range",
+                "color",
+                "color__in",
+                "color__isnull",
+                "firstname",
+                "hobbies__contains",
+                "hobbies__isnull",
+            ],
+            sorted(filterset.filters),
+        )
+
+    def test_custom_field_filterset_typed_lookups(self) -> None:
+        self.assertEqual([self.person_1], self.filter({"birthday": "2000-01-01"}))
+        self.assertEqual(
+            [self.person_1, self.person_2],
+            self.filter({"birthday__in": "2000-01-01,2010-01-01"}),
+        )
+        self.assertEqual(
+            [self.person_2], self.filter({"birthday__range": "2005-01-01,2015-01-01"})
+        )
+        self.assertEqual([self.person_3], self.filter({"birthday__isnull": "true"}))
+        self.assertEqual(
+            [self.person_1, self.person_2], self.filter({"birthday__isnull": "false"})
+        )
+
+    def test_custom_field_filterset_multiple_and_choice_lookups(self) -> None:
+        self.assertEqual([self.person_1], self.filter({"hobbies__contains": "golf"}))
+        self.assertEqual([], self.filter({"hobbies__contains": "tennis"}))
+        self.assertEqual(
+            [self.person_2, self.person_3], self.filter({"hobbies__isnull": "true"})
+        )
+        self.assertEqual([self.person_2], self.filter({"color": self.blue.id}))
+        self.assertEqual(
+            [self.person_1, self.person_2],
+            self.filter({"color__in": f"{self.red.id},{self.blue.id}"}),
+        )
+        self.assertEqual([self.person_3], self.filter({"color__isnull": "true"}))
+
+    def test_custom_field_filterset_multiple_choice_lookups(self) -> None:
+        sports = CustomFieldFactory(
+            identifier="sports",
+            content_type=self.person_ct,
+            choice_field=True,
+            multiple=True,
+            filterable=True,
+        )
+        golf = CustomValueFactory(field=sports, value="golf")
+        chess = CustomValueFactory(field=sports, value="chess")
+        self.person_1.refresh_with_custom_fields()
+        self.person_1.sports = [golf, chess]
+        self.person_1.save()
+        self.person_2.refresh_with_custom_fields()
+        self.person_2.sports = [chess]
+        self.person_2.save()
+
+        self.assertEqual([self.person_1], self.filter({"sports__contains": golf.id}))
+        self.assertEqual(
+            [self.person_1, self.person_2],
+            self.filter({"sports__contains": chess.id}),
+        )
+        self.assertEqual([self.person_3], self.filter({"sports__isnull": "true"}))
+
+    def test_custom_field_filterset_uses_exists_subqueries(self) -> None:
+        filterset = PersonFilterSet(
+            data={"birthday__range": "2005-01-01,2015-01-01"},
+            queryset=Person.objects.all(),
+        )
+        sql = str(filterset.qs.query)
+        self.assertIn("EXISTS", sql)
+        self.assertIn("custom_field_date", sql)
+        self.assertEqual({}, filterset.qs.query.annotations)
+
+    def test_custom_field_filterset_storage_field(self) -> None:
+        address_ct = ContentType.objects.get_for_model(Address)
+        CustomFieldFactory(
+            identifier="floor",
+            content_type=address_ct,
+            field_type=CustomField.FIELD_TYPES.INTEGER,
+            filterable=True,
+        )
+        address_1 = AddressFactory(custom_value_data={"floor": 3})
+        address_2 = AddressFactory(custom_value_data={"floor": 12})
+        AddressFactory()
+
+        def filter(data: dict) -> list[Address]:
+            filterset = AddressFilterSet(
+                data=data, queryset=Address.objects.order_by("id")
+            )
+            self.assertTrue(filterset.is_valid(), filterset.errors)
+            return list(filterset.qs)
+
+        self.assertEqual([address_2], filter({"floor__range": "10,20"}))
+        self.assertEqual([address_1, address_2], filter({"floor__in": "3,12"}))
+        self.assertEqual(2, len(filter({"floor__isnull": "false"})))
+
+
+class PersonOrderingView(APIView):
+    ordering_fields = ["firstname"]
+
+
+class CustomFieldOrderingFilterTest(APITestCase):
+    def setUp(self) -> None:
+        self.person_ct = ContentType.objects.get_for_model(Person)
+        CustomFieldFactory(
+            identifier="birthday",
+            content_type=self.person_ct,
+            field_type=CustomField.FIELD_TYPES.DATE,
+        )
+        CustomFieldFactory(
+            identifier="hobbies", content_type=self.person_ct, multiple=True
+        )
+        self.person_1 = PersonFactory(firstname="A")
+        self.person_1.refresh_with_custom_fields()
+        self.person_1.birthday = date(2010, 1, 1)
+        self.person_1.save()
+        self.person_2 = PersonFactory(firstname="B")
+        self.person_2.refresh_with_custom_fields()
+        self.person_2.birthday = date(2000, 1, 1)
+        self.person_2.save()
+        self.person_3 = PersonFactory(firstname="C")
+
+    def order(self, ordering: str) -> list[Person]:
+        request = Request(APIRequestFactory().get("/", {"ordering": ordering}))
+        return list(
+            CustomFieldOrderingFilter().filter_queryset(
+                request, Person.objects.all(), PersonOrderingView()
+            )
+        )
+
+    def test_custom_field_ordering_filter(self) -> None:
+        self.assertEqual(
+            [self.person_2, self.person_1, self.person_3], self.order("birthday")
+        )
+        self.assertEqual(
+            [self.person_1, self.person_2, self.person_3], self.order("-birthday")
+        )
+        self.assertEqual(
+            [self.person_3, self.person_2, self.person_1], self.order("-firstname")
+        )
+        # Lists and unknown fields are ignored
+        self.assertEqual(
+            [self.person_2, self.person_1, self.person_3],
+            self.order("hobbies,unknown,birthday"),
+        )
+
+    def test_custom_field_ordering_subquery_is_restricted_to_the_field(self) -> None:
+        queryset = Person.objects.order_by_custom_fields("birthday", "firstname")
+        sql = str(queryset.query)
+        self.assertIn("custom_field_date", sql)
+        self.assertNotIn("custom_field_customfield", sql)
+        self.assertEqual({}, queryset.query.annotations)
+
+        with self.assertRaises(ValueError):
+            Person.objects.order_by_custom_fields("hobbies")
+
+    def test_custom_field_ordering_joins_the_values_of_the_field(self) -> None:
+        field = CustomFieldFactory(
+            identifier="nickname", content_type=self.person_ct, filterable=True
+        )
+        for person, nickname in ((self.person_1, "b"), (self.person_3, "a")):
+            person.refresh_with_custom_fields()
+            person.nickname = nickname
+            person.save()
+
+        queryset = Person.objects.order_by_custom_fields("-nickname", "birthday")
+        self.assertIn(
+            'LEFT OUTER JOIN (SELECT "app_person_custom_values"', str(queryset.query)
+        )
+        self.assertEqual([self.person_1, self.person_3, self.person_2], list(queryset))
+        self.assertEqual(3, queryset.count())
+
+        sync_custom_field_indexes()
+        with connection.cursor() as cursor:
+            cursor.execute("SET enable_seqscan = off")
+            try:
+                self.assertIn(get_custom_field_index_name(field), queryset.explain())
+            finally:
+                cursor.execute("SET enable_seqscan = on")
+                field.delete()
+                sync_custom_field_indexes()
+
+    def test_custom_field_ordering_storage_field(self) -> None:
+        CustomFieldFactory(
+            identifier="floor",
+            content_type=ContentType.objects.get_for_model(Address),
+            field_type=CustomField.FIELD_TYPES.INTEGER,
+        )
+        address_1 = AddressFactory(custom_value_data={"floor": 12})
+        address_2 = AddressFactory(custom_value_data={"floor": 3})
+        address_3 = AddressFactory()
+        self.assertEqual(
+            [address_2, address_1, address_3],
+            list(Address.objects.order_by_custom_fields("floor")),
+        )
@@ -0,0 +1,137 @@
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+
+from app.custom_field.models import CustomField
+from app.custom_field.models import CustomValue
+from app.custom_field.tests.factories import CustomFieldFactory
+from app.custom_field.tests.factories import CustomValueFactory
+from app.models import Person
+from app.tests import APITestCase
+from django_features.custom_fields.indexes import CustomValueExpression
+from django_features.custom_fields.indexes import get_custom_field_index_name
+from django_features.custom_fields.indexes import sync_custom_field_indexes
+
+
+class CustomFieldIndexesTest(APITestCase):
+    def setUp(self) -> None:
+        self.person_ct = ContentType.objects.get_for_model(Person)
+        # Drop the indexes left over by other tests.
+        sync_custom_field_indexes()
+
+    def tearDown(self) -> None:
+        CustomField.objects.all().delete()
+        sync_custom_field_indexes()
+        super().tearDown()
+
+    def test_custom_field_indexes_sync_filterable_fields(self) -> None:
+        field = CustomFieldFactory(
+            identifier="birthday",
+            content_type=self.person_ct,
+            field_type=CustomField.FIELD_TYPES.DATE,
+            filterable=True,
+        )
+        CustomFieldFactory(identifier="hobby", content_type=self.person_ct)
+        CustomFieldFactory(
+            identifier="choice",
+            content_type=self.person_ct,
+            choice_field=True,
+            filterable=True,
+        )
+        index_name = f"custom_value_{field.id}_date"
+
+        self.assertEqual(([index_name], []), sync_custom_field_indexes())
+        self.assertEqual(([], []), sync_custom_field_indexes())
+
+        field.field_type = CustomField.FIELD_TYPES.INTEGER
+        field.save()
+        self.assertEqual(
+            ([f"custom_value_{field.id}_integer"], [index_name]),
+            sync_custom_field_indexes(),
+        )
+
+        field.filterable = False
+        field.save()
+        self.assertEqual(
+            ([], [f"custom_value_{field.id}_integer"]), sync_custom_field_indexes()
+        )
+
+    def test_custom_field_indexes_multiple_field(self) -> None:
+        field = CustomFieldFactory(
+            identifier="hobbies",
+            content_type=self.person_ct,
+            multiple=True,
+            filterable=True,
+        )
+        self.assertEqual(
+            f"custom_value_{field.id}_multiple", get_custom_field_index_name(field)
+        )
+        self.assertEqual(
+            ([f"custom_value_{field.id}_multiple"], []), sync_custom_field_indexes()
+        )
+
+    def test_custom_field_indexes_expression_uses_index(self) -> None:
+        field = CustomFieldFactory(
+            identifier="birthday",
+            content_type=self.person_ct,
+            field_type=CustomField.FIELD_TYPES.DATE,
+            filterable=True,
+        )
+        CustomValueFactory(field=field, value="2000-01-01")
+        CustomValueFactory(field=field, value="2001-01-01")
+        sync_custom_field_indexes()
+
+        queryset = CustomValue.objects.annotate(
+            typed_value=CustomValueExpression(field)
+        ).filter(field=field, typed_value__gte="2000-06-01")
+        self.assertEqual(["2001-01-01"], [value.value for value in queryset])
+
+        with connection.cursor() as cursor:
+            cursor.execute("SET enable_seqscan = off")
+            try:
+                self.assertIn(get_custom_field_index_name(field), queryset.explain())
+            finally:
+                cursor.execute("SET enable_seqscan = on")
+
+    @override_settings(CUSTOM_FIELD_SYNC_INDEXES=True)
+    def test_custom_field_indexes_sync_on_save(self) -> None:
+        field = CustomFieldFactory(
+            identifier="birthday",
+            content_type=self.person_ct,
+            field_type=CustomField.FIELD_TYPES.DATE,
+            filterable=True,
+        )
+        self.assertEqual(([], []), sync_custom_field_indexes())
+        field.delete()
+        self.assertEqual(([], []), sync_custom_field_indexes())
+
+    def test_custom_field_indexes_recreate_invalid_index(self) -> None:
+        field = CustomFieldFactory(
+            identifier="birthday",
+            content_type=self.person_ct,
+            filterable=True,
+        )
+        name = get_custom_field_index_name(field)
+        self.assertEqual(([name], []), sync_custom_field_indexes())
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "UPDATE pg_index SET indisvalid = false WHERE indexrelid = %s::regclass",
+                [name],
+            )
+        self.assertEqual(([name], [name]), sync_custom_field_indexes(concurrently=True))
+        self.assertEqual(([], []), sync_custom_field_indexes())
+
+    def test_custom_field_indexes_command(self) -> None:
+        field = CustomFieldFactory(
+            identifier="birthday",
+            content_type=self.person_ct,
+            filterable=True,
+        )
+        call_command("sync_custom_field_indexes")
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexname FROM pg_indexes WHERE indexname = %s",
+                [get_custom_field_index_name(field)],
+            )
+            self.assertEqual(1, len(cursor.fetchall()))
@@ -1,8 +1,12 @@
 from datetime import date
 from datetime import datetime
 from datetime import timezone
+from unittest import mock
 
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework.exceptions import ValidationError
 
 from app.custom_field.models import CustomField
@@ -13,6 +17,12 @@ from app.models import Person
 from app.serializers.person import PersonSerializer
 from app.tests import APITestCase
 from app.tests.factories import PersonFactory
+from django_features.custom_fields.serializers import _get_filter_cache_key
+from django_features.custom_fields.serializers import CustomFieldBaseModelListSerializer
+
+
+class BulkPersonSerializer(PersonSerializer):
+    _bulk_create = True
 
 
 class CustomFieldBaseModelSerializerTest(APITestCase):
@@ -472,3 +482,258 @@ class CustomFieldBaseModelSerializerTest(APITestCase):
         self.assertEqual(
             1, CustomValue.objects.filter(field__choice_field=False).count()
         )
+
+    def test_custom_field_base_model_serializer_create_many(self) -> None:
+        data = [
+            {
+                "email": f"john.doe.{i}@example.com",
+                "firstname": "John",
+                "lastname": f"Doe {i}",
+                "char_value": f"Some char value {i}",
+                "date_value": "2000-01-01",
+                "multiple_date_value": ["2000-01-01", "2001-01-01"],
+                "choice_value": self.choice_1.id,
+                "multiple_choice_value": [self.multiple_choice_1.id],
+            }
+            for i in range(3)
+        ]
+        self.assertNotIsInstance(
+            PersonSerializer(data=data, many=True), CustomFieldBaseModelListSerializer
+        )
+        serializer = BulkPersonSerializer(data=data, many=True)
+        self.assertIsInstance(serializer, CustomFieldBaseModelListSerializer)
+        self.assertTrue(serializer.is_valid(raise_exception=True))
+        instances = serializer.save()
+
+        self.assertEqual(3, len(instances))
+        instance = Person.objects.get(pk=instances[2].pk)
+        self.assertEqual("Doe 2", instance.lastname)
+        self.assertEqual("Some char value 2", instance.char_value)
+        self.assertEqual(date(2000, 1, 1), instance.date_value)
+        self.assertEqual(
+            [date(2000, 1, 1), date(2001, 1, 1)], instance.multiple_date_value
+        )
+        self.assertEqual(self.choice_1.id, instance.choice_value["id"])
+        self.assertEqual(
+            [self.multiple_choice_1.id],
+            [choice["id"] for choice in instance.multiple_choice_value],
+        )
+
+    @override_settings(CUSTOM_FIELD_GENERATION_CHECK_INTERVAL=60)
+    def test_custom_field_base_model_serializer_create_many_constant_queries(
+        self,
+    ) -> None:
+        def create(count: int) -> int:
+            serializer = BulkPersonSerializer(
+                data=[
+                    {
+                        "email": f"john.doe.{i}@example.com",
+                        "firstname": "John",
+                        "lastname": "Doe",
+                        "char_value": "Some char value",
+                        "integer_value": i,
+                    }
+                    for i in range(count)
+                ],
+                many=True,
+            )
+            serializer.is_valid(raise_exception=True)
+            with CaptureQueriesContext(connection) as context:
+                serializer.save()
+            return len(context)
+
+        self.assertEqual(create(1), create(50))
+        self.assertEqual(52, Person.objects.count())
+        self.assertEqual(51, CustomValue.objects.filter(field=self.char_field).count())
+
+    @override_settings(CUSTOM_FIELD_GENERATION_CHECK_INTERVAL=60)
+    def test_custom_field_base_model_serializer_update_constant_queries(
+        self,
+    ) -> None:
+        for i in range(20):
+            CustomFieldFactory(
+                identifier=f"char_value_{i}",
+                content_type=self.person_ct,
+                field_type=CustomField.FIELD_TYPES.CHAR,
+            )
+
+        def update(count: int, value: str) -> int:
+            serializer = PersonSerializer(
+                self.person,
+                data={f"char_value_{i}": value for i in range(count)},
+                partial=True,
+            )
+            serializer.is_valid(raise_exception=True)
+            with CaptureQueriesContext(connection) as context:
+                serializer.save()
+            return len(context)
+
+        # create, update and delete the values
+        self.assertEqual(update(1, "Created"), update(20, "Created"))
+        self.assertEqual(update(1, "Updated"), update(20, "Updated"))
+        self.assertEqual(update(1, None), update(20, None))
+        self.assertEqual(
+            0, CustomValue.objects.filter(field__identifier__startswith="char").count()
+        )
+
+    def test_custom_field_base_model_serializer_update_without_custom_field_manager(
+        self,
+    ) -> None:
+        with mock.patch.object(Person, "objects", Person._base_manager):
+            serializer = PersonSerializer(
+                self.person,
+                data={
+                    "char_value": "Some char value",
+                    "choice_value": self.choice_1.id,
+                },
+                partial=True,
+            )
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
+
+        person = Person.objects.get(pk=self.person.pk)
+        self.assertEqual("Some char value", person.char_value)
+        self.assertEqual(self.choice_1.id, person.choice_value["id"])
+
+    def test_custom_field_base_model_serializer_update_unchanged_value(self) -> None:
+        self.person.char_value = "Some char value"
+        self.person.save()
+        modified = CustomValue.objects.get(field=self.char_field).modified
+
+        serializer = PersonSerializer(
+            self.person, data={"char_value": "Some char value"}, partial=True
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        self.assertEqual(
+            modified, CustomValue.objects.get(field=self.char_field).modified
+        )
+
+    @override_settings(CUSTOM_FIELD_GENERATION_CHECK_INTERVAL=60)
+    def test_custom_field_base_model_serializer_validate_many_choices_constant_queries(
+        self,
+    ) -> None:
+        def validate(count: int) -> int:
+            serializer = PersonSerializer(
+                data=[
+                    {
+                        "email": f"john.doe.{i}@example.com",
+                        "firstname": "John",
+                        "lastname": "Doe",
+                        "choice_value": self.choice_1.id,
+                        "multiple_choice_value": [
+                            self.multiple_choice_1.id,
+                            self.multiple_choice_2.id,
+                        ],
+                    }
+                    for i in range(count)
+                ],
+                many=True,
+            )
+            with CaptureQueriesContext(connection) as context:
+                serializer.is_valid(raise_exception=True)
+            return len(context)
+
+        self.assertEqual(validate(1), validate(50))
+
+    def test_custom_field_base_model_serializer_validate_many_unknown_choice(
+        self,
+    ) -> None:
+        serializer = PersonSerializer(
+            data=[
+                {"choice_value": self.choice_1.id},
+                {"choice_value": self.multiple_choice_1.id},
+            ],
+            many=True,
+            partial=True,
+        )
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("choice_value", serializer.errors[1])
+
+    def test_custom_field_base_model_serializer_validate_many_strict_choices(
+        self,
+    ) -> None:
+        serializer = PersonSerializer(
+            data=[{"choice_value": self.choice_1.id}] * 2, many=True, partial=True
+        )
+        serializer.child.fields["choice_value"].choice_cache.get_choices(
+            self.choice_field, "id"
+        )
+        self.choice_1.delete()
+
+        self.assertTrue(serializer.is_valid())
+
+        serializer = PersonSerializer(
+            data=[{"choice_value": self.choice_2.id}] * 2, many=True, partial=True
+        )
+        serializer.child.fields["choice_value"].strict = True
+        serializer.child.fields["choice_value"].choice_cache.get_choices(
+            self.choice_field, "id"
+        )
+        self.choice_2.delete()
+
+        self.assertFalse(serializer.is_valid())
+
+    @override_settings(CUSTOM_FIELD_GENERATION_CHECK_INTERVAL=60)
+    def test_custom_field_base_model_serializer_caches_custom_fields(self) -> None:
+        fields = PersonSerializer().fields
+
+        with self.assertNumQueries(0):
+            cached_fields = PersonSerializer().fields
+        self.assertEqual(list(fields), list(cached_fields))
+        self.assertIsNot(fields["char_value"], cached_fields["char_value"])
+        self.assertIs(fields["choice_value"].field, cached_fields["choice_value"].field)
+
+        CustomFieldFactory(identifier="new_value", content_type=self.person_ct)
+        self.assertIn("new_value", PersonSerializer().fields)
+
+    def test_custom_field_base_model_serializer_list_constant_queries(self) -> None:
+        def count_queries() -> int:
+            with CaptureQueriesContext(connection) as context:
+                PersonSerializer(Person.objects.all(), many=True).data
+            return len(context.captured_queries)
+
+        PersonFactory.create_batch(2)
+        queries = count_queries()
+        PersonFactory.create_batch(8)
+        self.assertEqual(queries, count_queries())
+
+    def test_custom_field_base_model_serializer_cache_filter_keys(self) -> None:
+        def get_fields(filter: dict) -> list[str]:
+            serializer = PersonSerializer()
+            serializer.filter = filter
+            return [
+                name
+                for name in serializer.fields
+                if name.endswith(("_value", "_field"))
+            ]
+
+        # Querysets aren't cached, their reprs can be equal for different queries
+        self.assertEqual(
+            ["char_value"],
+            get_fields({"pk__in": CustomField.objects.filter(identifier="char_value")}),
+        )
+        self.assertEqual(
+            ["text_value"],
+            get_fields({"pk__in": CustomField.objects.filter(identifier="text_value")}),
+        )
+        self.assertEqual(["char_value"], get_fields({"pk": self.char_field.pk}))
+        self.assertEqual(["text_value"], get_fields({"pk": self.text_field.pk}))
+
+        self.assertIsNone(_get_filter_cache_key({"type_object": Person()}))
+        self.assertIsNone(_get_filter_cache_key({"pk__in": [Person()]}))
+        self.assertNotEqual(
+            _get_filter_cache_key({"type_object": self.person}),
+            _get_filter_cache_key({"type_object": PersonFactory()}),
+        )
+
+    def test_custom_field_base_model_serializer_caches_choice_options(self) -> None:
+        class StrictPersonSerializer(PersonSerializer):
+            _strict_choices = True
+            _unique_choice_field = "value"
+
+        self.assertEqual("id", PersonSerializer().fields["choice_value"]._unique_field)
+        field = StrictPersonSerializer().fields["choice_value"]
+        self.assertEqual("value", field._unique_field)
+        self.assertTrue(field.strict)
@@ -0,0 +1,78 @@
+from django.contrib.contenttypes.models import ContentType
+from django.test import override_settings
+
+from app.custom_field.models import CustomField
+from app.custom_field.tests.factories import CustomFieldFactory
+from app.models import Address
+from app.models import Person
+from app.tests import APITestCase
+from app.tests.factories import PersonFactory
+from django_features.custom_fields.models import CustomFieldGeneration
+from django_features.custom_fields.registry import custom_field_registry
+
+
+class CustomFieldRegistryTest(APITestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.person_ct = ContentType.objects.get_for_model(Person)
+        self.birthday = CustomFieldFactory(
+            identifier="birthday", content_type=self.person_ct
+        )
+        CustomFieldFactory(
+            identifier="floor", content_type=ContentType.objects.get_for_model(Address)
+        )
+
+    def test_custom_field_registry_get_fields_per_model(self) -> None:
+        self.assertEqual(["birthday"], custom_field_registry.get_identifiers(Person))
+        self.assertEqual(["floor"], custom_field_registry.get_identifiers(Address))
+        self.assertEqual(
+            self.birthday, custom_field_registry.get_field(Person, "birthday")
+        )
+        self.assertIsNone(custom_field_registry.get_field(Person, "floor"))
+
+    def test_custom_field_registry_caches_fields(self) -> None:
+        custom_field_registry.get_fields(Person)
+        with self.assertNumQueries(0):
+            custom_field_registry.get_fields(Person)
+            custom_field_registry.get_field(Person, "birthday")
+
+    def test_custom_field_registry_is_invalidated_on_save(self) -> None:
+        custom_field_registry.get_fields(Person)
+        CustomFieldFactory(identifier="hobby", content_type=self.person_ct)
+        self.assertEqual(
+            ["birthday", "hobby"], custom_field_registry.get_identifiers(Person)
+        )
+
+        field = CustomField.objects.get(identifier="hobby")
+        field.identifier = "hobbies"
+        field.save()
+        self.assertEqual(
+            ["birthday", "hobbies"], custom_field_registry.get_identifiers(Person)
+        )
+
+    def test_custom_field_registry_is_invalidated_on_delete(self) -> None:
+        custom_field_registry.get_fields(Person)
+        self.birthday.delete()
+        self.assertEqual([], custom_field_registry.get_identifiers(Person))
+
+    def test_custom_field_registry_save_increments_generation(self) -> None:
+        generation = CustomFieldGeneration.current()
+        CustomFieldFactory(identifier="hobby", content_type=self.person_ct)
+        self.assertEqual(generation + 1, CustomFieldGeneration.current())
+
+    @override_settings(CUSTOM_FIELD_GENERATION_CHECK_INTERVAL=0)
+    def test_custom_field_registry_notices_changes_of_other_processes(self) -> None:
+        custom_field_registry.get_fields(Person)
+
+        # Changes of other processes don't send signals in this process.
+        CustomField.objects.filter(id=self.birthday.id).update(identifier="birth")
+        self.assertEqual(["birthday"], custom_field_registry.get_identifiers(Person))
+
+        CustomFieldGeneration.increment()
+        self.assertEqual(["birth"], custom_field_registry.get_identifiers(Person))
+
+    def test_custom_field_registry_removes_schema_query_from_querysets(self) -> None:
+        PersonFactory()
+        list(Person.objects.all())
+        with self.assertNumQueries(1):
+            list(Person.objects.all())
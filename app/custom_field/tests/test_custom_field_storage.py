@@ -0,0 +1,143 @@
+from datetime import date
+
+from django.contrib.contenttypes.models import ContentType
+
+from app.custom_field.models import CustomField
+from app.custom_field.models import CustomValue
+from app.custom_field.tests.factories import CustomFieldFactory
+from app.custom_field.tests.factories import CustomValueFactory
+from app.models import Address
+from app.tests import APITestCase
+from app.tests.factories import AddressFactory
+from django_features.custom_fields.serializers import CustomFieldBaseModelSerializer
+
+
+class AddressSerializer(CustomFieldBaseModelSerializer):
+    class Meta:
+        model = Address
+        fields = ["city", "street"]
+
+
+class CustomFieldStorageTest(APITestCase):
+    # We use the app.Address model, which stores the values of the non-choice custom fields
+    # in the custom_value_data field.
+
+    def setUp(self) -> None:
+        self.address_ct = ContentType.objects.get_for_model(Address)
+        CustomFieldFactory(
+            identifier="char_value",
+            content_type=self.address_ct,
+            field_type=CustomField.FIELD_TYPES.CHAR,
+        )
+        CustomFieldFactory(
+            identifier="multiple_date_value",
+            content_type=self.address_ct,
+            field_type=CustomField.FIELD_TYPES.DATE,
+            multiple=True,
+        )
+        choice_field = CustomFieldFactory(
+            identifier="choice_value",
+            content_type=self.address_ct,
+            choice_field=True,
+        )
+        self.choice = CustomValueFactory(field=choice_field, value="choice")
+        self.address: Address = AddressFactory()  # type: ignore
+
+    def test_custom_field_storage_set_values(self) -> None:
+        self.address.refresh_with_custom_fields()
+        self.address.char_value = "Char value"
+        self.address.multiple_date_value = [date(2000, 1, 1)]
+        self.address.choice_value = self.choice
+        self.address.save()
+
+        self.assertEqual(
+            {"char_value": "Char value", "multiple_date_value": ["2000-01-01"]},
+            Address.objects.get().custom_value_data,
+        )
+        # Only the choice is stored in the value table
+        self.assertEqual(1, CustomValue.objects.count())
+        self.assertEqual([self.choice], list(self.address.custom_values.all()))
+
+        self.address.char_value = None
+        self.address.save()
+        self.assertEqual(
+            {"multiple_date_value": ["2000-01-01"]},
+            Address.objects.get().custom_value_data,
+        )
+
+    def test_custom_field_storage_read_values_without_subqueries(self) -> None:
+        self.address.custom_value_data = {"multiple_date_value": ["2000-01-01"]}
+        self.address.save()
+
+        queryset = Address.objects.with_custom_fields()
+        self.assertEqual(
+            {"choice_value", "custom_field_keys"}, set(queryset.query.annotations)
+        )
+        address = queryset.get()
+        self.assertIsNone(address.char_value)
+        self.assertEqual([date(2000, 1, 1)], address.multiple_date_value)
+
+        with self.assertNumQueries(1):
+            address = Address.objects.get()
+            self.assertEqual([date(2000, 1, 1)], address.multiple_date_value)
+
+    def test_custom_field_storage_filter_values(self) -> None:
+        self.address.custom_value_data = {"char_value": "Char value"}
+        self.address.save()
+        AddressFactory()
+
+        self.assertEqual(
+            [self.address],
+            list(Address.objects.filter(custom_value_data__char_value="Char value")),
+        )
+
+    def test_custom_field_storage_bulk_create_and_update(self) -> None:
+        addresses = Address.objects.bulk_create_with_custom_values(
+            [AddressFactory.build(target=None) for _ in range(2)],
+            [
+                {"char_value": "Char value", "choice_value": self.choice},
+                {"multiple_date_value": [date(2000, 1, 1)]},
+            ],
+        )
+        self.assertEqual(
+            {"char_value": "Char value"},
+            Address.objects.get(pk=addresses[0].pk).custom_value_data,
+        )
+        self.assertEqual(1, CustomValue.objects.count())
+
+        Address.objects.bulk_update_custom_values(
+            addresses, [{"char_value": None}, {"char_value": "Changed"}]
+        )
+        address_1 = Address.objects.get(pk=addresses[0].pk)
+        address_2 = Address.objects.get(pk=addresses[1].pk)
+        self.assertEqual({}, address_1.custom_value_data)
+        self.assertEqual("choice", address_1.choice_value["value"])
+        self.assertEqual("Changed", address_2.char_value)
+        self.assertEqual([date(2000, 1, 1)], address_2.multiple_date_value)
+
+    def test_custom_field_storage_serializer(self) -> None:
+        serializer = AddressSerializer(
+            data={
+                "city": "Bern",
+                "street": "Bundesplatz 3",
+                "char_value": "Char value",
+                "choice_value": self.choice.id,
+            }
+        )
+        serializer.is_valid(raise_exception=True)
+        address = serializer.save()
+        self.assertEqual({"char_value": "Char value"}, address.custom_value_data)
+
+        serializer = AddressSerializer(
+            address, data={"multiple_date_value": ["2000-01-01"]}, partial=True
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        address = Address.objects.get(pk=address.pk)
+        self.assertEqual(
+            {"char_value": "Char value", "multiple_date_value": ["2000-01-01"]},
+            address.custom_value_data,
+        )
+        self.assertNotIn("custom_value_data", AddressSerializer(address).data)
+        self.assertEqual("Char value", AddressSerializer(address).data["char_value"])
@@ -1,7 +1,11 @@
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from pluck import pluck
 
+from app.custom_field.models import CustomField
 from app.custom_field.tests.factories import CustomFieldFactory
+from app.custom_field.tests.factories import CustomValueFactory
 from app.models import Address
 from app.models import Person
 from app.tests import APITestCase
@@ -49,3 +53,34 @@ class CustomFieldViewSetTest(APITestCase):
 
         data = response.json()
         self.assertEqual(0, len(data))
+
+    def test_custom_field_viewset_prefetches_choices(self) -> None:
+        def list_custom_fields() -> int:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get("/api/custom_field?model=Person")
+            self.assertEqual(200, response.status_code)
+            return len(context)
+
+        person_ct = ContentType.objects.get_for_model(Person)
+        field = CustomFieldFactory(
+            identifier="integer_choice",
+            content_type=person_ct,
+            choice_field=True,
+            field_type=CustomField.FIELD_TYPES.INTEGER,
+        )
+        CustomValueFactory(field=field, value=1)
+        count = list_custom_fields()
+
+        for i in range(10):
+            field = CustomFieldFactory(
+                identifier=f"choice_{i}", content_type=person_ct, choice_field=True
+            )
+            CustomValueFactory(field=field, value=f"choice_{i}")
+        # The values of the objects are not included in the choices
+        CustomValueFactory(field=self.cs1, value="value")
+
+        self.assertEqual(count, list_custom_fields())
+        data = self.client.get("/api/custom_field?model=Person").json()
+        self.assertEqual([], data[0]["choices"])
+        self.assertEqual(1, data[1]["choices"][0]["value"])
+        self.assertEqual("choice_0", data[2]["choices"][0]["value"])
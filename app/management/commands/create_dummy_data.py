@@ -5,13 +5,14 @@ from django.contrib.contenttypes.models import ContentType
 from django.core.management import BaseCommand
 
 from app.custom_field.models import CustomField
-from app.custom_field.models import CustomValue
 from app.models import Person
+from django_features.custom_fields.registry import custom_field_registry
 
 
 class Command(BaseCommand):
     NUMBER_OF_CUSTOM_FIELDS = 100
     NUMBER_OF_OBJECTS = 1000
+    BATCH_SIZE = 5000
 
     def _value_for_type(self, field_type: str) -> Any:
         match field_type:
@@ -30,15 +31,11 @@ class Command(BaseCommand):
 
     def handle(self, *args: Any, **options: Any) -> None:
         custom_fields = []
-        custom_values = []
         objects = []
+        values_by_obj = []
 
         field_type = 0
         person_c = ContentType.objects.get_for_model(Person)
-        print("Add objects")
-        for i in range(self.NUMBER_OF_OBJECTS):
-            objects.append(Person(firstname=f"Firstname {i}", lastname=f"Lastname {i}"))
-
         print("Add custom fields")
         for i in range(self.NUMBER_OF_CUSTOM_FIELDS):
             custom_fields.append(
@@ -52,24 +49,20 @@ class Command(BaseCommand):
             field_type = (
                 field_type + 1 if field_type < len(CustomField.TYPE_CHOICES) - 1 else 0
             )
+        CustomField.objects.bulk_create(custom_fields)
+        custom_field_registry.bump()
 
-        print("Add custom values")
+        print("Add objects with custom values")
         for i in range(self.NUMBER_OF_OBJECTS):
-            for c in range(self.NUMBER_OF_CUSTOM_FIELDS):
-                field = custom_fields[c]
-                custom_values.append(
-                    CustomValue(
-                        field=field, value=self._value_for_type(field.field_type)
-                    )
-                )
+            objects.append(Person(firstname=f"Firstname {i}", lastname=f"Lastname {i}"))
+            values_by_obj.append(
+                {
+                    field.identifier: self._value_for_type(field.field_type)
+                    for field in custom_fields
+                }
+            )
 
         print("Execute bulk create")
-        CustomField.objects.bulk_create(custom_fields)
-        CustomValue.objects.bulk_create(custom_values)
-        Person.objects.bulk_create(objects)
-
-        print("Set many2many relations")
-        for i in range(self.NUMBER_OF_OBJECTS):
-            for c in range(self.NUMBER_OF_CUSTOM_FIELDS):
-                field = custom_fields[c]
-                objects[i].custom_values.add(CustomValue.objects.filter(field=field)[i])
+        Person.objects.bulk_create_with_custom_values(
+            objects, values_by_obj, batch_size=self.BATCH_SIZE
+        )
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.23 on 2026-10-18 11:26
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0007_inherit_from_custom_base_model"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="address",
+            name="custom_value_data",
+            field=models.JSONField(
+                blank=True, default=dict, verbose_name="custom value data"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="address",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["custom_value_data"], name="app_address_custom__557727_gin"
+            ),
+        ),
+    ]
@@ -1,16 +1,22 @@
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
 from app.custom_field.models.base import CustomBaseModel
 
 
 class Address(CustomBaseModel):
+    _custom_values_storage_field = "custom_value_data"
+
     city = models.CharField(verbose_name="city", blank=True)
     country = models.CharField(verbose_name="country", blank=True)
     street = models.CharField(verbose_name="street", blank=True)
     external_uid = models.UUIDField(verbose_name="external uid", null=True)
     zip_code = models.CharField(verbose_name="postal code", blank=True)
+    custom_value_data = models.JSONField(
+        verbose_name="custom value data", default=dict, blank=True
+    )
 
     target = GenericForeignKey("target_type", "target_id")
     target_type = models.ForeignKey(
@@ -21,6 +27,7 @@ class Address(CustomBaseModel):
     class Meta:
         verbose_name = "Address"
         verbose_name_plural = "Addresses"
+        indexes = [GinIndex(fields=["custom_value_data"])]
 
     def __str__(self) -> str:
         return f"{self.street} {self.zip_code} {self.city}".strip()
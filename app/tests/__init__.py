@@ -1,6 +1,7 @@
 from typing import Any
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TransactionTestCase
 from rest_framework.test import APIClient
 
@@ -23,6 +24,7 @@ class APITestCase(TransactionTestCase):
     def tearDown(self) -> None:
         super().tearDown()
         clear_custom_field_model_cache()
+        cache.clear()
 
     def get_or_create_user(self, username: str) -> tuple[Any, bool]:
         user, created = User.objects.get_or_create(username=username)
@@ -0,0 +1,55 @@
+import datetime
+
+import pytz
+from django.core.management import call_command
+from django.core.management import CommandError
+from freezegun import freeze_time
+
+from app.tests import APITestCase
+from django_features.system_message.factories import SystemMessageFactory
+from django_features.system_message.factories import SystemMessageTypeFactory
+from django_features.system_message.models import SystemMessage
+
+
+class PurgeSystemMessageDismissalsTest(APITestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        message_type = SystemMessageTypeFactory()
+        self.expired = SystemMessageFactory(
+            title="expired",
+            type=message_type,
+            end=datetime.datetime(2025, 1, 1, tzinfo=pytz.UTC),
+        )
+        self.recent = SystemMessageFactory(
+            title="recent",
+            type=message_type,
+            end=datetime.datetime(2025, 3, 1, tzinfo=pytz.UTC),
+        )
+        self.open = SystemMessageFactory(title="open", type=message_type)
+        users = [self.get_or_create_user(f"user{i}")[0] for i in range(5)]
+        for message in (self.expired, self.recent, self.open):
+            message.dismissed_users.add(*users)
+
+    @freeze_time(datetime.datetime(2025, 3, 15, tzinfo=pytz.UTC))
+    def test_purge_system_message_dismissals(self) -> None:
+        call_command("purge_system_message_dismissals", "--chunk-size=2")
+
+        self.assertEqual(0, self.expired.dismissed_users.count())
+        self.assertEqual(5, self.recent.dismissed_users.count())
+        self.assertEqual(5, self.open.dismissed_users.count())
+        self.assertEqual(3, SystemMessage.objects.count())
+
+    @freeze_time(datetime.datetime(2025, 3, 15, tzinfo=pytz.UTC))
+    def test_purge_system_message_dismissals_and_messages(self) -> None:
+        call_command(
+            "purge_system_message_dismissals", "--days=10", "--delete-messages"
+        )
+
+        self.assertEqual([self.open], list(SystemMessage.objects.all()))
+        self.assertEqual(5, self.open.dismissed_users.count())
+
+    def test_purge_system_message_dismissals_invalid_chunk_size(self) -> None:
+        with self.assertRaises(CommandError):
+            call_command("purge_system_message_dismissals", "--chunk-size=0")
+
+        self.assertEqual(5, self.expired.dismissed_users.count())
@@ -0,0 +1,71 @@
+import datetime
+
+import pytz
+
+from app.tests import APITestCase
+from django_features.system_message.factories import SystemMessageFactory
+from django_features.system_message.factories import SystemMessageTypeFactory
+from django_features.system_message.models import SystemMessage
+
+
+class SystemMessageQuerySetTest(APITestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        message_type = SystemMessageTypeFactory()
+        self.past = SystemMessageFactory(
+            title="past",
+            type=message_type,
+            begin=datetime.datetime(2024, 1, 1, tzinfo=pytz.UTC),
+            end=datetime.datetime(2024, 12, 31, tzinfo=pytz.UTC),
+        )
+        self.ending = SystemMessageFactory(
+            title="ending",
+            type=message_type,
+            begin=datetime.datetime(2025, 1, 1, tzinfo=pytz.UTC),
+            end=datetime.datetime(2025, 2, 1, tzinfo=pytz.UTC),
+        )
+        self.open = SystemMessageFactory(
+            title="open",
+            type=message_type,
+            begin=datetime.datetime(2025, 1, 1, tzinfo=pytz.UTC),
+        )
+        self.future = SystemMessageFactory(
+            title="future",
+            type=message_type,
+            begin=datetime.datetime(2025, 3, 1, tzinfo=pytz.UTC),
+        )
+
+    def test_system_message_active_at(self) -> None:
+        ts = datetime.datetime(2025, 1, 15, tzinfo=pytz.UTC)
+        self.assertEqual(
+            {self.ending, self.open}, set(SystemMessage.objects.active_at(ts))
+        )
+        self.assertEqual(
+            {self.past, self.future}, set(SystemMessage.objects.inactive_at(ts))
+        )
+        # The end is inclusive
+        self.assertIn(
+            self.ending,
+            SystemMessage.objects.active_at(
+                datetime.datetime(2025, 2, 1, tzinfo=pytz.UTC)
+            ),
+        )
+
+    def test_system_message_next_transition_after(self) -> None:
+        self.assertEqual(
+            datetime.datetime(2025, 2, 1, tzinfo=pytz.UTC),
+            SystemMessage.objects.next_transition_after(
+                datetime.datetime(2025, 1, 15, tzinfo=pytz.UTC)
+            ),
+        )
+        self.assertEqual(
+            datetime.datetime(2025, 3, 1, tzinfo=pytz.UTC),
+            SystemMessage.objects.next_transition_after(
+                datetime.datetime(2025, 2, 2, tzinfo=pytz.UTC)
+            ),
+        )
+        self.assertIsNone(
+            SystemMessage.objects.next_transition_after(
+                datetime.datetime(2025, 3, 1, tzinfo=pytz.UTC)
+            )
+        )
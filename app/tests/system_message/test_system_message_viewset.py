@@ -3,6 +3,8 @@ import datetime
 import pytz
 from constance.test import override_config
 from django.contrib.auth.models import Permission
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from freezegun import freeze_time
 from pluck import pluck
 
@@ -95,3 +97,113 @@ class SystemInfoViewSetTest(APITestCase):
 
         response = self.client.post("/api/system_message", data)
         self.assertEqual(201, response.status_code)
+
+    @override_config(ENABLE_SYSTEM_MESSAGE=True)
+    def test_active_system_messages_are_cached(self) -> None:
+        SystemMessageFactory(
+            title="active",
+            begin=datetime.datetime(2025, 1, 1, 0, 0, 0, tzinfo=pytz.UTC),
+        )
+
+        with freeze_time(datetime.datetime(2025, 1, 1, 0, 0, 0, tzinfo=pytz.UTC)):
+            response = self.client.get("/api/system_message/active")
+            self.assertEqual(["active"], pluck(response.json(), "title"))
+            etag = response["ETag"]
+
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(
+                    "/api/system_message/active", HTTP_IF_NONE_MATCH=etag
+                )
+            self.assertEqual(304, response.status_code)
+            # Only the session, the user and the config are loaded.
+            self.assertFalse([q for q in queries if "system_message_" in q["sql"]])
+            self.assertEqual(etag, response["ETag"])
+
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get("/api/system_message/active")
+            self.assertEqual(["active"], pluck(response.json(), "title"))
+            self.assertFalse([q for q in queries if "system_message_" in q["sql"]])
+
+            SystemMessageFactory(
+                title="new",
+                begin=datetime.datetime(2024, 1, 1, 0, 0, 0, tzinfo=pytz.UTC),
+            )
+            response = self.client.get(
+                "/api/system_message/active", HTTP_IF_NONE_MATCH=etag
+            )
+            self.assertEqual(200, response.status_code)
+            self.assertEqual(["new", "active"], pluck(response.json(), "title"))
+            self.assertNotEqual(etag, response["ETag"])
+
+    @override_config(ENABLE_SYSTEM_MESSAGE=True)
+    def test_active_system_messages_change_at_transitions(self) -> None:
+        SystemMessageFactory(
+            title="ending",
+            begin=datetime.datetime(2025, 1, 1, 0, 0, 0, tzinfo=pytz.UTC),
+            end=datetime.datetime(2025, 1, 1, 12, 0, 0, tzinfo=pytz.UTC),
+        )
+        SystemMessageFactory(
+            title="beginning",
+            begin=datetime.datetime(2025, 1, 2, 0, 0, 0, tzinfo=pytz.UTC),
+        )
+
+        with freeze_time(datetime.datetime(2025, 1, 1, 6, 0, 0, tzinfo=pytz.UTC)):
+            response = self.client.get("/api/system_message/active")
+        self.assertEqual(["ending"], pluck(response.json(), "title"))
+
+        with freeze_time(datetime.datetime(2025, 1, 1, 12, 0, 0, tzinfo=pytz.UTC)):
+            response = self.client.get("/api/system_message/active")
+        self.assertEqual(["ending"], pluck(response.json(), "title"))
+
+        with freeze_time(datetime.datetime(2025, 1, 1, 12, 0, 1, tzinfo=pytz.UTC)):
+            response = self.client.get("/api/system_message/active")
+        self.assertEqual([], response.json())
+
+        with freeze_time(datetime.datetime(2025, 1, 2, 0, 0, 0, tzinfo=pytz.UTC)):
+            response = self.client.get("/api/system_message/active")
+        self.assertEqual(["beginning"], pluck(response.json(), "title"))
+
+    @override_config(ENABLE_SYSTEM_MESSAGE=True)
+    def test_system_message_is_dismissed(self) -> None:
+        message_type = SystemMessageTypeFactory()
+        info_1 = SystemMessageFactory(title="dismissed", type=message_type)
+        SystemMessageFactory(title="not", type=message_type)
+        SystemMessageFactory(title="other", type=message_type)
+        info_1.dismissed_users.add(self.user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/system_message")
+        self.assertEqual(
+            1, len([q for q in queries if "system_message_systemmessage" in q["sql"]])
+        )
+        data = response.json()
+        self.assertEqual(
+            {"dismissed": True, "not": False, "other": False},
+            {item["title"]: item["is_dismissed"] for item in data},
+        )
+
+    @override_config(ENABLE_SYSTEM_MESSAGE=True)
+    def test_system_message_dismiss_many(self) -> None:
+        info_1 = SystemMessageFactory(title="1")
+        info_2 = SystemMessageFactory(title="2", type=info_1.type)
+        info_3 = SystemMessageFactory(title="3", type=info_1.type)
+        info_1.dismissed_users.add(self.user)
+
+        response = self.client.patch(
+            "/api/system_message/dismiss",
+            {"ids": [info_1.id, info_2.id, 999]},
+            format="json",
+        )
+        self.assertEqual(204, response.status_code)
+        self.assertEqual(
+            [info_1, info_2], list(self.user.dismissed_system_messages.order_by("id"))
+        )
+
+        response = self.client.patch(f"/api/system_message/{info_3.id}/dismiss")
+        self.assertEqual(204, response.status_code)
+        self.assertEqual(3, self.user.dismissed_system_messages.count())
+
+        response = self.client.patch(
+            "/api/system_message/dismiss", {"ids": []}, format="json"
+        )
+        self.assertEqual(400, response.status_code)
@@ -1,9 +1,14 @@
 from datetime import date
 from datetime import datetime
 from datetime import timezone
+from functools import partial
+from typing import Iterator
 
 from constance.test import override_config
 from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import MultipleObjectsReturned
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.exceptions import ErrorDetail
 from rest_framework.exceptions import ValidationError
 
@@ -11,6 +16,7 @@ from app.custom_field.models import CustomField
 from app.custom_field.models import CustomValue
 from app.custom_field.tests.factories import CustomFieldFactory
 from app.custom_field.tests.factories import CustomValueFactory
+from app.models import Address
 from app.models import ElectionDistrict
 from app.models import Municipality
 from app.models import Person
@@ -19,6 +25,10 @@ from app.tests import APITestCase
 from app.tests.factories import AddressFactory
 from app.tests.factories import ElectionDistrictFactory
 from app.tests.factories import PersonFactory
+from django_features.fields import RelatedField
+from django_features.fields import RelatedLookupCache
+from django_features.serializers import _compile_mapping_plan
+from django_features.serializers import NestedMappingSerializer
 
 
 MODEL_MAPPING_FIELD = {
@@ -302,6 +312,153 @@ class MappingSerializerTestCase(APITestCase):
         self.assertEqual(hugo, hugo.addresses.first().target)
         self.assertEqual(stefanie, stefanie.addresses.last().target)
 
+    @override_config(MODEL_MAPPING_FIELD=MODEL_MAPPING_FIELD)
+    def test_list_mapping_serializer_related_lookups(self) -> None:
+        koeniz = ElectionDistrictFactory(title="Koeniz")
+        muri = ElectionDistrictFactory(title="Muri")
+
+        data = [
+            {
+                "external_firstname": firstname,
+                "external_lastname": "Muster",
+                "external_election_district_title": title,
+                "external_addresses": [address.external_uid],
+            }
+            for firstname, title, address in [
+                ("Hugo", "Koeniz", self.address_1),
+                ("Stefanie", "Muri", self.address_2),
+                ("Hans", "Koeniz", self.address_3),
+            ]
+        ]
+
+        serializer = PersonMappingSerializer(data=data, many=True)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertTrue(serializer.is_valid(raise_exception=True))
+
+        # The related objects of all items are loaded with one query per related model
+        self.assertEqual(
+            [1, 1],
+            [
+                len([q for q in queries if f'FROM "{table}"' in q["sql"]])
+                for table in ["app_electiondistrict", "app_address"]
+            ],
+        )
+        self.assertEqual(
+            [koeniz, muri, koeniz],
+            [item["election_district"] for item in serializer.validated_data],
+        )
+        self.assertEqual(
+            [[self.address_1], [self.address_2], [self.address_3]],
+            [item["addresses"] for item in serializer.validated_data],
+        )
+
+    @override_config(MODEL_MAPPING_FIELD=MODEL_MAPPING_FIELD)
+    def test_list_mapping_serializer_bulk_create(self) -> None:
+        class BulkPersonMappingSerializer(PersonMappingSerializer):
+            _bulk_create = True
+
+        koeniz = ElectionDistrictFactory(title="Koeniz")
+        data = [
+            {
+                "external_firstname": "Hugo",
+                "external_lastname": "Boss",
+                "external_char_field": "Some char value",
+                "external_choice_field": "2000-01-01",
+                "external_municipality_title": "Muri",
+                "external_election_district_title": "Koeniz",
+                "external_addresses": [
+                    self.address_1.external_uid,
+                    self.address_2.external_uid,
+                ],
+            },
+            {
+                "external_firstname": "Stefanie",
+                "external_lastname": "Muster",
+                "external_municipality_title": "Bern",
+                "external_addresses": [self.address_3.external_uid],
+            },
+            {"external_firstname": "Hans", "external_lastname": "Muster"},
+        ]
+
+        serializer = BulkPersonMappingSerializer(data=data, many=True)
+        self.assertTrue(serializer.is_valid(raise_exception=True))
+        with CaptureQueriesContext(connection) as queries:
+            hugo, stefanie, hans = serializer.save()
+
+        # One insert of the municipalities, the persons, the custom values and the choices,
+        # and one update of the addresses
+        self.assertEqual(
+            5,
+            len(
+                [
+                    q
+                    for q in queries
+                    if q["sql"].startswith(("INSERT", "UPDATE", "SELECT"))
+                ]
+            ),
+        )
+        self.assertEqual(
+            {"Bern", "Muri"}, set(Municipality.objects.values_list("title", flat=True))
+        )
+        hugo = Person.objects.get(pk=hugo.pk)
+        self.assertEqual("Muri", hugo.place_of_residence.title)
+        self.assertEqual(koeniz, hugo.election_district)
+        self.assertEqual("Some char value", hugo.char_value)
+        self.assertEqual(self.choice_1.id, hugo.choice_value["id"])
+        self.assertEqual(
+            "Bern", Person.objects.get(pk=stefanie.pk).place_of_residence.title
+        )
+        self.assertIsNone(Person.objects.get(pk=hans.pk).place_of_residence)
+        self.assertEqual({self.address_1, self.address_2}, set(hugo.addresses.all()))
+        self.assertEqual([self.address_3], list(stefanie.addresses.all()))
+
+    def test_related_lookup_cache_multiple_objects(self) -> None:
+        AddressFactory(city="Bern")
+        AddressFactory(city="Bern")
+        field = RelatedField(
+            field=Person._meta.get_field("addresses"),
+            queryset=Address.objects.all(),
+            related_field_name="city",
+        )
+
+        with self.assertRaises(MultipleObjectsReturned):
+            RelatedLookupCache().get(field, "Bern")
+        with self.assertRaises(ValidationError):
+            field.to_internal_value("Bern")
+
+    def test_nested_mapping_serializer_for_model(self) -> None:
+        serializer_class = NestedMappingSerializer.for_model(Municipality)
+        self.assertIs(serializer_class, NestedMappingSerializer.for_model(Municipality))
+        self.assertIs(Municipality, serializer_class.Meta.model)
+
+        serializer = NestedMappingSerializer(
+            exclude=[],
+            field=Person._meta.get_field("election_district"),
+            nested_fields=["title"],
+            parent_mapping=MODEL_MAPPING_FIELD,
+        )
+        self.assertIsInstance(serializer, NestedMappingSerializer)
+        self.assertIs(ElectionDistrict, serializer.model)
+        # The Meta class of the base class isn't changed
+        self.assertIsNone(NestedMappingSerializer.Meta.model)
+        self.assertIs(Municipality, serializer_class.Meta.model)
+
+    def test_related_lookup_cache_drops_least_recently_used_objects(self) -> None:
+        koeniz = ElectionDistrictFactory(title="Koeniz")
+        muri = ElectionDistrictFactory(title="Muri")
+        field = RelatedField(
+            queryset=ElectionDistrict.objects.all(), related_field_name="title"
+        )
+        cache = RelatedLookupCache(max_size=1)
+
+        cache.load(field, ["Koeniz", "Muri"])
+        with self.assertNumQueries(0):
+            self.assertEqual(muri, cache.get(field, "Muri"))
+        with self.assertNumQueries(1):
+            self.assertEqual(koeniz, cache.get(field, "Koeniz"))
+        with self.assertNumQueries(1):
+            self.assertIsNone(cache.get(field, "Bern"))
+
     @override_config(MODEL_MAPPING_FIELD=MODEL_MAPPING_FIELD)
     def test_list_mapping_serializer_validation_error(self) -> None:
         data = [
@@ -334,3 +491,75 @@ class MappingSerializerTestCase(APITestCase):
                 },
             ],
         )
+
+    @override_config(MODEL_MAPPING_FIELD=MODEL_MAPPING_FIELD)
+    def test_mapping_serializer_import_data(self) -> None:
+        def records() -> Iterator[dict[str, str]]:
+            yield {"external_firstname": "Hugo", "external_lastname": "Boss"}
+            yield {"external_lastname": "Muster"}
+            yield {"external_firstname": "Stefanie", "external_lastname": "Muster"}
+
+        chunks = PersonMappingSerializer.import_data(records(), chunk_size=2)
+
+        chunk = next(chunks)
+        self.assertEqual(0, chunk.number)
+        self.assertEqual(1, chunk.saved)
+        self.assertEqual(
+            {
+                1: {
+                    "firstname": [
+                        ErrorDetail(
+                            string="Dieses Feld ist zwingend erforderlich.",
+                            code="required",
+                        )
+                    ]
+                }
+            },
+            chunk.errors,
+        )
+        # The first chunk is saved before the next chunk is read
+        self.assertTrue(Person.objects.filter(firstname="Hugo").exists())
+        self.assertFalse(Person.objects.filter(firstname="Stefanie").exists())
+
+        chunk = next(chunks)
+        self.assertEqual((1, 1, {}), chunk)
+        self.assertEqual([], list(chunks))
+        self.assertTrue(Person.objects.filter(firstname="Stefanie").exists())
+
+    @override_config(MODEL_MAPPING_FIELD=MODEL_MAPPING_FIELD)
+    def test_mapping_serializer_mapping_plan(self) -> None:
+        class HookedPersonMappingSerializer(PersonMappingSerializer):
+            def format_firstname(self, value: str | None) -> str | None:
+                return value.upper() if value else value
+
+            # Callables without a descriptor are hooks as well
+            format_lastname = partial(lambda value: value and value.lower())
+
+        serializer = HookedPersonMappingSerializer(
+            data={"external_firstname": "Hugo", "external_lastname": "Boss"}
+        )
+        self.assertEqual(
+            {"firstname": "HUGO", "lastname": "boss"}, serializer.initial_data
+        )
+
+        # The mapping is compiled once and reused by other instances, the hooks are bound once per instance
+        other = HookedPersonMappingSerializer(data={})
+        self.assertIs(serializer.mapping_plan, serializer.mapping_plan)
+        entry, other_entry = serializer.mapping_plan[-1], other.mapping_plan[-1]
+        self.assertIs(entry.external_path, other_entry.external_path)
+        self.assertEqual(("external_addresses",), entry.external_path)
+        self.assertEqual(("addresses",), entry.internal_path)
+        self.assertEqual(
+            serializer.format_firstname, serializer.mapping_plan[0].format_func
+        )
+
+        # Another mapping is compiled separately, both plans stay cached
+        other_mapping = {"app.person": {"name": "firstname"}}
+        with override_config(MODEL_MAPPING_FIELD=other_mapping):
+            serializer = HookedPersonMappingSerializer(data={"name": "Hans"})
+            self.assertEqual({"firstname": "HANS"}, serializer.initial_data)
+        misses = _compile_mapping_plan.cache_info().misses
+        for mapping in (other_mapping, MODEL_MAPPING_FIELD):
+            with override_config(MODEL_MAPPING_FIELD=mapping):
+                HookedPersonMappingSerializer(data={}).mapping_plan
+        self.assertEqual(misses, _compile_mapping_plan.cache_info().misses)
@@ -0,0 +1,150 @@
+import datetime
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+from django.db.models import F
+from pytz import UTC
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework.test import force_authenticate
+
+from app.tests import APITestCase
+from django_features.custom_fields.viewsets import CustomFieldViewSet
+from django_features.pagination import CursorPaginator
+from django_features.pagination import get_estimated_count
+from django_features.system_message.factories import SystemMessageFactory
+from django_features.system_message.factories import SystemMessageTypeFactory
+from django_features.system_message.models import SystemMessage
+
+
+class CursorPaginatorTest(APITestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        message_type = SystemMessageTypeFactory()
+        # The end is nullable and the order has duplicates, so the positions must handle both.
+        self.messages = [
+            SystemMessageFactory(
+                type=message_type,
+                title=f"Message {i}",
+                order=i % 3,
+                end=(
+                    None
+                    if i % 2
+                    else datetime.datetime(2025, 1, 1, 0, 0, 0, i, tzinfo=UTC)
+                ),
+            )
+            for i in range(10)
+        ]
+
+    def paginate(
+        self, queryset: object, params: dict, paginator: CursorPaginator | None = None
+    ) -> tuple[list, CursorPaginator]:
+        paginator = paginator or CursorPaginator()
+        request = Request(APIRequestFactory().get("/api/system_message", params))
+        return paginator.paginate_queryset(queryset, request), paginator
+
+    def get_cursor(self, link: str) -> str:
+        return parse_qs(urlparse(link).query)["cursor"][0]
+
+    def paginate_all(self, queryset: object, page_size: int) -> list:
+        results, paginator = self.paginate(queryset, {"page_size": page_size})
+        pages = [results]
+        while paginator.get_next_link():
+            results, paginator = self.paginate(
+                queryset,
+                {
+                    "page_size": page_size,
+                    "cursor": self.get_cursor(paginator.get_next_link()),
+                },
+            )
+            pages.append(results)
+        return pages
+
+    def test_cursor_paginator_without_page_size(self) -> None:
+        results, paginator = self.paginate(SystemMessage.objects.all(), {})
+        self.assertIsNone(results)
+
+    def test_cursor_paginator_model_ordering(self) -> None:
+        queryset = SystemMessage.objects.all()
+        pages = self.paginate_all(queryset, 3)
+        self.assertEqual([3, 3, 3, 1], [len(page) for page in pages])
+        self.assertEqual(list(queryset), [obj for page in pages for obj in page])
+
+    def test_cursor_paginator_queryset_ordering(self) -> None:
+        for ordering in (
+            ["-end", "title"],
+            ["-order", "-pk"],
+            ["type__name", "-begin"],
+        ):
+            queryset = SystemMessage.objects.order_by(*ordering)
+            pages = self.paginate_all(queryset, 4)
+            self.assertEqual(
+                list(queryset.order_by(*ordering, "pk")),
+                [obj for page in pages for obj in page],
+                ordering,
+            )
+
+    def test_cursor_paginator_expression_ordering(self) -> None:
+        queryset = SystemMessage.objects.order_by(F("end").asc(nulls_first=True))
+        pages = self.paginate_all(queryset, 4)
+        self.assertEqual(
+            list(queryset.order_by(F("end").asc(nulls_first=True), "pk")),
+            [obj for page in pages for obj in page],
+        )
+
+    def test_cursor_paginator_previous_page(self) -> None:
+        queryset = SystemMessage.objects.all()
+        expected = list(queryset)
+        first, paginator = self.paginate(queryset, {"page_size": 4})
+        self.assertIsNone(paginator.get_previous_link())
+        second, paginator = self.paginate(
+            queryset,
+            {"page_size": 4, "cursor": self.get_cursor(paginator.get_next_link())},
+        )
+        self.assertEqual(expected[4:8], second)
+
+        previous, paginator = self.paginate(
+            queryset,
+            {"page_size": 4, "cursor": self.get_cursor(paginator.get_previous_link())},
+        )
+        self.assertEqual(expected[:4], previous)
+        self.assertIsNone(paginator.get_previous_link())
+        self.assertIsNotNone(paginator.get_next_link())
+
+    def test_cursor_paginator_constant_queries(self) -> None:
+        queryset = SystemMessage.objects.all()
+        results, paginator = self.paginate(queryset, {"page_size": 2})
+        cursor = self.get_cursor(paginator.get_next_link())
+        with self.assertNumQueries(1):
+            results, paginator = self.paginate(
+                queryset, {"page_size": 2, "cursor": cursor}
+            )
+        self.assertEqual(2, len(results))
+
+    def test_cursor_paginator_invalid_cursor(self) -> None:
+        with self.assertRaises(NotFound):
+            self.paginate(
+                SystemMessage.objects.all(), {"page_size": 2, "cursor": "invalid"}
+            )
+
+    def test_cursor_paginator_estimated_count(self) -> None:
+        paginator = CursorPaginator()
+        paginator.estimated_count = True
+        self.paginate(SystemMessage.objects.all(), {"page_size": 2}, paginator)
+        response = paginator.get_paginated_response([])
+        self.assertEqual(10, response.data["count"])
+
+        self.assertIsInstance(
+            get_estimated_count(SystemMessage.objects.filter(order=1)), int
+        )
+
+    def test_cursor_paginator_custom_field_viewset(self) -> None:
+        class CursorCustomFieldViewSet(CustomFieldViewSet):
+            pagination_class = CursorPaginator
+
+        request = APIRequestFactory().get("/api/custom_field", {"page_size": 1})
+        force_authenticate(request, self.get_or_create_user("kathi.barfuss")[0])
+        response = CursorCustomFieldViewSet.as_view({"get": "list"})(request)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(["next", "previous", "results"], list(response.data))
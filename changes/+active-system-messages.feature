@@ -0,0 +1 @@
+Add the cached `active` endpoint for system messages with ETag support.
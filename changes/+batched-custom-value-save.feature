@@ -0,0 +1 @@
+Save the custom values of an object with a constant number of statements.
@@ -0,0 +1 @@
+Update the custom values in the `CustomFieldBaseModelSerializer` with a constant number of statements and skip unchanged values.
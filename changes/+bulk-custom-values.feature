@@ -0,0 +1 @@
+Add `bulk_create_with_custom_values` and `bulk_update_custom_values` to the custom field manager.
@@ -0,0 +1 @@
+Create the objects of a `many=True` payload of the `CustomFieldBaseModelSerializer` with batched statements if `_bulk_create` is set.
@@ -0,0 +1 @@
+Add `_bulk_create` to mapping serializers to create list payloads and their nested objects with batched statements.
@@ -0,0 +1 @@
+Resolve the choices of a `many=True` payload with a choice lookup cache instead of one query per value.
@@ -0,0 +1 @@
+Add the `CursorPaginator` for keyset pagination with an optional estimated count.
@@ -0,0 +1 @@
+Add the `CustomFieldFilterSet` with typed filters for the filterable custom fields.
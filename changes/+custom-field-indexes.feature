@@ -0,0 +1 @@
+Add the `sync_custom_field_indexes` command to create typed expression indexes for the values of filterable custom fields.
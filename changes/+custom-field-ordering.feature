@@ -0,0 +1 @@
+Add the `CustomFieldOrderingFilter` to order by custom fields.
@@ -0,0 +1 @@
+Cache the custom field definitions per model in a process-local registry, which is invalidated by signals and a generation counter in the database.
@@ -0,0 +1 @@
+Add the `_custom_values_storage_field` option to store the values of non-choice custom fields in a JSON field of the model.
@@ -0,0 +1 @@
+Add an opt-in json aggregation mode to the `CustomFieldModelBaseManager`, which fetches all custom values of an object with a single subquery.
@@ -0,0 +1 @@
+Annotate custom fields only on request with `with_custom_fields()` and load them lazily on first access otherwise, for all objects of the result with one query.
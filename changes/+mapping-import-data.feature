@@ -0,0 +1 @@
+Add `MappingSerializer.import_data` to stream large imports in chunks with a transaction per chunk.
@@ -0,0 +1 @@
+Compile the model mapping of the mapping serializers once and reuse it for all records.
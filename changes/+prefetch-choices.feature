@@ -0,0 +1 @@
+Prefetch the choices of all custom fields in the `CustomFieldViewSet` with one query.
@@ -0,0 +1 @@
+Add the `purge_system_message_dismissals` command.
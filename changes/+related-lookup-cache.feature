@@ -0,0 +1 @@
+Resolve the relation fields of mapping list serializers and imports with a `RelatedLookupCache` instead of one query per value.
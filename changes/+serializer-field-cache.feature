@@ -0,0 +1 @@
+Cache the serializer fields of the custom fields in the `CustomFieldBaseModelSerializer` and deep-copy them per serializer.
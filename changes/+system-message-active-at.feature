@@ -0,0 +1 @@
+Add `active_at` and `next_transition_after` to the system message queryset, with an index on the end and begin.
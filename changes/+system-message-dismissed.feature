@@ -0,0 +1 @@
+Add the `is_dismissed` flag and the bulk dismiss action to the system messages.
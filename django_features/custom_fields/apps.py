@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class CustomFieldsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "django_features.custom_fields"
+
+    def ready(self) -> None:
+        from django_features.custom_fields.signals import connect_signals
+
+        connect_signals(self)
@@ -1,6 +1,7 @@
+from functools import lru_cache
 from typing import Any
+from typing import Iterable
 
-from django.core.exceptions import ObjectDoesNotExist
 from pluck import pluck
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
@@ -13,65 +14,164 @@ from django_features.custom_fields.models.value import CustomValueQuerySet
 from django_features.custom_fields.serializers import CustomChoiceSerializer
 
 
+@lru_cache(maxsize=1)
+def _get_valid_unique_fields() -> tuple[str, ...]:
+    return tuple(get_field_info(get_custom_value_model()).fields_and_pk)
+
+
+class ChoiceLookupCache:
+    """
+    Loads all choices of a custom field once and resolves them by their unique field in memory.
+    """
+
+    def __init__(self) -> None:
+        self._choices: dict[tuple[int, str], dict[str, AbstractBaseCustomValue]] = {}
+
+    def get_choices(
+        self, field: AbstractBaseCustomField, unique_field: str
+    ) -> dict[str, AbstractBaseCustomValue]:
+        key = (field.id, unique_field)
+        if key not in self._choices:
+            self._choices[key] = {}
+            self.add_choices(
+                field,
+                unique_field,
+                get_custom_value_model().objects.filter(field_id=field.id),
+            )
+        return self._choices[key]
+
+    def add_choices(
+        self,
+        field: AbstractBaseCustomField,
+        unique_field: str,
+        choices: Iterable[AbstractBaseCustomValue],
+    ) -> None:
+        cached_choices = self._choices.setdefault((field.id, unique_field), {})
+        for choice in choices:
+            value = getattr(choice, unique_field)
+            if value is not None:
+                cached_choices[str(value)] = choice
+
+    def clear(self) -> None:
+        self._choices = {}
+
+
 class ChoiceIdField(serializers.Field):
-    _unique_field: str | None = None
+    _unique_field: str = "id"
 
     def __init__(
         self,
         field: AbstractBaseCustomField,
         unique_field: str | None = None,
+        strict: bool = False,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
         self.field = field
         self.required = kwargs.get("required", self.field.required)
+        # Verify the choices resolved from the cache against the database.
+        self.strict = strict
         self.set_unique_field(unique_field)
 
+    def __deepcopy__(self, memo: dict) -> "ChoiceIdField":
+        # The custom field definition isn't changed by the serializer field, so the copies can share it.
+        memo[id(self.field)] = self.field
+        return super().__deepcopy__(memo)
+
     def set_unique_field(self, unique_field: str | None) -> None:
         self._unique_field = unique_field or "id"
 
-        valid_fields = get_field_info(get_custom_value_model()).fields_and_pk
+        valid_fields = _get_valid_unique_fields()
         if self._unique_field not in valid_fields:
             raise ValueError(
-                f"The unique_field must be a valid field of {valid_fields}: invalid field {self.unique_field}"
+                f"The unique_field must be a valid field of {valid_fields}: invalid field {self._unique_field}"
             )
 
     def get_queryset(self) -> CustomValueQuerySet:
         return get_custom_value_model().objects.filter(field_id=self.field.id)
 
+    @property
+    def choice_cache(self) -> ChoiceLookupCache:
+        """
+        The cache is shared by all fields of the root serializer, so a list serializer loads the choices only once.
+        """
+        cache = getattr(self.root, "_choice_lookup_cache", None)
+        if cache is None:
+            cache = ChoiceLookupCache()
+            self.root._choice_lookup_cache = cache
+        return cache
+
+    def _get_choices(self, values: list[Any]) -> dict[str, AbstractBaseCustomValue]:
+        """
+        In a list serializer, all choices of the field are loaded once and resolved in memory.
+        Otherwise, only the given choices are loaded.
+        """
+        cached = isinstance(self.root, serializers.ListSerializer)
+        choices = (
+            self.choice_cache.get_choices(self.field, self._unique_field)
+            if cached
+            else {}
+        )
+        missing = [value for value in values if str(value) not in choices]
+        if missing:
+            # In a list serializer, the choice may have been created after the cache was loaded.
+            self.choice_cache.add_choices(
+                self.field,
+                self._unique_field,
+                self.get_queryset().filter(**{f"{self._unique_field}__in": missing}),
+            )
+            choices = self.choice_cache.get_choices(self.field, self._unique_field)
+        found = {
+            str(value): choices[str(value)] for value in values if str(value) in choices
+        }
+        if self.strict and cached and found:
+            existing = set(
+                self.get_queryset()
+                .filter(pk__in=[choice.pk for choice in found.values()])
+                .values_list("pk", flat=True)
+            )
+            found = {
+                key: choice for key, choice in found.items() if choice.pk in existing
+            }
+        return found
+
     def to_representation(
         self, value: AbstractBaseCustomValue | CustomValueQuerySet
     ) -> int | list[int]:
-        return CustomChoiceSerializer(value, many=self.field.multiple).data
+        return CustomChoiceSerializer(
+            value, many=self.field.multiple, field=self.field
+        ).data
 
     def _choice_field(self, data: int | str | dict) -> AbstractBaseCustomValue:
         if isinstance(data, dict):
             value = data.get("id")
         else:
             value = data
-        try:
-            return self.get_queryset().get(**{self._unique_field: value})
-        except ObjectDoesNotExist:
+        choice = self._get_choices([value]).get(str(value))
+        if choice is None:
             raise ValidationError(
                 f"Custom value with the {self._unique_field} {data} does not exist."
             )
+        return choice
 
-    def _multiple_choice(self, data: list[int | str | dict]) -> CustomValueQuerySet:
+    def _multiple_choice(
+        self, data: list[int | str | dict]
+    ) -> list[AbstractBaseCustomValue]:
         if all(type(d) is dict for d in data):
             value = pluck(data, self._unique_field)
         else:
             value = data
-        values = self.get_queryset().filter(**{f"{self._unique_field}__in": value})
-        if values.count() != len(data):
-            missing = set(data) - set(values.values_list(self._unique_field, flat=True))
+        choices = self._get_choices(value)
+        missing = {v for v in value if str(v) not in choices}
+        if missing:
             raise ValidationError(
                 f"Some of the given {self._unique_field}s do not match: {missing}"
             )
-        return values
+        return list({str(v): choices[str(v)] for v in value}.values())
 
     def to_internal_value(
         self, data: Any
-    ) -> AbstractBaseCustomValue | CustomValueQuerySet:
+    ) -> AbstractBaseCustomValue | list[AbstractBaseCustomValue]:
         if self.field.multiple and isinstance(data, list):
             return self._multiple_choice(data)
         elif self.field.choice_field and isinstance(data, (int, str, dict)):
@@ -0,0 +1,130 @@
+__all__ = [
+    "CustomFieldFilterSet",
+    "CustomFieldOrderingFilter",
+    "custom_field_filterset_factory",
+]
+
+
+from typing import Any
+
+from django.db import models
+from django.db.models import QuerySet
+from django_filters import rest_framework as filters
+from django_filters.constants import EMPTY_VALUES
+from rest_framework.filters import OrderingFilter
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+from django_features.custom_fields.models.field import AbstractBaseCustomField
+from django_features.custom_fields.registry import custom_field_registry
+
+
+class CustomFieldFilterMixin:
+    """
+    Filters the queryset with 'filter_custom_field' of the CustomFieldModelQuerySet.
+    """
+
+    field_name: str
+    lookup_expr: str
+
+    def filter(self, qs: QuerySet, value: Any) -> QuerySet:
+        if value in EMPTY_VALUES:
+            return qs
+        return qs.filter_custom_field(self.field_name, value, lookup=self.lookup_expr)
+
+
+class CustomFieldFilterSet(filters.FilterSet):
+    """
+    Adds a filter for each lookup of all filterable custom fields of the model. The filters are named after the
+    identifier of the field and the lookup, e.g. 'birthday', 'birthday__range' or 'birthday__isnull'.
+    The custom fields can change at runtime, so the filters are created for each instance.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.filters.update(self.get_custom_field_filters())
+
+    def get_custom_field_lookups(self, field: AbstractBaseCustomField) -> list[str]:
+        if field.multiple:
+            return ["contains", "isnull"]
+        if field.choice_field:
+            return ["exact", "in", "isnull"]
+        if field.field_type == field.FIELD_TYPES.BOOLEAN:
+            return ["exact", "isnull"]
+        return ["exact", "in", "range", "isnull"]
+
+    def get_custom_field_filters(self) -> dict[str, filters.Filter]:
+        custom_filters = {}
+        for field in custom_field_registry.get_fields(self._meta.model):
+            if not field.filterable or field.identifier in self.filters:
+                continue
+            if field.choice_field:
+                # Choices are filtered by their id.
+                db_field: models.Field = models.IntegerField()
+            else:
+                db_field = field.TYPE_FIELD_MAP[field.field_type]()
+            for lookup in self.get_custom_field_lookups(field):
+                filter_class, params = self.filter_for_lookup(db_field, lookup)
+                custom_filter_class = type(
+                    f"CustomField{filter_class.__name__}",
+                    (CustomFieldFilterMixin, filter_class),
+                    {},
+                )
+                name = (
+                    field.identifier
+                    if lookup == "exact"
+                    else f"{field.identifier}__{lookup}"
+                )
+                custom_filter = custom_filter_class(
+                    field_name=field.identifier,
+                    lookup_expr=lookup,
+                    label=field.label,
+                    **params,
+                )
+                custom_filter.parent = self
+                custom_filters[name] = custom_filter
+        return custom_filters
+
+
+def custom_field_filterset_factory(
+    model: type[models.Model],
+    filterset: type[CustomFieldFilterSet] = CustomFieldFilterSet,
+    fields: list[str] | None = None,
+) -> type[CustomFieldFilterSet]:
+    """
+    Create a CustomFieldFilterSet for the given model, with the filters of the given model fields.
+    """
+    meta = type(
+        "Meta",
+        (getattr(filterset, "Meta", object),),
+        {"model": model, "fields": fields or []},
+    )
+    return type(f"{model.__name__}FilterSet", (filterset,), {"Meta": meta})
+
+
+class CustomFieldOrderingFilter(OrderingFilter):
+    """
+    Allows ordering by the custom fields of the model in addition to the ordering fields of the view.
+    Lists can't be ordered.
+    """
+
+    def get_valid_fields(
+        self,
+        queryset: QuerySet,
+        view: APIView,
+        context: dict[str, Any] | None = None,
+    ) -> list[tuple[str, str]]:
+        valid_fields = super().get_valid_fields(queryset, view, context or {})
+        field_names = {name for name, label in valid_fields}
+        for field in custom_field_registry.get_fields(queryset.model):
+            if not field.multiple and field.identifier not in field_names:
+                valid_fields.append((field.identifier, field.label))
+        return valid_fields
+
+    def filter_queryset(
+        self, request: Request, queryset: QuerySet, view: APIView
+    ) -> QuerySet:
+        ordering = self.get_ordering(request, queryset, view)
+        if ordering:
+            return queryset.order_by_custom_fields(*ordering)
+        return queryset
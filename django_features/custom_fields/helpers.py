@@ -65,7 +65,14 @@ def get_custom_value_model() -> type[AbstractBaseCustomValue]:
 
 def clear_custom_field_model_cache() -> None:
     """
-    Clear cached model lookups for custom fields.
+    Clear cached model lookups and the cached field definitions for custom fields.
     """
+    from django_features.custom_fields.fields import _get_valid_unique_fields
+    from django_features.custom_fields.registry import custom_field_registry
+    from django_features.custom_fields.serializers import clear_serializer_field_cache
+
     get_custom_field_model.cache_clear()
     get_custom_value_model.cache_clear()
+    _get_valid_unique_fields.cache_clear()
+    custom_field_registry.invalidate()
+    clear_serializer_field_cache()
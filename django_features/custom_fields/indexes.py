@@ -0,0 +1,138 @@
+__all__ = [
+    "CustomValueExpression",
+    "create_custom_field_sql_functions",
+    "get_custom_field_index_name",
+    "sync_custom_field_indexes",
+]
+
+
+from typing import Any
+
+from django.db import connections
+from django.db import DEFAULT_DB_ALIAS
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import F
+from django.db.models import Func
+
+from django_features.custom_fields.helpers import get_custom_field_model
+from django_features.custom_fields.helpers import get_custom_value_model
+from django_features.custom_fields.models.field import AbstractBaseCustomField
+
+
+INDEX_PREFIX = "custom_value_"
+
+# Casting text to a date or a timestamp isn't immutable, so it can't be used in an index expression.
+# These functions are declared immutable, which is safe for the ISO formats the custom values are stored with.
+SQL_FUNCTIONS = {
+    "char": "text",
+    "text": "text",
+    "date": "date",
+    "datetime": "timestamptz",
+    "integer": "integer",
+    "boolean": "boolean",
+}
+
+
+def _get_function_name(sql_field: str) -> str:
+    return f"custom_field_{sql_field}"
+
+
+def create_custom_field_sql_functions(connection: BaseDatabaseWrapper) -> None:
+    """
+    Create the functions which cast a custom value into the type of its field.
+    """
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        for sql_field, sql_type in SQL_FUNCTIONS.items():
+            cursor.execute(
+                f"CREATE OR REPLACE FUNCTION {_get_function_name(sql_field)}(jsonb) "
+                f"RETURNS {sql_type} AS $$ SELECT ($1 #>> '{{}}')::{sql_type} $$ "
+                "LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE"
+            )
+
+
+class CustomValueExpression(Func):
+    """
+    Casts the value of a custom value into the type of its field, like the expression indexes of the filterable fields.
+    """
+
+    def __init__(
+        self, field: AbstractBaseCustomField, value: Any = "value", **extra: Any
+    ) -> None:
+        if isinstance(value, str):
+            value = F(value)
+        super().__init__(
+            value,
+            function=_get_function_name(field.sql_field),
+            output_field=get_custom_field_model().TYPE_FIELD_MAP[field.field_type](),
+            **extra,
+        )
+
+
+def get_custom_field_index_name(field: AbstractBaseCustomField) -> str:
+    suffix = "multiple" if field.multiple else field.sql_field
+    return f"{INDEX_PREFIX}{field.id}_{suffix}"
+
+
+def _get_index_sql(
+    connection: BaseDatabaseWrapper, field: AbstractBaseCustomField, concurrently: bool
+) -> str:
+    value_model = get_custom_value_model()
+    quote_name = connection.ops.quote_name
+    table = quote_name(value_model._meta.db_table)
+    value_column = quote_name(value_model._meta.get_field("value").column)
+    field_column = quote_name(value_model._meta.get_field("field").column)
+    if field.multiple:
+        # The lists are filtered with the contains lookup.
+        expression = f"USING gin ({value_column} jsonb_path_ops)"
+    else:
+        expression = f"({_get_function_name(field.sql_field)}({value_column}))"
+    return (
+        f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS "
+        f"{quote_name(get_custom_field_index_name(field))} ON {table} {expression} "
+        f"WHERE {field_column} = {int(field.id)}"
+    )
+
+
+def sync_custom_field_indexes(
+    using: str = DEFAULT_DB_ALIAS, concurrently: bool = False
+) -> tuple[list[str], list[str]]:
+    """
+    Create the partial expression indexes on the value table for all filterable fields and drop the indexes
+    of the fields which aren't filterable anymore. Returns the names of the created and the dropped indexes.
+    """
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return [], []
+
+    fields = {
+        get_custom_field_index_name(field): field
+        for field in get_custom_field_model()
+        .objects.using(using)
+        .filterable()
+        .filter(choice_field=False)
+    }
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT index.relname, pg_index.indisvalid FROM pg_index "
+            "JOIN pg_class index ON index.oid = pg_index.indexrelid "
+            "WHERE pg_index.indrelid = %s::regclass AND index.relname LIKE %s",
+            [get_custom_value_model()._meta.db_table, f"{INDEX_PREFIX}%"],
+        )
+        existing = dict(cursor.fetchall())
+        # A failed concurrent build leaves an invalid index behind, which is dropped and created again.
+        invalid = {name for name, valid in existing.items() if not valid}
+
+        created = sorted((set(fields) - set(existing)) | (invalid & set(fields)))
+        dropped = sorted((set(existing) - set(fields)) | invalid)
+        for name in dropped:
+            cursor.execute(
+                f"DROP INDEX {'CONCURRENTLY ' if concurrently else ''}IF EXISTS "
+                f"{connection.ops.quote_name(name)}"
+            )
+        if created:
+            create_custom_field_sql_functions(connection)
+        for name in created:
+            cursor.execute(_get_index_sql(connection, fields[name], concurrently))
+    return created, dropped
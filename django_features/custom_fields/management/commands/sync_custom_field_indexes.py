@@ -0,0 +1,37 @@
+from typing import Any
+
+import djclick as click
+from django.core.management import CommandParser
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+
+from django_features.custom_fields.indexes import sync_custom_field_indexes
+
+
+class Command(BaseCommand):
+    help = "Creates or drops the expression indexes of the filterable custom fields."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to synchronize the indexes on.",
+        )
+        parser.add_argument(
+            "--concurrently",
+            action="store_true",
+            help="Create and drop the indexes without locking the value table.",
+        )
+
+    def handle(
+        self, database: str, concurrently: bool, *args: Any, **options: Any
+    ) -> None:
+        created, dropped = sync_custom_field_indexes(
+            using=database, concurrently=concurrently
+        )
+        for name in created:
+            click.secho(f"INFO: Created index {name}", fg="green")
+        for name in dropped:
+            click.secho(f"INFO: Dropped index {name}", fg="yellow")
+        if not created and not dropped:
+            click.secho("INFO: Indexes are up to date", fg="green")
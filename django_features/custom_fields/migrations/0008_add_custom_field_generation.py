@@ -0,0 +1,38 @@
+# Generated by Django 4.2.23 on 2026-10-18 11:01
+
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("custom_fields", "0007_remove_custom_models"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CustomFieldGeneration",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "generation",
+                    models.PositiveBigIntegerField(
+                        default=0, verbose_name="Generation"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Generation der benutzerdefinierten Felder",
+                "verbose_name_plural": "Generationen der benutzerdefinierten Felder",
+            },
+        ),
+    ]
@@ -0,0 +1,4 @@
+__all__ = ["CustomFieldGeneration"]
+
+
+from .generation import CustomFieldGeneration
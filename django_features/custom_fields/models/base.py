@@ -1,26 +1,148 @@
+from collections import defaultdict
 from typing import Any
+from typing import Iterator
+from typing import Sequence
 
+import django
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.aggregates import JSONBAgg
 from django.contrib.postgres.expressions import ArraySubquery
 from django.db import IntegrityError
 from django.db import models
 from django.db import ProgrammingError
+from django.db import transaction
+from django.db.models import Exists
+from django.db.models import Expression
+from django.db.models import F
+from django.db.models import Lookup
 from django.db.models import OuterRef
 from django.db.models import Q
 from django.db.models import QuerySet
 from django.db.models import Subquery
+from django.db.models.expressions import Col
+from django.db.models.expressions import OrderBy
 from django.db.models.expressions import RawSQL
+from django.db.models.fields.json import KeyTransform
 from django.db.models.functions import Cast
 from django.db.models.functions import JSONObject
+from django.db.models.query import ModelIterable
+from django.db.models.sql.constants import LOUTER
+from django.db.models.sql.datastructures import Join
+from django.utils import timezone
 from django_extensions.db.models import TimeStampedModel
 
 from django_features.custom_fields.helpers import get_custom_field_model
 from django_features.custom_fields.helpers import get_custom_value_model
+from django_features.custom_fields.indexes import CustomValueExpression
 from django_features.custom_fields.models.field import AbstractBaseCustomField
 from django_features.custom_fields.models.field import CustomFieldQuerySet
 from django_features.custom_fields.models.value import AbstractBaseCustomValue
+from django_features.custom_fields.registry import custom_field_registry
 
 
-class CustomFieldModelBaseManager(models.Manager):
+# Django 5.1 renamed the ordering argument of the ordered aggregates.
+_AGG_ORDERING_KWARG = "order_by" if django.VERSION >= (5, 1) else "ordering"
+
+
+class CustomValueJoin(Join):
+    """
+    Left joins the values of one custom field as a derived table of the through table and the value table, which
+    is restricted to the field. A plain join of the relation would return an object once for each of its values.
+    """
+
+    def __init__(
+        self,
+        values: QuerySet,
+        field_id: int,
+        parent_alias: str,
+        table_alias: str | None = None,
+        join_type: str = LOUTER,
+    ) -> None:
+        self.values = values
+        self.field_id = field_id
+        self.table_name = f"custom_value_{field_id}"
+        self.parent_alias = parent_alias
+        self.table_alias = table_alias
+        self.join_type = join_type
+        self.join_cols = ()
+        self.join_field = None
+        self.nullable = True
+        self.filtered_relation = None
+
+    def as_sql(self, compiler: Any, connection: Any) -> tuple[str, list[Any]]:
+        sql, params = self.values.query.get_compiler(connection=connection).as_sql()
+        qn = compiler.quote_name_unless_alias
+        pk_column = connection.ops.quote_name(compiler.query.model._meta.pk.column)
+        return (
+            f"{self.join_type} ({sql}) {qn(self.table_alias)} "
+            f'ON ({qn(self.parent_alias)}.{pk_column} = {qn(self.table_alias)}."object_id")',
+            list(params),
+        )
+
+    def relabeled_clone(self, change_map: dict[str, str]) -> "CustomValueJoin":
+        return self.__class__(
+            self.values,
+            self.field_id,
+            change_map.get(self.parent_alias, self.parent_alias),
+            self.table_alias and change_map.get(self.table_alias, self.table_alias),
+            self.join_type,
+        )
+
+    @property
+    def identity(self) -> tuple[Any, ...]:
+        return self.__class__, self.table_name, self.parent_alias, self.field_id
+
+    def equals(self, other: Any) -> bool:
+        return self.identity == other.identity
+
+
+class CustomFieldModelIterable(ModelIterable):
+    """
+    Unpacks the aggregated custom values of the json aggregation mode into the custom field attributes
+    and marks the objects, so custom fields which are not annotated are loaded on first access. The objects
+    of a result, or of a chunk of an iterator, share a list, so the first access loads them for all of them.
+    """
+
+    def __iter__(self) -> Iterator[Any]:
+        custom_fields = self.queryset._json_custom_fields
+        storage_field = self.queryset.model._custom_values_storage_field
+        group: list[Any] = []
+        for obj in super().__iter__():
+            if self.chunked_fetch and len(group) >= self.chunk_size:
+                group = []
+            group.append(obj)
+            obj.__dict__["_custom_field_group"] = group
+            if custom_fields is not None:
+                obj._set_json_custom_values(
+                    custom_fields, obj.__dict__.pop("_custom_values_json", None)
+                )
+            if storage_field is not None:
+                obj._set_stored_custom_values()
+            obj.__dict__["_lazy_custom_fields"] = True
+            yield obj
+
+
+class CustomFieldModelQuerySet(models.QuerySet):
+    """
+    The custom fields are not annotated by default. Use 'with_custom_fields' to annotate them.
+    Custom fields which are not annotated are loaded lazily on first access of the attribute.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._iterable_class = CustomFieldModelIterable
+        self._json_aggregation = False
+        self._json_custom_fields: list[AbstractBaseCustomField] | None = None
+        self._custom_field_annotations: tuple[str, ...] = ()
+
+    def _clone(self) -> "CustomFieldModelQuerySet":
+        clone = super()._clone()
+        clone._json_aggregation = self._json_aggregation
+        clone._json_custom_fields = self._json_custom_fields
+        clone._custom_field_annotations = self._custom_field_annotations
+        return clone
+
     def get_type_model(self) -> "CustomFieldTypeBaseModel | None":
         if self.model._custom_field_type_attr is None or not hasattr(
             self.model, self.model._custom_field_type_attr
@@ -76,43 +198,454 @@ class CustomFieldModelBaseManager(models.Manager):
                 ).values_list("formated", flat=True)
             )
 
-    def get_queryset(self) -> QuerySet:
+    def _json_subquery(self, fields: list[AbstractBaseCustomField]) -> Subquery:
+        model_name = self.model._meta.model_name
+        ordering = {}
+        if get_custom_value_model()._meta.ordering:
+            ordering[_AGG_ORDERING_KWARG] = get_custom_value_model()._meta.ordering
+        return Subquery(
+            get_custom_value_model()
+            .objects.filter(
+                **{f"{model_name}__id": OuterRef("pk")},
+                field_id__in=[field.id for field in fields],
+            )
+            .order_by()
+            .values(f"{model_name}__id")
+            .annotate(
+                data=JSONBAgg(
+                    JSONObject(
+                        identifier="field__identifier",
+                        id="id",
+                        label="label",
+                        value="value",
+                    ),
+                    default=None,
+                    **ordering,
+                )
+            )
+            .values("data")
+        )
+
+    def with_custom_fields(
+        self, *identifiers: str, json_aggregation: bool | None = None
+    ) -> "CustomFieldModelQuerySet":
         """
-        We filter all available custom fields for the current model.
+        Annotate the custom fields with the given identifiers, or all available custom fields if none are given.
         """
-        try:
-            available_fields = get_custom_field_model().objects.for_model(self.model)
-
+        if json_aggregation is None:
+            json_aggregation = self._json_aggregation
+
+        available_fields = custom_field_registry.get_fields(self.model)
+        if identifiers:
+            available_fields = [
+                field for field in available_fields if field.identifier in identifiers
+            ]
+        if self.model._custom_values_storage_field is not None:
+            # The values of the other fields are read from the storage field by the CustomFieldModelIterable.
+            available_fields = [
+                field for field in available_fields if field.choice_field
+            ]
+
+        if json_aggregation:
             """
-            This for loop creates a dict with all available custom field values with a subquery for the specific object.
-            The dict key is the identifier of the custom field amd the value is the custom value.
-            If the object has no value for the field, it will return None.
-            More information can be found in the django documentation:
-            https://docs.djangoproject.com/en/5.2/ref/models/expressions/#subquery-expressions
+            All custom values of an object are aggregated into one json list with a single subquery.
+            The list gets unpacked and cast into the custom field attributes by the CustomFieldModelIterable.
             """
-            fields = {
-                field.identifier: self._subquery(field) for field in available_fields
-            }
+            queryset = self.without_custom_fields().annotate(
+                _custom_values_json=self._json_subquery(available_fields)
+            )
+            queryset._json_custom_fields = available_fields
+            queryset._custom_field_annotations = ("_custom_values_json",)
+            return queryset
 
-            """
-            # The dict can be unpacked and used for the dynamic annotations.
-            # We also annotate the available custom field identifiers as 'custom_field_keys'.
-            # Therefore, we know which custom fields are available for this object.
-            """
-            return (
-                super()
-                .get_queryset()
-                .annotate(**fields)
-                .annotate(
-                    custom_field_keys=ArraySubquery(
-                        available_fields.filter(self.get_type_filter()).values_list(
-                            "identifier", flat=True
+        """
+        This for loop creates a dict with all available custom field values with a subquery for the specific object.
+        The dict key is the identifier of the custom field amd the value is the custom value.
+        If the object has no value for the field, it will return None.
+        More information can be found in the django documentation:
+        https://docs.djangoproject.com/en/5.2/ref/models/expressions/#subquery-expressions
+        """
+        fields = {field.identifier: self._subquery(field) for field in available_fields}
+
+        """
+        # The dict can be unpacked and used for the dynamic annotations.
+        # We also annotate the available custom field identifiers as 'custom_field_keys'.
+        # Therefore, we know which custom fields are available for this object.
+        """
+        queryset = (
+            self.without_custom_fields()
+            .annotate(**fields)
+            .annotate(
+                custom_field_keys=ArraySubquery(
+                    get_custom_field_model()
+                    .objects.for_model(self.model)
+                    .filter(self.get_type_filter())
+                    .values_list("identifier", flat=True)
+                )
+            )
+        )
+        queryset._custom_field_annotations = (*fields.keys(), "custom_field_keys")
+        return queryset
+
+    def without_custom_fields(self) -> "CustomFieldModelQuerySet":
+        """
+        Remove the custom field annotations added by 'with_custom_fields'.
+        """
+        queryset = self._chain()
+        if not queryset._custom_field_annotations:
+            return queryset
+        for name in queryset._custom_field_annotations:
+            queryset.query.annotations.pop(name, None)
+        if queryset.query.annotation_select_mask is not None:
+            queryset.query.set_annotation_mask(
+                set(queryset.query.annotation_select_mask)
+                - set(queryset._custom_field_annotations)
+            )
+        queryset._json_custom_fields = None
+        queryset._custom_field_annotations = ()
+        return queryset
+
+    def _get_custom_values_through(self) -> tuple[type[models.Model], str, str]:
+        field = self.model._meta.get_field("custom_values")
+        return (
+            field.remote_field.through,
+            field.m2m_field_name(),
+            field.m2m_reverse_field_name(),
+        )
+
+    def _get_bulk_custom_field(self, identifier: str) -> AbstractBaseCustomField:
+        field = custom_field_registry.get_field(self.model, identifier)
+        if field is None:
+            raise ValueError(
+                f"Unknown custom field '{identifier}' for {self.model._meta.label}"
+            )
+        return field
+
+    def _custom_value_condition(
+        self, field: AbstractBaseCustomField, lookup: str, value: Any
+    ) -> Q | Exists:
+        storage_field = self.model._custom_values_storage_field
+        if storage_field is not None and not field.choice_field:
+            if lookup == "isnull":
+                return Q(**{f"{storage_field}__has_key": field.identifier})
+            if field.multiple:
+                return Q(
+                    **{
+                        f"{storage_field}__contains": {
+                            field.identifier: field.to_json([value])
+                        }
+                    }
+                )
+            return self._custom_value_lookup(
+                CustomValueExpression(
+                    field, KeyTransform(field.identifier, storage_field)
+                ),
+                lookup,
+                value,
+            )
+
+        through, m2m_field_name, m2m_reverse_field_name = (
+            self._get_custom_values_through()
+        )
+        values = through.objects.filter(
+            **{
+                m2m_field_name: OuterRef("pk"),
+                f"{m2m_reverse_field_name}__field_id": field.id,
+            }
+        )
+        if field.choice_field:
+            # A list of choices contains the choice if it is one of the through rows of the field.
+            if lookup == "contains":
+                lookup = "exact"
+            if lookup != "isnull":
+                values = values.filter(
+                    **{f"{m2m_reverse_field_name}_id__{lookup}": value}
+                )
+        elif field.multiple:
+            if lookup == "isnull":
+                values = values.exclude(**{f"{m2m_reverse_field_name}__value": None})
+            else:
+                values = values.filter(
+                    **{
+                        f"{m2m_reverse_field_name}__value__contains": field.to_json(
+                            [value]
                         )
-                    )
+                    }
+                )
+        else:
+            expression = CustomValueExpression(
+                field, f"{m2m_reverse_field_name}__value"
+            )
+            if lookup == "isnull":
+                values = values.filter(
+                    self._custom_value_lookup(expression, "isnull", False)
                 )
+            else:
+                values = values.filter(
+                    self._custom_value_lookup(expression, lookup, value)
+                )
+        return Exists(values)
+
+    def _custom_value_lookup(
+        self, expression: CustomValueExpression, lookup: str, value: Any
+    ) -> Lookup:
+        lookup_class = expression.get_lookup(lookup)
+        if lookup_class is None:
+            raise ValueError(f"Unsupported lookup '{lookup}' for custom fields")
+        return lookup_class(expression, value)
+
+    def filter_custom_field(
+        self, identifier: str, value: Any, lookup: str = "exact"
+    ) -> "CustomFieldModelQuerySet":
+        """
+        Filter by the value of a custom field. The values are matched with an EXISTS subquery on the value table
+        instead of the annotated subquery, so the expression indexes of the filterable fields can be used.
+        Lists only support the 'contains' lookup with a single item. Choices are matched by their id.
+        """
+        field = self._get_bulk_custom_field(identifier)
+        if field.multiple and lookup not in ("contains", "isnull"):
+            raise ValueError(f"Unsupported lookup '{lookup}' for list custom fields")
+        if lookup == "isnull":
+            condition = self._custom_value_condition(field, lookup, value)
+            return self.exclude(condition) if value else self.filter(condition)
+        return self.filter(self._custom_value_condition(field, lookup, value))
+
+    def _custom_value_ordering(self, field: AbstractBaseCustomField) -> Expression:
+        if field.multiple:
+            raise ValueError(
+                f"Unable to order by the list custom field '{field.identifier}'"
+            )
+        storage_field = self.model._custom_values_storage_field
+        if storage_field is not None and not field.choice_field:
+            return CustomValueExpression(
+                field, KeyTransform(field.identifier, storage_field)
+            )
+
+        through, m2m_field_name, m2m_reverse_field_name = (
+            self._get_custom_values_through()
+        )
+        values = through.objects.filter(
+            **{f"{m2m_reverse_field_name}__field_id": field.id}
+        ).values(
+            object_id=F(f"{m2m_field_name}_id"),
+            value=F(f"{m2m_reverse_field_name}__value"),
+        )
+        alias = self.query.join(
+            CustomValueJoin(values, field.id, self.query.get_initial_alias())
+        )
+        column = Col(alias, get_custom_value_model()._meta.get_field("value"))
+        if field.choice_field:
+            return column
+        return CustomValueExpression(field, column)
+
+    def order_by_custom_fields(self, *field_names: str) -> "CustomFieldModelQuerySet":
+        """
+        Like 'order_by', but also accepts the identifiers of custom fields. The custom fields are ordered by their
+        typed value, the expression of their index, which is joined from the values of the field. Objects without
+        a value are ordered last. Models with a storage field are ordered by an expression on their own table.
+        """
+        queryset = self._chain()
+        ordering: list[str | OrderBy] = []
+        for field_name in field_names:
+            descending = field_name.startswith("-")
+            field = custom_field_registry.get_field(self.model, field_name.lstrip("-"))
+            if field is None:
+                ordering.append(field_name)
+                continue
+            expression = queryset._custom_value_ordering(field)
+            ordering.append(
+                expression.desc(nulls_last=True)
+                if descending
+                else expression.asc(nulls_last=True)
             )
+        return queryset.order_by(*ordering)
+
+    def _build_custom_value(
+        self, field: AbstractBaseCustomField, value: Any
+    ) -> AbstractBaseCustomValue:
+        return get_custom_value_model()(field=field, value=field.to_json(value))
+
+    def _get_stored_values(self, obj: models.Model) -> dict[str, Any]:
+        storage_field = self.model._custom_values_storage_field
+        if getattr(obj, storage_field) is None:
+            setattr(obj, storage_field, {})
+        return getattr(obj, storage_field)
+
+    def bulk_create_with_custom_values(
+        self,
+        objs: Sequence[models.Model],
+        values_by_obj: Sequence[dict[str, Any]],
+        batch_size: int | None = None,
+    ) -> list[models.Model]:
+        """
+        Create the objects together with their custom values. 'values_by_obj' contains a dict of custom values
+        by identifier for each object, in the same order as the objects. Choices are passed as value objects.
+        """
+        if len(objs) != len(values_by_obj):
+            raise ValueError("objs and values_by_obj must have the same length")
+
+        through, source, target = self._get_custom_values_through()
+        storage_field = self.model._custom_values_storage_field
+        custom_values: list[tuple[models.Model, AbstractBaseCustomValue]] = []
+        choices: list[tuple[models.Model, AbstractBaseCustomValue]] = []
+        for obj, values in zip(objs, values_by_obj):
+            for identifier, value in values.items():
+                field = self._get_bulk_custom_field(identifier)
+                if value is None:
+                    continue
+                if field.choice_field:
+                    choices.extend(
+                        (obj, choice)
+                        for choice in (value if field.multiple else [value])
+                    )
+                elif storage_field is not None:
+                    self._get_stored_values(obj)[identifier] = field.to_json(value)
+                else:
+                    custom_values.append((obj, self._build_custom_value(field, value)))
+
+        with transaction.atomic(using=self.db):
+            # The objects are created first, so they have a primary key for the through rows.
+            self.bulk_create(objs, batch_size=batch_size)
+            get_custom_value_model().objects.bulk_create(
+                [value for _, value in custom_values], batch_size=batch_size
+            )
+            through.objects.bulk_create(
+                [
+                    through(**{f"{source}_id": obj.pk, f"{target}_id": value.pk})
+                    for obj, value in [*custom_values, *choices]
+                ],
+                batch_size=batch_size,
+            )
+        return list(objs)
+
+    def bulk_update_custom_values(
+        self,
+        objs: Sequence[models.Model],
+        values_by_obj: Sequence[dict[str, Any]],
+        fields: Sequence[str] | None = None,
+        batch_size: int | None = None,
+    ) -> None:
+        """
+        Update the custom values of existing objects. 'values_by_obj' contains a dict of custom values
+        by identifier for each object, in the same order as the objects. Custom values which are not contained
+        in the dict and unchanged values are not written, None removes the value.
+        The model fields in 'fields' are updated as well.
+        """
+        if len(objs) != len(values_by_obj):
+            raise ValueError("objs and values_by_obj must have the same length")
+
+        through, source, target = self._get_custom_values_through()
+        storage_field = self.model._custom_values_storage_field
+        with transaction.atomic(using=self.db):
+
+            existing: dict[tuple[Any, int], list[Any]] = defaultdict(list)
+            for link in through.objects.filter(
+                **{f"{source}__in": [obj.pk for obj in objs]}
+            ).select_related(target):
+                custom_value = getattr(link, target)
+                existing[(getattr(link, f"{source}_id"), custom_value.field_id)].append(
+                    (link, custom_value)
+                )
+
+            links_to_delete: list[int] = []
+            values_to_delete: list[int] = []
+            values_to_create: list[tuple[models.Model, AbstractBaseCustomValue]] = []
+            values_to_update: list[AbstractBaseCustomValue] = []
+            choices_to_add: list[tuple[models.Model, AbstractBaseCustomValue]] = []
+            now = timezone.now()
+            storage_changed = False
+            for obj, values in zip(objs, values_by_obj):
+                for identifier, value in values.items():
+                    field = self._get_bulk_custom_field(identifier)
+                    existing_links = existing.get((obj.pk, field.id), [])
+                    if field.choice_field:
+                        links_to_delete.extend(link.pk for link, _ in existing_links)
+                        if value is not None:
+                            choices_to_add.extend(
+                                (obj, choice)
+                                for choice in (value if field.multiple else [value])
+                            )
+                    elif storage_field is not None:
+                        stored_values = self._get_stored_values(obj)
+                        if value is None:
+                            stored_values.pop(identifier, None)
+                        else:
+                            stored_values[identifier] = field.to_json(value)
+                        storage_changed = True
+                    elif value is None:
+                        values_to_delete.extend(
+                            custom_value.pk for _, custom_value in existing_links
+                        )
+                    elif existing_links:
+                        value_object = existing_links[0][1]
+                        new_value = self._build_custom_value(field, value).value
+                        if value_object.value == new_value:
+                            continue
+                        value_object.value = new_value
+                        value_object.modified = now
+                        values_to_update.append(value_object)
+                    else:
+                        values_to_create.append(
+                            (obj, self._build_custom_value(field, value))
+                        )
+
+            fields = list(fields or [])
+            if storage_changed and storage_field not in fields:
+                fields.append(storage_field)
+            if fields:
+                self.bulk_update(objs, fields, batch_size=batch_size)
+            if links_to_delete:
+                through.objects.filter(pk__in=links_to_delete).delete()
+            if values_to_delete:
+                get_custom_value_model().objects.filter(
+                    pk__in=values_to_delete
+                ).delete()
+            if values_to_update:
+                get_custom_value_model().objects.bulk_update(
+                    values_to_update,
+                    fields=["value", "modified"],
+                    batch_size=batch_size,
+                )
+            if values_to_create:
+                get_custom_value_model().objects.bulk_create(
+                    [value for _, value in values_to_create], batch_size=batch_size
+                )
+            if values_to_create or choices_to_add:
+                through.objects.bulk_create(
+                    [
+                        through(**{f"{source}_id": obj.pk, f"{target}_id": value.pk})
+                        for obj, value in [*values_to_create, *choices_to_add]
+                    ],
+                    batch_size=batch_size,
+                    ignore_conflicts=True,
+                )
+            for obj in objs:
+                obj.__dict__.pop("_existing_custom_values", None)
+
+
+class CustomFieldModelBaseManager(
+    models.Manager.from_queryset(CustomFieldModelQuerySet)  # type: ignore[misc]
+):
+    # Annotate all custom fields by default instead of loading them lazily on first access.
+    annotate_custom_fields: bool = False
+    # Fetch all custom values of an object with one aggregated subquery instead of one subquery per custom field.
+    # If None, the CUSTOM_FIELD_JSON_AGGREGATION setting is used.
+    json_aggregation: bool | None = None
+
+    def use_json_aggregation(self) -> bool:
+        if self.json_aggregation is None:
+            return settings.CUSTOM_FIELD_JSON_AGGREGATION
+        return self.json_aggregation
+
+    def get_queryset(self) -> QuerySet:
+        queryset = super().get_queryset()
+        queryset._json_aggregation = self.use_json_aggregation()
+        if not self.annotate_custom_fields:
+            return queryset
+        try:
+            return queryset.with_custom_fields()
         except (ProgrammingError, RuntimeError, IntegrityError):
-            return super().get_queryset()
+            return queryset
 
 
 class CustomFieldTypeBaseModel(TimeStampedModel):
@@ -122,6 +655,9 @@ class CustomFieldTypeBaseModel(TimeStampedModel):
 
 class CustomFieldBaseModel(TimeStampedModel):
     _custom_field_type_attr: str | None = None
+    # The name of a JSONField of the model, which stores the values of the non-choice custom fields by identifier
+    # instead of the value table. The choices are still linked with the custom_values relation.
+    _custom_values_storage_field: str | None = None
     objects = CustomFieldModelBaseManager()
 
     class Meta:
@@ -136,49 +672,234 @@ class CustomFieldBaseModel(TimeStampedModel):
         self._custom_values_to_save: list[AbstractBaseCustomValue] = []
 
     def _save_custom_values(self) -> None:
+        """
+        The pending values are split into new values, changed values and choices, so all of them are written
+        with a constant number of statements. Choices are only linked, because they are shared between objects.
+        The values of fields which were deleted after they were set are skipped.
+        """
         if self._custom_values_to_remove:
             self.custom_values.remove(*self._custom_values_to_remove)
 
         if self._custom_values_to_delete:
             self.custom_values.filter(id__in=self._custom_values_to_delete).delete()
 
-        _custom_values_to_add: set[AbstractBaseCustomValue] = set()
-        existing_custom_values = self.custom_values.all()
+        _custom_values_to_create: list[AbstractBaseCustomValue] = []
+        _custom_values_to_update: list[AbstractBaseCustomValue] = []
+        _choices_to_add: list[AbstractBaseCustomValue] = []
+        invalidated = False
         for value in self._custom_values_to_save:
-            value.save()  # type: ignore
-            if value not in existing_custom_values:
-                _custom_values_to_add.add(value)
-        if _custom_values_to_add:
-            self.custom_values.add(*_custom_values_to_add)
+            field = custom_field_registry.get_field_by_id(
+                self.__class__, value.field_id
+            )
+            if field is None and not invalidated:
+                # The definitions of this process may be older than the field.
+                custom_field_registry.invalidate()
+                invalidated = True
+                field = custom_field_registry.get_field_by_id(
+                    self.__class__, value.field_id
+                )
+            if field is None:
+                # The field was deleted after the value was set.
+                continue
+            if field.choice_field:
+                if value.pk is None:
+                    raise ValueError(
+                        f"The choice of the custom field '{field.identifier}' must be saved before it is linked"
+                    )
+                _choices_to_add.append(value)
+            elif value.pk is None:
+                _custom_values_to_create.append(value)
+            else:
+                _custom_values_to_update.append(value)
+
+        custom_value_model = get_custom_value_model()
+        if _custom_values_to_create:
+            custom_value_model.objects.bulk_create(_custom_values_to_create)
+        if _custom_values_to_update:
+            now = timezone.now()
+            for value in _custom_values_to_update:
+                value.modified = now
+            custom_value_model.objects.bulk_update(
+                _custom_values_to_update, fields=["value", "modified"]
+            )
+        # Existing values are already linked and the add ignores choices which are already linked.
+        if _custom_values_to_create or _choices_to_add:
+            self.custom_values.add(*_custom_values_to_create, *_choices_to_add)
         self._custom_values_to_save = []
         self._custom_values_to_remove = []
+        self._custom_values_to_delete = []
+        self.__dict__.pop("_existing_custom_values", None)
 
     def save(self, **kwargs: Any) -> None:
-        super().save(**kwargs)  # type: ignore
+        super().save(**kwargs)
         if self.handle_custom_values:
             self._save_custom_values()
 
+    def _is_lazy_custom_attr(self, name: str) -> bool:
+        if name.startswith("_") or not self.__dict__.get("_lazy_custom_fields"):
+            return False
+        if name == "custom_field_keys":
+            return True
+        return custom_field_registry.get_field(self.__class__, name) is not None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._is_lazy_custom_attr(name) and self.pk is not None:
+            self.load_custom_fields()
+            if name in self.__dict__:
+                return self.__dict__[name]
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'"
+        )
+
+    def load_custom_fields(self) -> None:
+        """
+        Load the values of all custom fields which are not set on this object with a single query, together
+        with the objects fetched with it which miss them too.
+        """
+        if self.pk is None:
+            return
+        identifiers = [
+            field.identifier
+            for field in custom_field_registry.get_fields(self.__class__)
+            if field.identifier not in self.__dict__
+        ]
+        if not identifiers:
+            self.__dict__["custom_field_keys"] = self._get_custom_field_keys()
+            return
+        objs = {
+            obj.pk: obj
+            for obj in self.__dict__.get("_custom_field_group", [self])
+            if obj.pk is not None
+            and any(identifier not in obj.__dict__ for identifier in identifiers)
+        }
+        objs[self.pk] = self
+        instances = self.__class__.objects.filter(pk__in=objs).with_custom_fields(
+            *identifiers, json_aggregation=True
+        )
+        loaded = set()
+        for instance in instances:
+            obj = objs[instance.pk]
+            for key in [*identifiers, "custom_field_keys"]:
+                obj.__dict__.setdefault(key, instance.__dict__.get(key))
+            obj.__dict__.pop("_custom_field_group", None)
+            loaded.add(instance.pk)
+        if self.pk not in loaded:
+            raise self.DoesNotExist(
+                f"{self.__class__.__name__} matching query does not exist."
+            )
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = super().__getstate__()
+        # Don't pickle the other objects of the result.
+        state.pop("_custom_field_group", None)
+        return state
+
     def refresh_with_custom_fields(self) -> None:
         if self.pk is None:
             return
-        self.__dict__.update(self.__class__.objects.get(pk=self.pk).__dict__)
+        self.__dict__.update(
+            self.__class__.objects.with_custom_fields().get(pk=self.pk).__dict__
+        )
+        self.__dict__.pop("_existing_custom_values", None)
+
+    def _is_available_custom_field(self, field: AbstractBaseCustomField) -> bool:
+        if field.type_id is None:
+            return True
+        type_model = self.__class__.objects.get_type_model()
+        if type_model is None:
+            return False
+        return field.type_content_type_id == (
+            ContentType.objects.get_for_model(type_model).id
+        ) and field.type_id == getattr(self, f"{self._custom_field_type_attr}_id")
+
+    def _set_json_custom_values(
+        self, fields: list[AbstractBaseCustomField], data: list[dict] | None
+    ) -> None:
+        """
+        Set the custom field attributes from the aggregated json values without handling them as changed values.
+        """
+        values = defaultdict(list)
+        for item in data or []:
+            values[item.pop("identifier")].append(item)
 
-    def _create_or_update_custom_value(self, field: str, value: Any) -> None:
-        try:
-            value_object = self.custom_values.select_related("field").get(field=field)
+        for field in fields:
+            field_values = values.get(field.identifier, [])
+            if field.choice_field:
+                value = (
+                    field_values if field.multiple else next(iter(field_values), None)
+                )
+            else:
+                value = (
+                    field.to_python(field_values[0]["value"]) if field_values else None
+                )
+            self.__dict__[field.identifier] = value
+        self.__dict__["custom_field_keys"] = self._get_custom_field_keys()
+
+    def _get_custom_field_keys(self) -> list[str]:
+        return [
+            field.identifier
+            for field in custom_field_registry.get_fields(self.__class__)
+            if self._is_available_custom_field(field)
+        ]
+
+    def _get_existing_custom_values(
+        self,
+    ) -> dict[int, list[AbstractBaseCustomValue]]:
+        """
+        Return the custom values linked to this object by field id. They are fetched once and cached until the next save.
+        """
+        if "_existing_custom_values" not in self.__dict__:
+            existing_custom_values = defaultdict(list)
+            if self.pk is not None:
+                for value in self.custom_values.all():
+                    existing_custom_values[value.field_id].append(value)
+            self.__dict__["_existing_custom_values"] = existing_custom_values
+        return self.__dict__["_existing_custom_values"]
+
+    def _set_stored_custom_values(self) -> None:
+        """
+        Set the custom field attributes from the storage field without handling them as changed values.
+        """
+        storage_field = self._custom_values_storage_field
+        if storage_field is None:
+            return
+        stored_values = getattr(self, storage_field) or {}
+        for field in custom_field_registry.get_fields(self.__class__):
+            if not field.choice_field:
+                self.__dict__[field.identifier] = field.to_python(
+                    stored_values.get(field.identifier)
+                )
+
+    def _create_or_update_custom_value(
+        self, field: AbstractBaseCustomField, value: Any
+    ) -> None:
+        if self._custom_values_storage_field is not None:
+            stored_values = getattr(self, self._custom_values_storage_field)
+            if stored_values is None:
+                stored_values = {}
+                setattr(self, self._custom_values_storage_field, stored_values)
+            if value is None:
+                stored_values.pop(field.identifier, None)
+            else:
+                stored_values[field.identifier] = field.to_json(value)
+            return
+
+        existing_values = self._get_existing_custom_values().get(field.id)
+        if existing_values:
+            value_object = existing_values[0]
             if value is None:
                 self._custom_values_to_delete.append(value_object.id)
                 return
-        except get_custom_value_model().DoesNotExist:
+        else:
             value_object = get_custom_value_model()(field=field)
-        serializer_field = value_object.field.serializer_field
-        serializer_field.run_validators(value)
-        value_object.value = serializer_field.to_representation(value)
+        # The field definitions of the registry are shared, so the value object doesn't need to fetch its field.
+        value_object.field = field
+        value_object.value = field.to_json(value)
         self._custom_values_to_save.append(value_object)
 
     def _set_choice_value(self, field: AbstractBaseCustomField, value: Any) -> None:
         self._custom_values_to_remove.extend(
-            get_custom_value_model().objects.filter(field=field)
+            self._get_existing_custom_values().get(field.id, [])
         )
         if value is None:
             return
@@ -199,8 +920,14 @@ class CustomFieldBaseModel(TimeStampedModel):
         return getattr(self, name)
 
     def __setattr__(self, name: str, value: Any) -> None:
-        if hasattr(self, "custom_field_keys") and name in self.custom_field_keys:
-            field = get_custom_field_model().objects.get(identifier=name)
+        if "custom_field_keys" not in self.__dict__ and self._is_lazy_custom_attr(name):
+            # The available custom fields are known from the registry, so we don't need to load the values.
+            self.__dict__["custom_field_keys"] = self._get_custom_field_keys()
+        field = None
+        if "custom_field_keys" in self.__dict__ and name in self.custom_field_keys:
+            # The field is None if it was deleted after the keys were loaded.
+            field = custom_field_registry.get_field(self.__class__, name)
+        if field is not None:
             if field.choice_field:
                 self._set_choice_value(field, value)
             else:
@@ -1,7 +1,13 @@
+from datetime import datetime
+from datetime import timezone as dt_timezone
+from typing import Any
+
+from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.postgres.fields import ArrayField
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django_extensions.db.models import TimeStampedModel
 from rest_framework import serializers
@@ -156,11 +162,21 @@ class AbstractBaseCustomField(TimeStampedModel):
 
     @property
     def serializer_field(self) -> serializers.Field:
+        return self.get_serializer_field()
+
+    def get_serializer_field(
+        self, unique_field: str | None = None, strict: bool = False
+    ) -> serializers.Field:
+        """
+        The unique_field and strict arguments are only used for choice fields.
+        """
         from django_features.custom_fields.fields import ChoiceIdField
 
         params = {"allow_null": self.allow_null, "required": self.required}
         if self.choice_field:
-            return ChoiceIdField(field=self, **params)
+            return ChoiceIdField(
+                field=self, unique_field=unique_field, strict=strict, **params
+            )
 
         serializer_field = self.TYPE_SERIALIZER_MAP.get(self.field_type)
         if serializer_field is None:
@@ -174,13 +190,43 @@ class AbstractBaseCustomField(TimeStampedModel):
             params["default"] = self.default
 
         if self.multiple:
+            list_params = {k: v for k, v in params.items() if k != "allow_blank"}
             return serializers.ListField(
                 child=serializer_field(**params),
-                **{"allow_empty": self.allow_blank, **params},
+                **{"allow_empty": self.allow_blank, **list_params},
             )
 
         return serializer_field(**params)
 
+    def to_json(self, value: Any) -> Any:
+        """
+        Validate a python value of this field and convert it into the JSON value which is stored.
+        """
+        serializer_field = self.serializer_field
+        serializer_field.run_validators(value)
+        return serializer_field.to_representation(value)
+
+    def to_python(self, value: Any) -> Any:
+        """
+        Convert a raw JSON value of this field into the python value the database cast would return.
+        """
+        if value is None:
+            return None
+        if self.multiple:
+            return [self._item_to_python(item) for item in value]
+        return self._item_to_python(value)
+
+    def _item_to_python(self, value: Any) -> Any:
+        from django_features.custom_fields.helpers import get_custom_field_model
+
+        field_class = get_custom_field_model().TYPE_FIELD_MAP.get(self.field_type)
+        if not field_class:
+            raise ValueError(f"Unknown field type: {self.field_type}")
+        value = field_class().to_python(value)
+        if isinstance(value, datetime) and settings.USE_TZ and timezone.is_naive(value):
+            return timezone.make_aware(value, dt_timezone.utc)
+        return value
+
     @property
     def sql_field(self) -> str:
         sql_field = self.TYPE_SQL_MAP.get(self.field_type)
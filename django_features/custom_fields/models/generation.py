@@ -0,0 +1,38 @@
+from django.db import models
+from django.db.models import F
+from django.utils.translation import gettext_lazy as _
+
+
+class CustomFieldGeneration(models.Model):
+    """
+    Counter which is incremented on every change of the custom field definitions.
+    Other processes compare it with the generation of their cached definitions to notice changes.
+    """
+
+    SINGLETON_ID = 1
+
+    generation = models.PositiveBigIntegerField(_("Generation"), default=0)
+
+    class Meta:
+        verbose_name = _("Generation der benutzerdefinierten Felder")
+        verbose_name_plural = _("Generationen der benutzerdefinierten Felder")
+
+    def __str__(self) -> str:
+        return f"{self.generation}"
+
+    @classmethod
+    def current(cls) -> int:
+        return (
+            cls.objects.filter(id=cls.SINGLETON_ID)
+            .values_list("generation", flat=True)
+            .first()
+            or 0
+        )
+
+    @classmethod
+    def increment(cls) -> None:
+        updated = cls.objects.filter(id=cls.SINGLETON_ID).update(
+            generation=F("generation") + 1
+        )
+        if not updated:
+            cls.objects.get_or_create(id=cls.SINGLETON_ID, defaults={"generation": 1})
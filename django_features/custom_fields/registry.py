@@ -0,0 +1,107 @@
+__all__ = [
+    "CustomFieldRegistry",
+    "custom_field_registry",
+]
+
+
+import threading
+import time
+
+from django.conf import settings
+from django.db import models
+
+from django_features.custom_fields.helpers import get_custom_field_model
+from django_features.custom_fields.models.field import AbstractBaseCustomField
+from django_features.custom_fields.models.generation import CustomFieldGeneration
+
+
+class _ModelFields:
+    def __init__(self, fields: list[AbstractBaseCustomField]) -> None:
+        self.fields = fields
+        self.by_identifier = {field.identifier: field for field in fields}
+        self.by_id = {field.id: field for field in fields}
+
+
+class CustomFieldRegistry:
+    """
+    Process-local cache of the custom field definitions per model.
+
+    The cache is invalidated by the signals of the custom field model in this process. Other processes notice
+    changes by comparing the generation of their cached definitions with the generation stored in the database,
+    which is checked at most every CUSTOM_FIELD_GENERATION_CHECK_INTERVAL seconds.
+    """
+
+    def __init__(self) -> None:
+        self._models: dict[tuple[str, str], _ModelFields] = {}
+        self._generation: int | None = None
+        self._checked_at: float | None = None
+        self._lock = threading.RLock()
+
+    @property
+    def generation(self) -> int:
+        self._validate()
+        return self._generation or 0
+
+    def _validate(self) -> None:
+        now = time.monotonic()
+        if (
+            self._checked_at is not None
+            and now - self._checked_at < settings.CUSTOM_FIELD_GENERATION_CHECK_INTERVAL
+        ):
+            return
+        with self._lock:
+            generation = CustomFieldGeneration.current()
+            if generation != self._generation:
+                self._models = {}
+                self._generation = generation
+            self._checked_at = now
+
+    def _get_model_fields(self, model: type[models.Model]) -> _ModelFields:
+        self._validate()
+        key = (model._meta.app_label, model._meta.model_name)
+        model_fields = self._models.get(key)
+        if model_fields is None:
+            with self._lock:
+                model_fields = _ModelFields(
+                    list(get_custom_field_model().objects.for_model(model))
+                )
+                self._models[key] = model_fields
+        return model_fields
+
+    def get_fields(self, model: type[models.Model]) -> list[AbstractBaseCustomField]:
+        """
+        Return all custom fields of the given model, including the fields of all types.
+        """
+        return self._get_model_fields(model).fields
+
+    def get_field(
+        self, model: type[models.Model], identifier: str
+    ) -> AbstractBaseCustomField | None:
+        return self._get_model_fields(model).by_identifier.get(identifier)
+
+    def get_field_by_id(
+        self, model: type[models.Model], field_id: int
+    ) -> AbstractBaseCustomField | None:
+        return self._get_model_fields(model).by_id.get(field_id)
+
+    def get_identifiers(self, model: type[models.Model]) -> list[str]:
+        return list(self._get_model_fields(model).by_identifier)
+
+    def invalidate(self) -> None:
+        """
+        Clear the cached definitions of this process.
+        """
+        with self._lock:
+            self._models = {}
+            self._checked_at = None
+
+    def bump(self) -> None:
+        """
+        Increment the generation in the database, so all processes reload their definitions.
+        Must be called after changes which don't send the model signals, e.g. bulk_create or update.
+        """
+        CustomFieldGeneration.increment()
+        self.invalidate()
+
+
+custom_field_registry = CustomFieldRegistry()
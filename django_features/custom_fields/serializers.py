@@ -1,15 +1,25 @@
+import copy
+import threading
 from collections import namedtuple
+from datetime import date
+from datetime import time
 from typing import Any
+from uuid import UUID
 
+from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.contenttypes.models import ContentType
 from django.db import models
+from django.db import transaction
+from django.db.models import ForeignObjectRel
 from rest_framework import serializers
 from rest_framework.fields import empty
+from rest_framework.utils import model_meta
 
 from django_features.custom_fields.helpers import get_custom_field_model
 from django_features.custom_fields.helpers import get_custom_value_model
-from django_features.custom_fields.models.base import CustomFieldBaseModel
 from django_features.custom_fields.models.field import AbstractBaseCustomField
 from django_features.custom_fields.models.value import AbstractBaseCustomValue
+from django_features.custom_fields.registry import custom_field_registry
 
 
 class CustomChoiceSerializer(serializers.ModelSerializer):
@@ -17,10 +27,19 @@ class CustomChoiceSerializer(serializers.ModelSerializer):
         model = get_custom_value_model()
         fields = ["id", "label", "value"]
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        *args: Any,
+        field: AbstractBaseCustomField | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Pass the custom field of the choices as 'field' to avoid fetching it from the choice.
+        """
         super().__init__(*args, **kwargs)
-        if isinstance(self.instance, AbstractBaseCustomValue):
+        if field is None and isinstance(self.instance, AbstractBaseCustomValue):
             field = self.instance.field
+        if field is not None:
             self.fields["value"] = get_custom_field_model().TYPE_SERIALIZER_MAP[
                 field.field_type
             ](allow_null=True, read_only=True, required=False)
@@ -49,7 +68,11 @@ class CustomFieldSerializer(serializers.ModelSerializer):
         ]
 
     def get_choices(self, obj: AbstractBaseCustomField) -> list:
-        return CustomChoiceSerializer(obj.choices, many=True).data
+        # The CustomFieldViewSet prefetches the choices of all fields.
+        choices = getattr(obj, "prefetched_choices", None)
+        if choices is None:
+            choices = obj.choices
+        return CustomChoiceSerializer(choices, many=True, field=obj).data
 
 
 CustomFieldData = namedtuple(
@@ -60,16 +83,146 @@ CustomFieldData = namedtuple(
         "choices",
         "choice_field",
         "multiple",
-        "serializer_field",
     ],
 )
 
 
+# The serializer fields of the custom fields by serializer class, model, filter, unique choice field and strict choices.
+# Each entry holds the registry generation it was built with, so it is rebuilt when the custom fields change.
+_serializer_field_cache: dict[
+    tuple, tuple[int, list[CustomFieldData], dict[str, serializers.Field]]
+] = {}
+_serializer_field_cache_lock = threading.Lock()
+
+
+_CACHE_KEY_TYPES = (str, int, float, bool, date, time, UUID, type(None))
+
+
+def _get_filter_cache_key(filter: dict[str, Any]) -> tuple | None:
+    """
+    Return the filter as a key of primitive values, or None if a value can't be compared reliably.
+    Objects are compared by their model and primary key, lists and sets by their items.
+    """
+    items = []
+    for key, value in filter.items():
+        if isinstance(value, models.Model):
+            if value.pk is None:
+                return None
+            value = (value._meta.label, value.pk)
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            if not all(isinstance(item, _CACHE_KEY_TYPES) for item in value):
+                return None
+            value = (
+                type(value).__name__,
+                tuple(
+                    sorted(value, key=str)
+                    if isinstance(value, (set, frozenset))
+                    else value
+                ),
+            )
+        elif not isinstance(value, _CACHE_KEY_TYPES):
+            return None
+        items.append((key, value))
+    return tuple(sorted(items))
+
+
+def clear_serializer_field_cache() -> None:
+    with _serializer_field_cache_lock:
+        _serializer_field_cache.clear()
+
+
+def bulk_set_relation(
+    model: type[models.Model],
+    field_name: str,
+    instances: list[models.Model],
+    values: list[Any],
+    batch_size: int | None = None,
+) -> None:
+    """
+    Set a to-many relation of new objects with one statement: The rows of many-to-many relations are inserted
+    into the through table, the related objects of reverse foreign keys and generic relations are updated.
+    'values' contains the related objects or None for each object, in the same order as the objects.
+    """
+    field = model._meta.get_field(field_name)
+    pairs = [
+        (instance, related)
+        for instance, value in zip(instances, values)
+        if value is not None
+        for related in value
+    ]
+    if not pairs:
+        return
+    if field.many_to_many:
+        accessor = (
+            field.get_accessor_name()
+            if isinstance(field, ForeignObjectRel)
+            else field.name
+        )
+        manager = getattr(pairs[0][0], accessor)
+        through = manager.through
+        source = through._meta.get_field(manager.source_field_name).attname
+        target = through._meta.get_field(manager.target_field_name).attname
+        rows = dict.fromkeys((instance.pk, related.pk) for instance, related in pairs)
+        through._default_manager.bulk_create(
+            [through(**{source: a, target: b}) for a, b in rows],
+            batch_size=batch_size,
+        )
+        return
+
+    if isinstance(field, GenericRelation):
+        content_type = ContentType.objects.get_for_model(
+            model, for_concrete_model=field.for_concrete_model
+        )
+        update_fields = [field.content_type_field_name, field.object_id_field_name]
+        for instance, related in pairs:
+            setattr(related, field.content_type_field_name, content_type)
+            setattr(related, field.object_id_field_name, instance.pk)
+    elif isinstance(field, ForeignObjectRel) and field.one_to_many:
+        update_fields = [field.field.name]
+        for instance, related in pairs:
+            setattr(related, field.field.name, instance)
+    else:
+        raise ValueError(f"Field {field_name} is not a to-many relation.")
+    # Like with consecutive calls of set(), the last object wins if an object is related to several objects.
+    related_objects = {related.pk: related for _, related in pairs}
+    field.related_model._base_manager.bulk_update(
+        list(related_objects.values()), update_fields, batch_size=batch_size
+    )
+
+
+class CustomFieldBaseModelListSerializer(serializers.ListSerializer):
+    """
+    Creates all objects of the payload together with their custom values with batched statements.
+    The objects are created with bulk_create, so the save method and the save signals are not called.
+    """
+
+    batch_size: int | None = 1000
+
+    def _can_bulk_create(self) -> bool:
+        # Serializers with their own create must save their objects one by one.
+        return (
+            self.child._bulk_create
+            and type(self.child).create is CustomFieldBaseModelSerializer.create
+            and not self.child.exclude_custom_fields
+        )
+
+    def create(self, validated_data: list[dict]) -> list:
+        if not self._can_bulk_create():
+            return super().create(validated_data)
+
+        serializers.raise_errors_on_nested_writes("create", self.child, validated_data)
+        return self.child.bulk_create(validated_data, batch_size=self.batch_size)
+
+
 class CustomFieldBaseModelSerializer(serializers.ModelSerializer):
     _exclude_custom_fields = False
     _custom_fields: list[CustomFieldData] = []
     _unique_choice_field = "id"
+    # Verify the choices resolved from the choice lookup cache against the database.
+    _strict_choices = False
     _write_only_serializer = False
+    # Create and update the objects of a list payload with batched statements, see CustomFieldBaseModelListSerializer.
+    _bulk_create = False
 
     class Meta:
         abstract = True
@@ -91,6 +244,33 @@ class CustomFieldBaseModelSerializer(serializers.ModelSerializer):
         )
         super().__init__(instance, data, **kwargs)
 
+    @classmethod
+    def many_init(cls, *args: Any, **kwargs: Any) -> serializers.ListSerializer:
+        """
+        Use the CustomFieldBaseModelListSerializer if '_bulk_create' is set and no list_serializer_class is set
+        on the Meta class.
+        """
+        if not cls._bulk_create:
+            return super().many_init(*args, **kwargs)
+        list_kwargs = {}
+        for key in serializers.LIST_SERIALIZER_KWARGS_REMOVE:
+            value = kwargs.pop(key, None)
+            if value is not None:
+                list_kwargs[key] = value
+        list_kwargs["child"] = cls(*args, **kwargs)
+        list_kwargs.update(
+            {
+                key: value
+                for key, value in kwargs.items()
+                if key in serializers.LIST_SERIALIZER_KWARGS
+            }
+        )
+        meta = getattr(cls, "Meta", None)
+        list_serializer_class = getattr(
+            meta, "list_serializer_class", CustomFieldBaseModelListSerializer
+        )
+        return list_serializer_class(*args, **list_kwargs)
+
     @property
     def model(self) -> models.Model:
         if not self.Meta.model:
@@ -105,29 +285,70 @@ class CustomFieldBaseModelSerializer(serializers.ModelSerializer):
     def filter(self, value: dict[str, Any]) -> None:
         self._filter = value
 
+    def _get_custom_serializer_fields(
+        self,
+    ) -> tuple[list[CustomFieldData], dict[str, serializers.Field]]:
+        """
+        The serializer fields of the custom fields are built once and deep-copied for each serializer,
+        like DRF does with the declared fields.
+        """
+        filter_key = _get_filter_cache_key(self.filter)
+        key = (
+            self.__class__,
+            self.model,
+            filter_key,
+            self._unique_choice_field,
+            self._strict_choices,
+        )
+        generation = custom_field_registry.generation
+        # Filters with other values than primitives and saved objects aren't cached.
+        cached = _serializer_field_cache.get(key) if filter_key is not None else None
+        if cached is None or cached[0] != generation:
+            custom_fields = custom_field_registry.get_fields(self.model)
+            if self.filter:
+                custom_fields = list(
+                    get_custom_field_model()
+                    .objects.for_model(self.model)
+                    .filter(**self.filter)
+                )
+            custom_field_data = []
+            serializer_fields = {}
+            for field in custom_fields:
+                custom_field_data.append(
+                    CustomFieldData(
+                        field.id,
+                        field.identifier,
+                        field.choices,
+                        field.choice_field,
+                        field.multiple,
+                    )
+                )
+                serializer_fields[field.identifier] = field.get_serializer_field(
+                    unique_field=self._unique_choice_field,
+                    strict=self._strict_choices,
+                )
+            cached = (generation, custom_field_data, serializer_fields)
+            if filter_key is not None:
+                with _serializer_field_cache_lock:
+                    _serializer_field_cache[key] = cached
+        # The choices are cloned, so the cached querysets don't share their results.
+        custom_field_data = [
+            data._replace(choices=data.choices.all()) for data in cached[1]
+        ]
+        return custom_field_data, copy.deepcopy(cached[2])
+
     def get_fields(self) -> dict[str, Any]:
         fields = super().get_fields()
+        # The storage field is written with the custom fields.
+        storage_field = getattr(self.model, "_custom_values_storage_field", None)
+        if storage_field is not None:
+            fields.pop(storage_field, None)
         if self.exclude_custom_fields:
             return fields
-        self._custom_fields = []
-        custom_fields = list(
-            get_custom_field_model().objects.for_model(self.model).filter(**self.filter)
+        self._custom_fields, custom_serializer_fields = (
+            self._get_custom_serializer_fields()
         )
-        for field in custom_fields:
-            self._custom_fields.append(
-                CustomFieldData(
-                    field.id,
-                    field.identifier,
-                    field.choices,
-                    field.choice_field,
-                    field.multiple,
-                    field.serializer_field,
-                )
-            )
-            serialized_field = field.serializer_field
-            if field.choice_field:
-                serialized_field.set_unique_field(self._unique_choice_field)
-            fields[field.identifier] = serialized_field
+        fields.update(custom_serializer_fields)
         return fields
 
     def collect_custom_fields(self) -> dict:
@@ -146,14 +367,70 @@ class CustomFieldBaseModelSerializer(serializers.ModelSerializer):
             if field.identifier in data
         }
 
+    def bulk_create(
+        self, validated_data: list[dict], batch_size: int | None = None
+    ) -> list:
+        """
+        Create the objects of a list of validated data together with their custom values with batched statements.
+        The objects are created with bulk_create, so the save method and the save signals are not called.
+        """
+        model = self.model
+        info = model_meta.get_field_info(model)
+        objs: list[models.Model] = []
+        values_by_obj: list[dict[str, Any]] = []
+        many_to_many_by_obj: list[dict[str, Any]] = []
+        for data in validated_data:
+            data = dict(data)
+            values_by_obj.append(
+                {
+                    field.identifier: data.pop(field.identifier)
+                    for field in self._custom_fields
+                    if field.identifier in data
+                }
+            )
+            many_to_many_by_obj.append(
+                {
+                    field_name: data.pop(field_name)
+                    for field_name, relation_info in info.relations.items()
+                    if relation_info.to_many and field_name in data
+                }
+            )
+            objs.append(model(**data))
+
+        with transaction.atomic():
+            if hasattr(model.objects, "bulk_create_with_custom_values"):
+                instances = model.objects.bulk_create_with_custom_values(
+                    objs, values_by_obj, batch_size=batch_size
+                )
+            else:
+                instances = model.objects.bulk_create(objs, batch_size=batch_size)
+            to_many = dict.fromkeys(
+                name for data in many_to_many_by_obj for name in data
+            )
+            for field_name in to_many:
+                bulk_set_relation(
+                    model,
+                    field_name,
+                    instances,
+                    [data.get(field_name) for data in many_to_many_by_obj],
+                    batch_size=batch_size,
+                )
+        return instances
+
     def create(self, validated_data: dict) -> Any:
         custom_value_instances: list[AbstractBaseCustomValue] = []
         choices: list[AbstractBaseCustomValue] = []
+        storage_field = getattr(self.model, "_custom_values_storage_field", None)
+        stored_values: dict[str, Any] = {}
         for field in self._custom_fields:
             value = validated_data.pop(field.identifier, None)
             if value is None:
                 continue
-            if not field.choice_field:
+            if not field.choice_field and storage_field is not None:
+                stored_values[field.identifier] = self.fields[
+                    field.identifier
+                ].to_representation(value)
+            elif not field.choice_field:
                 custom_value_instances.append(
                     get_custom_value_model()(
                         field_id=field.id,
@@ -165,6 +442,8 @@ class CustomFieldBaseModelSerializer(serializers.ModelSerializer):
                     choices.extend(value)
                 else:
                     choices.append(value)
+        if storage_field is not None:
+            validated_data[storage_field] = stored_values
         instance = super().create(validated_data)
         if custom_value_instances or choices:
             custom_values = get_custom_value_model().objects.bulk_create(
@@ -174,43 +453,24 @@ class CustomFieldBaseModelSerializer(serializers.ModelSerializer):
             instance.custom_values.set(custom_values)
         return instance
 
-    def _create_or_update_custom_value(
-        self, instance: CustomFieldBaseModel, field: CustomFieldData, value: Any
-    ) -> None:
-        serializer_field = field.serializer_field
-        serializer_field.run_validators(value)
-        if value is not None:
-            value = serializer_field.to_representation(value)
-        try:
-            value_object = instance.custom_values.select_related("field").get(
-                field_id=field.id
-            )
-            if value is None:
-                value_object.delete()
-            else:
-                value_object.value = value
-                value_object.save()
-        except get_custom_value_model().DoesNotExist:
-            if value is not None:
-                value_object = get_custom_value_model().objects.create(
-                    field_id=field.id, value=value
-                )
-                instance.custom_values.add(value_object)
-
     def update(self, instance: Any, validated_data: dict) -> Any:
-        for field in self._custom_fields:
-            if field.identifier not in validated_data:
-                continue
-            value = validated_data.pop(field.identifier, None)
-            if field.choice_field:
-                instance.custom_values.remove(*field.choices)
-                if value is None:
-                    continue
-                if field.multiple:
-                    instance.custom_values.add(*value)
-                else:
-                    instance.custom_values.add(value)
+        """
+        The changed custom values are diffed against the existing values of the instance and written
+        with batched statements. Without the manager of the custom field models, the values are set
+        on the instance and written when it is saved.
+        """
+        custom_values = {
+            field.identifier: validated_data.pop(field.identifier)
+            for field in self._custom_fields
+            if field.identifier in validated_data
+        }
+        if custom_values:
+            if hasattr(self.model.objects, "bulk_update_custom_values"):
+                self.model.objects.bulk_update_custom_values(
+                    [instance], [custom_values]
+                )
             else:
-                self._create_or_update_custom_value(instance, field, value)
+                for identifier, value in custom_values.items():
+                    instance.set_custom_attr(identifier, value)
         instance = super().update(instance, validated_data)
         return instance
@@ -0,0 +1,63 @@
+from typing import Any
+
+from django.conf import settings
+from django.db import connections
+from django.db import router
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_migrate
+from django.db.models.signals import post_save
+
+from django_features.custom_fields.helpers import get_custom_field_model
+from django_features.custom_fields.indexes import create_custom_field_sql_functions
+from django_features.custom_fields.indexes import sync_custom_field_indexes
+from django_features.custom_fields.registry import custom_field_registry
+
+
+def invalidate_custom_field_registry(sender: Any, **kwargs: Any) -> None:
+    custom_field_registry.bump()
+
+
+def create_sql_functions(sender: Any, using: str, **kwargs: Any) -> None:
+    create_custom_field_sql_functions(connections[using])
+
+
+def sync_indexes(sender: Any, **kwargs: Any) -> None:
+    if not settings.CUSTOM_FIELD_SYNC_INDEXES:
+        return
+    using = router.db_for_write(get_custom_field_model())
+    # The callbacks run after the commit outside a transaction, so the indexes can be built without locking the
+    # value table for writes.
+    transaction.on_commit(
+        lambda: sync_custom_field_indexes(using, concurrently=True), using=using
+    )
+
+
+def connect_signals(app_config: Any) -> None:
+    post_migrate.connect(
+        create_sql_functions,
+        sender=app_config,
+        dispatch_uid="custom_field_sql_functions_post_migrate",
+    )
+    if settings.CUSTOM_FIELD_MODEL is None:
+        return
+    post_save.connect(
+        invalidate_custom_field_registry,
+        sender=settings.CUSTOM_FIELD_MODEL,
+        dispatch_uid="custom_field_registry_post_save",
+    )
+    post_delete.connect(
+        invalidate_custom_field_registry,
+        sender=settings.CUSTOM_FIELD_MODEL,
+        dispatch_uid="custom_field_registry_post_delete",
+    )
+    post_save.connect(
+        sync_indexes,
+        sender=settings.CUSTOM_FIELD_MODEL,
+        dispatch_uid="custom_field_indexes_post_save",
+    )
+    post_delete.connect(
+        sync_indexes,
+        sender=settings.CUSTOM_FIELD_MODEL,
+        dispatch_uid="custom_field_indexes_post_delete",
+    )
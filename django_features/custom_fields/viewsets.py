@@ -1,8 +1,10 @@
+from django.db.models import Prefetch
 from django.db.models import QuerySet
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
 from django_features.custom_fields import serializers
 from django_features.custom_fields.helpers import get_custom_field_model
+from django_features.custom_fields.helpers import get_custom_value_model
 from django_features.custom_fields.models.field import AbstractBaseCustomField
 
 
@@ -13,7 +15,23 @@ class CustomFieldViewSet(ReadOnlyModelViewSet):
     valid_content_type_filter_fields = ["app_label", "model"]
 
     def get_queryset(self) -> QuerySet[AbstractBaseCustomField]:
-        qs = super().get_queryset()
+        qs = super().get_queryset().select_related("content_type")
+        # Prefetch the choices of all choice fields with one query. The values of non-choice fields are excluded,
+        # because they are the values of the objects.
+        choices_accessor = (
+            get_custom_value_model()
+            ._meta.get_field("field")
+            .remote_field.get_accessor_name()
+        )
+        qs = qs.prefetch_related(
+            Prefetch(
+                choices_accessor,
+                queryset=get_custom_value_model().objects.filter(
+                    field__choice_field=True
+                ),
+                to_attr="prefetched_choices",
+            )
+        )
         for field in self.valid_content_type_filter_fields:
             value = self.request.GET.get(field)
             if value:
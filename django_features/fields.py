@@ -1,5 +1,11 @@
+import threading
+from collections import OrderedDict
 from typing import Any
+from typing import Iterable
+from typing import Mapping
 
+from django.core.exceptions import EmptyResultSet
+from django.core.exceptions import MultipleObjectsReturned
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
 from django.db.models import QuerySet
@@ -8,6 +14,126 @@ from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
 
+class RelatedLookupCache:
+    """
+    Resolves the objects of relation fields by their related field in memory. The objects referenced by a batch
+    are loaded with one query per related queryset, and the least recently used objects are dropped
+    when the cache holds more than max_size objects. The cache can be shared by several threads.
+    """
+
+    # Marks the values which match several objects.
+    _multiple = object()
+
+    def __init__(self, max_size: int = 10000) -> None:
+        self.max_size = max_size
+        self._objects: OrderedDict[tuple[Any, str], Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, field: "RelatedField", value: Any) -> models.Model | None:
+        """
+        Return the object with the value, or None if it doesn't exist. Raises MultipleObjectsReturned
+        if the value matches several objects, like the get of the queryset.
+        """
+        key = (field.lookup_namespace, str(value))
+        with self._lock:
+            cached = key in self._objects
+        if not cached:
+            self.load(field, [value])
+        with self._lock:
+            obj = self._objects.get(key)
+            if obj is not None:
+                self._objects.move_to_end(key)
+        if obj is self._multiple:
+            raise MultipleObjectsReturned(
+                f"More than one object with {field.related_field_name} {value} found."
+            )
+        return obj
+
+    def load(self, field: "RelatedField", values: Iterable[Any]) -> None:
+        namespace = field.lookup_namespace
+        with self._lock:
+            missing = {
+                key: value
+                for key, value in {str(value): value for value in values}.items()
+                if (namespace, key) not in self._objects
+            }
+        if not missing:
+            return
+        # Objects which don't exist aren't cached, they may be created later on.
+        loaded: dict[tuple[Any, str], Any] = {}
+        for obj in field.get_queryset().filter(
+            **{f"{field.related_field_name}__in": list(missing.values())}
+        ):
+            key = (namespace, str(getattr(obj, field.related_field_name)))
+            loaded[key] = self._multiple if key in loaded else obj
+        with self._lock:
+            self._objects.update(loaded)
+            while len(self._objects) > self.max_size:
+                self._objects.popitem(last=False)
+
+    def prefetch(
+        self, batch: Iterable[tuple[Mapping[str, serializers.Field], Any]]
+    ) -> None:
+        """
+        Load the objects referenced by the relation fields in a batch of serializer fields and their data,
+        with one query for all values of the fields with the same related queryset.
+        """
+        pending: dict[Any, tuple[RelatedField, list[Any]]] = {}
+        for fields, data in batch:
+            if not isinstance(data, dict):
+                continue
+            for name, field in fields.items():
+                values = data.get(name)
+                if isinstance(field, serializers.ManyRelatedField):
+                    field = field.child_relation
+                    if not isinstance(values, list):
+                        continue
+                else:
+                    values = [values]
+                if not isinstance(field, RelatedField):
+                    continue
+                namespace = field.lookup_namespace
+                if namespace is None:
+                    continue
+                _, lookup_values = pending.setdefault(namespace, (field, []))
+                for value in values:
+                    if value:
+                        try:
+                            lookup_values.append(field.to_lookup_value(value))
+                        except ValidationError:
+                            continue
+        for field, values in pending.values():
+            try:
+                self.load(field, values)
+            except (TypeError, ValueError):
+                # The invalid values are reported when they are validated one by one.
+                continue
+
+    def clear(self) -> None:
+        with self._lock:
+            self._objects = OrderedDict()
+
+
+def get_related_lookup_cache(
+    serializer: serializers.Field,
+) -> RelatedLookupCache | None:
+    """
+    Return the cache passed with the 'related_lookup_cache' context, or the cache of the root serializer
+    if it is a list serializer. Other serializers look up the related objects one by one.
+    """
+    cache = serializer.context.get("related_lookup_cache")
+    if cache is not None:
+        return cache
+    root = serializer.root
+    if not isinstance(root, serializers.ListSerializer):
+        return None
+    cache = getattr(root, "_related_lookup_cache", None)
+    if cache is None:
+        cache = RelatedLookupCache()
+        root._related_lookup_cache = cache
+    return cache
+
+
 class RelatedField(serializers.RelatedField):
     """
     A relation field which expects an uid to be present on the related model for lookup and representation.
@@ -51,6 +177,37 @@ class RelatedField(serializers.RelatedField):
     def get_queryset(self) -> QuerySet:
         return self.queryset or self.get_field().related_model.objects
 
+    @property
+    def lookup_namespace(self) -> tuple[str, str, str] | None:
+        """
+        The objects of the fields with the same queryset and related field are shared in the lookup cache.
+        """
+        if not hasattr(self, "_lookup_namespace"):
+            queryset = self.get_queryset().all()
+            try:
+                self._lookup_namespace: tuple[str, str, str] | None = (
+                    queryset.model._meta.label,
+                    str(queryset.query),
+                    self.related_field_name,
+                )
+            except EmptyResultSet:
+                self._lookup_namespace = None
+        return self._lookup_namespace
+
+    def to_lookup_value(self, data: Any) -> Any:
+        return data
+
+    def get_object(self, value: Any) -> models.Model:
+        cache = get_related_lookup_cache(self)
+        if cache is None or self.lookup_namespace is None:
+            return self.get_queryset().get(**{self.related_field_name: value})
+        obj = cache.get(self, value)
+        if obj is None:
+            raise ObjectDoesNotExist(
+                f"No object with {self.related_field_name} {value} found."
+            )
+        return obj
+
     def to_representation(self, related_obj: models.Model) -> None | str:
         """
         Get the related value of the object; format it as UID.
@@ -70,8 +227,14 @@ class RelatedField(serializers.RelatedField):
         """
         if not data and not self.required:
             return None
+        data = self.to_lookup_value(data)
         try:
-            return self.get_queryset().get(**{self.related_field_name: data})
+            return self.get_object(data)
+        except MultipleObjectsReturned as e:
+            raise ValidationError(
+                f"The {self.related_field_name} {data} matches several objects "
+                f"{self.get_field().related_model}: {e}"
+            )
         except ObjectDoesNotExist as e:
             if self.required:
                 raise ValidationError(
@@ -90,15 +253,17 @@ class RelatedField(serializers.RelatedField):
 class UUIDRelatedField(RelatedField):
     default_related_field_name = "uid"
 
+    # The field doesn't depend on the serializer, so all instances share it.
+    uuid_field = serializers.UUIDField()
+
     def to_representation(self, related_obj: models.Model) -> None | str:
         _ = super().to_representation(related_obj)
-        return serializers.UUIDField().to_representation(related_obj)
+        return self.uuid_field.to_representation(related_obj)
 
-    def to_internal_value(self, data: str) -> models.Model | None:
-        uuid = data
-        if uuid:
-            uuid = serializers.UUIDField().to_internal_value(data)
-        return super().to_internal_value(uuid)
+    def to_lookup_value(self, data: Any) -> Any:
+        if data:
+            return self.uuid_field.to_internal_value(data)
+        return data
 
 
 class ExternalUUIDRelatedField(UUIDRelatedField):
@@ -1,7 +1,308 @@
+import json
+from base64 import b64decode
+from base64 import b64encode
+from binascii import Error as BinasciiError
+from datetime import datetime
+from datetime import time
+from typing import Any
+from typing import NamedTuple
+
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db import models
+from django.db.models import F
+from django.db.models import Q
+from django.db.models import QuerySet
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.expressions import OrderBy
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import APIView
 
 
 class PageNumberPaginator(PageNumberPagination):
     page_query_param = settings.PAGE_QUERY_PARAM
     page_size_query_param = settings.PAGE_SIZE_QUERY_PARAM
+
+
+def get_estimated_count(queryset: QuerySet) -> int:
+    """
+    Return the number of rows of the queryset estimated by Postgres instead of counting them.
+    Unfiltered querysets use the row count of the table statistics, filtered querysets the estimate of the planner.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.count()
+    if not queryset.query.where:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        # The row count is unknown (-1) until the table is vacuumed or analyzed for the first time.
+        if row is None or row[0] < 0:
+            return queryset.count()
+        return int(row[0])
+    plan = json.loads(queryset.order_by().explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class _CursorEncoder(DjangoJSONEncoder):
+    def default(self, o: Any) -> Any:
+        # The DjangoJSONEncoder truncates the microseconds, which must be kept to compare the positions.
+        if isinstance(o, (datetime, time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+class _CursorKey(NamedTuple):
+    name: str
+    descending: bool
+    nulls_first: bool
+    output_field: models.Field
+
+    def reversed(self) -> "_CursorKey":
+        return self._replace(
+            descending=not self.descending, nulls_first=not self.nulls_first
+        )
+
+    def order_by(self) -> OrderBy:
+        if self.descending:
+            return F(self.name).desc(
+                nulls_first=self.nulls_first or None,
+                nulls_last=not self.nulls_first or None,
+            )
+        return F(self.name).asc(
+            nulls_first=self.nulls_first or None,
+            nulls_last=not self.nulls_first or None,
+        )
+
+    def after(self, value: Any) -> Q | None:
+        """
+        Return the condition of the rows which are ordered after the given value, or None if there are none.
+        """
+        nullable = getattr(self.output_field, "null", True)
+        if value is None:
+            if self.nulls_first:
+                return Q(**{f"{self.name}__isnull": False})
+            return None
+        q = Q(**{f"{self.name}__{'lt' if self.descending else 'gt'}": value})
+        if nullable and not self.nulls_first:
+            q |= Q(**{f"{self.name}__isnull": True})
+        return q
+
+    def equal(self, value: Any) -> Q:
+        if value is None:
+            return Q(**{f"{self.name}__isnull": True})
+        return Q(**{self.name: value})
+
+
+class CursorPaginator(BasePagination):
+    """
+    Keyset pagination, which filters the rows after the last row of the previous page instead of using an offset,
+    so deep pages are as fast as the first page. The rows are ordered by the ordering of the queryset or the
+    model, with the primary key as tie-breaker. Like the PageNumberPaginator, the results are only paginated
+    if a page size is given.
+
+    Set 'estimated_count' to add the count estimated by Postgres to the response.
+    """
+
+    cursor_query_param = settings.CURSOR_QUERY_PARAM
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = settings.PAGE_SIZE_QUERY_PARAM
+    max_page_size: int | None = None
+    estimated_count = False
+    invalid_cursor_message = "Invalid cursor"
+
+    def get_page_size(self, request: Request) -> int | None:
+        if self.page_size_query_param:
+            try:
+                page_size = int(request.query_params[self.page_size_query_param])
+            except (KeyError, ValueError):
+                return self.page_size
+            if page_size > 0:
+                if self.max_page_size:
+                    return min(page_size, self.max_page_size)
+                return page_size
+        return self.page_size
+
+    def _get_output_field(self, queryset: QuerySet, name: str) -> models.Field:
+        if name in queryset.query.annotations:
+            return queryset.query.annotations[name].output_field
+        model = queryset.model
+        *path, field_name = name.split(LOOKUP_SEP)
+        for part in path:
+            model = model._meta.get_field(part).related_model
+        field = model._meta.get_field(field_name)
+        if path and not field.null:
+            # A relation in the path can be missing, so the field is nullable anyway.
+            field = field.clone()
+            field.null = True
+        return field
+
+    def get_keys(self, queryset: QuerySet) -> tuple[QuerySet, list[_CursorKey]]:
+        """
+        Return the keys of the ordering of the queryset. Expressions are annotated, so they can be filtered.
+        """
+        ordering = list(queryset.query.order_by)
+        if not ordering and queryset.query.default_ordering:
+            ordering = list(queryset.model._meta.ordering)
+
+        keys = []
+        pk_name = queryset.model._meta.pk.name
+        for index, item in enumerate(ordering):
+            if isinstance(item, str):
+                if item == "?":
+                    raise ValueError("Random ordering can't be paginated with a cursor")
+                descending = item.startswith("-")
+                name = item.lstrip("-")
+                if name == "pk":
+                    name = pk_name
+                output_field = self._get_output_field(queryset, name)
+                if output_field.is_relation:
+                    # Relations are ordered by their key instead of the ordering of the related model.
+                    name = f"{name}_id"
+                if LOOKUP_SEP in name:
+                    # Fields of relations are annotated, so their values can be read from the objects.
+                    alias = f"_cursor_{index}"
+                    queryset = queryset.annotate(**{alias: F(name)})
+                    name = alias
+                keys.append(_CursorKey(name, descending, descending, output_field))
+            else:
+                if not isinstance(item, OrderBy):
+                    item = item.asc()
+                name = f"_cursor_{index}"
+                queryset = queryset.annotate(**{name: item.expression})
+                nulls_first = (
+                    item.nulls_first
+                    if item.nulls_first or item.nulls_last
+                    else item.descending
+                )
+                keys.append(
+                    _CursorKey(
+                        name,
+                        item.descending,
+                        bool(nulls_first),
+                        queryset.query.annotations[name].output_field,
+                    )
+                )
+        if pk_name not in [key.name for key in keys]:
+            keys.append(_CursorKey(pk_name, False, False, queryset.model._meta.pk))
+        return queryset, keys
+
+    def encode_cursor(self, values: list[Any], reverse: bool) -> str:
+        data = json.dumps({"p": values, "r": reverse}, cls=_CursorEncoder)
+        return b64encode(data.encode("utf-8")).decode("ascii")
+
+    def decode_cursor(
+        self, request: Request, keys: list[_CursorKey]
+    ) -> tuple[list[Any], bool] | None:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            data = json.loads(b64decode(encoded.encode("ascii")).decode("utf-8"))
+            values = data["p"]
+            if len(values) != len(keys):
+                raise ValueError
+            values = [
+                None if value is None else key.output_field.to_python(value)
+                for key, value in zip(keys, values)
+            ]
+            return values, bool(data["r"])
+        except (BinasciiError, UnicodeError, KeyError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _get_position(self, obj: Any, keys: list[_CursorKey]) -> list[Any]:
+        return [getattr(obj, key.name) for key in keys]
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view: APIView | None = None
+    ) -> list[Any] | None:
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.request = request
+        if self.estimated_count:
+            self.count = get_estimated_count(queryset)
+
+        queryset, keys = self.get_keys(queryset)
+        cursor = self.decode_cursor(request, keys)
+        position, reverse = cursor if cursor is not None else (None, False)
+        if reverse:
+            keys = [key.reversed() for key in keys]
+
+        queryset = queryset.order_by(*[key.order_by() for key in keys])
+        if position is not None:
+            condition = None
+            equal = Q()
+            for key, value in zip(keys, position):
+                after = key.after(value)
+                if after is not None:
+                    condition = (
+                        equal & after
+                        if condition is None
+                        else condition | equal & after
+                    )
+                equal &= key.equal(value)
+            if condition is None:
+                queryset = queryset.none()
+            else:
+                queryset = queryset.filter(condition)
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+        if reverse:
+            results.reverse()
+
+        self.next_position = self.previous_position = None
+        if results:
+            if has_more or reverse:
+                self.next_position = self._get_position(results[-1], keys)
+            if position is not None and (has_more or not reverse):
+                self.previous_position = self._get_position(results[0], keys)
+        return results
+
+    def _get_link(self, position: list[Any] | None, reverse: bool) -> str | None:
+        if position is None:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.encode_cursor(position, reverse),
+        )
+
+    def get_next_link(self) -> str | None:
+        return self._get_link(self.next_position, reverse=False)
+
+    def get_previous_link(self) -> str | None:
+        return self._get_link(self.previous_position, reverse=True)
+
+    def get_paginated_response(self, data: Any) -> Response:
+        response = {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+        if self.estimated_count:
+            response = {"count": self.count, **response}
+        return Response(response)
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        properties = {
+            "next": {"type": "string", "nullable": True, "format": "uri"},
+            "previous": {"type": "string", "nullable": True, "format": "uri"},
+            "results": schema,
+        }
+        if self.estimated_count:
+            properties = {"count": {"type": "integer"}, **properties}
+        return {"type": "object", "required": ["results"], "properties": properties}
@@ -1,15 +1,27 @@
+import threading
+from functools import lru_cache
+from itertools import islice
 from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import NamedTuple
 
 from django.contrib.contenttypes.fields import GenericRelation
 from django.core.exceptions import FieldDoesNotExist
 from django.core.exceptions import ValidationError
+from django.db import DatabaseError
 from django.db import models
+from django.db import transaction
 from django.db.models import NOT_PROVIDED
 from rest_framework import serializers
 from rest_framework.fields import empty
 from rest_framework.relations import ManyRelatedField
 
+from django_features.custom_fields.serializers import bulk_set_relation
 from django_features.custom_fields.serializers import CustomFieldBaseModelSerializer
+from django_features.fields import get_related_lookup_cache
+from django_features.fields import RelatedLookupCache
 from django_features.fields import UUIDRelatedField
 
 
@@ -132,12 +144,19 @@ class BaseMappingSerializer(CustomFieldBaseModelSerializer, PropertySerializerMi
                         ),
                         required=False,
                     )
+        initial_data = getattr(self, "initial_data", None)
+        # The child of a list serializer validates the nested data of all items.
+        in_list = isinstance(self.parent, serializers.ListSerializer)
         for field_name, field in nested_fields.items():
-            nested_data = self.initial_data.get(field_name)
+            nested_data = (
+                initial_data.get(field_name) if isinstance(initial_data, dict) else None
+            )
             if not isinstance(nested_data, dict):
-                continue
+                if not in_list:
+                    continue
+                nested_data = empty
             self.related_fields.add(field_name)
-            fields[field_name] = NestedMappingSerializer(
+            fields[field_name] = NestedMappingSerializer.for_model(field.related_model)(
                 data=nested_data,
                 exclude=[*self.exclude, self.model.__name__.lower()],
                 field=field,
@@ -152,35 +171,71 @@ class BaseMappingSerializer(CustomFieldBaseModelSerializer, PropertySerializerMi
         self.fields = fields
         return fields
 
+    def _is_foreign_key(self, field_name: str) -> bool:
+        model_field = self.model._meta.get_field(field_name)
+        return model_field.concrete and (
+            model_field.one_to_one or model_field.many_to_one
+        )
+
     def create(self, validated_data: dict[str, Any]) -> models.Model:
         relations_to_save: dict[str, Any] = {}
         for field in self.related_fields:
             value = validated_data.pop(field, None)
             serializer = self.fields.get(field)
-            if isinstance(serializer, NestedMappingSerializer):
-                serializer.is_valid(raise_exception=True)
-                relations_to_save[field] = serializer.save()
-            elif value is not None:
+            if isinstance(serializer, NestedMappingSerializer) and value is not None:
+                value = serializer.create(dict(value))
+            if value is None:
+                continue
+            # The foreign keys are set with the insert of the instance.
+            if self._is_foreign_key(field):
+                validated_data[field] = value
+            else:
                 relations_to_save[field] = value
         instance = super().create(validated_data)
         for field, value in relations_to_save.items():
             model_field = self.model._meta.get_field(field)
             if model_field.many_to_many or model_field.one_to_many:
                 getattr(instance, field).set(value)
-            if model_field.one_to_one or model_field.many_to_one:
-                setattr(instance, field, value)
-        instance.save()
         return instance
 
+    def bulk_create(
+        self, validated_data: list[dict[str, Any]], batch_size: int | None = None
+    ) -> list[models.Model]:
+        """
+        The nested related objects of all items are created together before their parents, so the foreign keys
+        are set with the inserts of the parents. The to-many relations are set with one statement per relation.
+        """
+        validated_data = [dict(data) for data in validated_data]
+        to_many: dict[str, list[Any]] = {}
+        with transaction.atomic():
+            for field in self.related_fields:
+                values = [data.pop(field, None) for data in validated_data]
+                serializer = self.fields.get(field)
+                if isinstance(serializer, NestedMappingSerializer):
+                    nested = [value for value in values if value is not None]
+                    created = iter(serializer.bulk_create(nested, batch_size))
+                    values = [
+                        None if value is None else next(created) for value in values
+                    ]
+                if self._is_foreign_key(field):
+                    for data, value in zip(validated_data, values):
+                        if value is not None:
+                            data[field] = value
+                else:
+                    to_many[field] = values
+            instances = super().bulk_create(validated_data, batch_size)
+            for field, values in to_many.items():
+                bulk_set_relation(self.model, field, instances, values, batch_size)
+        return instances
+
     def update(
         self, instance: models.Model, validated_data: dict[str, Any]
     ) -> models.Model:
         for field in self.related_fields:
             value = validated_data.pop(field, None)
             serializer = self.fields.get(field)
-            if isinstance(serializer, NestedMappingSerializer):
-                serializer.is_valid(raise_exception=True)
-                value = serializer.save()
+            if isinstance(serializer, NestedMappingSerializer) and value is not None:
+                value = serializer.create(dict(value))
             model_field = self.model._meta.get_field(field)
             if model_field.many_to_many or model_field.one_to_many:
                 getattr(instance, field).set(value)
@@ -189,11 +244,45 @@ class BaseMappingSerializer(CustomFieldBaseModelSerializer, PropertySerializerMi
         return super().update(instance, validated_data)
 
 
+# The nested serializer classes by base class and related model.
+_nested_serializer_classes: dict[
+    tuple[type["NestedMappingSerializer"], type[models.Model]],
+    type["NestedMappingSerializer"],
+] = {}
+_nested_serializer_classes_lock = threading.Lock()
+
+
 class NestedMappingSerializer(BaseMappingSerializer):
+    """
+    The serializer of a nested relation is an instance of a subclass for the related model, so the serializers
+    of different models don't share their Meta class and can be used in several threads at once.
+    """
+
     class Meta:
         fields = "__all__"
         model = None
 
+    def __new__(cls, *args: Any, **kwargs: Any) -> Any:
+        field = kwargs.get("field", args[1] if len(args) > 1 else None)
+        if cls.Meta.model is None and field is not None:
+            cls = cls.for_model(field.related_model)
+        return super().__new__(cls, *args, **kwargs)
+
+    @classmethod
+    def for_model(cls, model: type[models.Model]) -> type["NestedMappingSerializer"]:
+        key = (cls, model)
+        serializer_class = _nested_serializer_classes.get(key)
+        if serializer_class is None:
+            with _nested_serializer_classes_lock:
+                serializer_class = _nested_serializer_classes.get(key)
+                if serializer_class is None:
+                    meta = type("Meta", (cls.Meta,), {"model": model})
+                    serializer_class = type(
+                        f"{model.__name__}{cls.__name__}", (cls,), {"Meta": meta}
+                    )
+                    _nested_serializer_classes[key] = serializer_class
+        return serializer_class
+
     def __init__(
         self,
         exclude: list,
@@ -206,15 +295,65 @@ class NestedMappingSerializer(BaseMappingSerializer):
         self.exclude = exclude
         self.mapping_fields = nested_fields
         self.mapping = parent_mapping
-        self.Meta.model = field.related_model
         super().__init__(*args, **kwargs)
 
 
+class _MappingPlanEntry(NamedTuple):
+    external_path: tuple[str, ...]
+    internal_path: tuple[str, ...]
+    default_name: str
+    format_name: str
+    # None values aren't mapped on updates of fields which aren't nullable but have a default.
+    skip_none_on_update: bool
+
+
+class _BoundMappingPlanEntry(NamedTuple):
+    external_path: tuple[str, ...]
+    internal_path: tuple[str, ...]
+    # The hooks are resolved with getattr on the serializer, so any callable attribute works.
+    default_func: Callable[[], Any] | None
+    format_func: Callable[[Any], Any] | None
+    skip_none_on_update: bool
+
+
+@lru_cache(maxsize=128)
+def _compile_mapping_plan(
+    model: type[models.Model],
+    model_mapping: tuple[tuple[str, str], ...],
+    relation_separator: str,
+    default_prefix: str,
+    format_prefix: str,
+) -> tuple[_MappingPlanEntry, ...]:
+    """
+    Compile the model mapping of a serializer, so the records are mapped without parsing the mapping again.
+    """
+    plan = []
+    for external_name, internal_name in model_mapping:
+        internal_path = tuple(internal_name.split(relation_separator))
+        try:
+            field = model._meta.get_field(internal_path[0])
+            skip_none_on_update = not field.null and field.default != NOT_PROVIDED
+        except FieldDoesNotExist:
+            skip_none_on_update = False
+        plan.append(
+            _MappingPlanEntry(
+                external_path=tuple(external_name.split(relation_separator)),
+                internal_path=internal_path,
+                default_name=f"{default_prefix}_{internal_name}",
+                format_name=f"{format_prefix}_{internal_name}",
+                skip_none_on_update=skip_none_on_update,
+            )
+        )
+    return tuple(plan)
+
+
 class DataMappingSerializerMixin(PropertySerializerMixin):
     _default_prefix = "default"
     _format_prefix = "format"
 
-    def _get_nested_data(self, field_path: list[str], data: Any) -> tuple[Any, bool]:
+    def _get_nested_data(
+        self, field_path: list[str] | tuple[str, ...], data: Any
+    ) -> tuple[Any, bool]:
         field_name = field_path[0]
         if not isinstance(data, dict):
             return None, False
@@ -224,7 +363,10 @@ class DataMappingSerializerMixin(PropertySerializerMixin):
         return value, True
 
     def _get_data_with_internal_key(
-        self, field_path: list[str], parent_data: dict[str, Any] | Any, value: Any
+        self,
+        field_path: list[str] | tuple[str, ...],
+        parent_data: dict[str, Any] | Any,
+        value: Any,
     ) -> dict[str, Any] | Any:
         field_name = field_path[0]
         if len(field_path) > 1:
@@ -236,40 +378,65 @@ class DataMappingSerializerMixin(PropertySerializerMixin):
                 return parent_data
         return {field_name: value}
 
-    def map_data(self, initial_data: Any) -> Any:
+    @property
+    def mapping_plan(self) -> tuple[_BoundMappingPlanEntry, ...]:
+        """
+        The plan is compiled once per model and model mapping, and its hooks are bound once per serializer.
+        """
+        plan = _compile_mapping_plan(
+            self.model,
+            tuple(self.model_mapping.items()),
+            self.relation_separator,
+            self._default_prefix,
+            self._format_prefix,
+        )
+        bound_plan = getattr(self, "_bound_mapping_plan", None)
+        if bound_plan is None or bound_plan[0] is not plan:
+            bound_plan = (
+                plan,
+                tuple(
+                    _BoundMappingPlanEntry(
+                        external_path=entry.external_path,
+                        internal_path=entry.internal_path,
+                        default_func=getattr(self, entry.default_name, None),
+                        format_func=getattr(self, entry.format_name, None),
+                        skip_none_on_update=entry.skip_none_on_update,
+                    )
+                    for entry in plan
+                ),
+            )
+            self._bound_mapping_plan = bound_plan
+        return bound_plan[1]
+
+    def map_data(
+        self,
+        initial_data: Any,
+        plan: tuple[_BoundMappingPlanEntry, ...] | None = None,
+    ) -> Any:
+        if plan is None:
+            plan = self.mapping_plan
         data: dict[str, Any] = {}
-        for external_name, internal_name in self.model_mapping.items():
-            external_field_path = external_name.split(self.relation_separator)
-            value, found = self._get_nested_data(external_field_path, initial_data)
+        for entry in plan:
+            value, found = self._get_nested_data(entry.external_path, initial_data)
             if not found:
-                default_func = getattr(
-                    self, f"{self._default_prefix}_{internal_name}", None
-                )
-                if default_func is not None:
-                    value = default_func()
-                else:
-                    continue
-            format_func = getattr(self, f"{self._format_prefix}_{internal_name}", None)
-            if format_func is not None:
-                value = format_func(value)
-            internal_field_path = internal_name.split(self.relation_separator)
-            if value is None:
-                if getattr(self, "instance") is None:
+                if entry.default_func is None:
                     continue
-                else:
-                    try:
-                        field = self.model._meta.get_field(internal_field_path[0])
-                        if not field.null and field.default != NOT_PROVIDED:
-                            continue
-                    except FieldDoesNotExist:
-                        pass
+                value = entry.default_func()
+            if entry.format_func is not None:
+                value = entry.format_func(value)
+            if value is None and (
+                getattr(self, "instance") is None or entry.skip_none_on_update
+            ):
+                continue
             data.update(
-                self._get_data_with_internal_key(internal_field_path, data, value)
+                self._get_data_with_internal_key(entry.internal_path, data, value)
             )
         return data
 
 
 class ListDataMappingSerializer(serializers.ListSerializer, DataMappingSerializerMixin):
+    batch_size: int | None = 1000
+
     def __init__(self, data: Any = empty, *args: Any, **kwargs: Any) -> None:
         self.instance = None
         self.mapping = kwargs.pop("mapping", {})
@@ -279,11 +446,30 @@ class ListDataMappingSerializer(serializers.ListSerializer, DataMappingSerialize
         super().__init__(data=mapped_data, *args, **kwargs)
 
     def map_list_data(self, initial_data: Any) -> list[Any]:
+        plan = self.mapping_plan
         list_data: list[dict[str, Any]] = []
         for item in initial_data:
-            list_data.append(self.map_data(item))
+            list_data.append(self.map_data(item, plan))
         return list_data
 
+    def to_internal_value(self, data: Any) -> list[Any]:
+        cache = get_related_lookup_cache(self)
+        if cache is not None and isinstance(data, list):
+            cache.prefetch((self.child.fields, item) for item in data)
+        return super().to_internal_value(data)
+
+    def create(self, validated_data: list[dict[str, Any]]) -> list[models.Model]:
+        if not self.child._bulk_create:
+            return super().create(validated_data)
+        return self.child.bulk_create(validated_data, batch_size=self.batch_size)
+
+
+class MappingImportChunk(NamedTuple):
+    number: int
+    saved: int
+    # The errors of the records which weren't saved, by the index of the record in the input.
+    errors: dict[int, Any]
+
 
 class MappingSerializer(BaseMappingSerializer, DataMappingSerializerMixin):
     list_serializer_class = ListDataMappingSerializer
@@ -334,3 +520,51 @@ class MappingSerializer(BaseMappingSerializer, DataMappingSerializerMixin):
         model = getattr(meta, "model", None)
         list_kwargs["model"] = model
         return list_serializer_class(*args, **list_kwargs)
+
+    @classmethod
+    def import_data(
+        cls, records: Iterable[Any], chunk_size: int = 1000, **kwargs: Any
+    ) -> Iterator[MappingImportChunk]:
+        """
+        Map, validate and save the records of the iterable in chunks, e.g. the lines of a JSON-lines file.
+        Only one chunk of records is held in memory, so the memory stays flat regardless of the input size.
+
+        Each chunk is saved in a transaction. Records which are invalid or fail to save are skipped and
+        reported with the result of their chunk, which is yielded after the chunk is committed.
+
+        The related objects referenced by a chunk are loaded together into a lookup cache, which is shared
+        by all chunks unless a 'related_lookup_cache' is passed with the context.
+        """
+        context = {**kwargs.pop("context", {})}
+        cache = context.setdefault("related_lookup_cache", RelatedLookupCache())
+        records = enumerate(records)
+        chunk_index = 0
+        while chunk := list(islice(records, chunk_size)):
+            saved = 0
+            errors: dict[int, Any] = {}
+            chunk_serializers = [
+                (index, cls(data=record, context=context, **kwargs))
+                for index, record in chunk
+            ]
+            cache.prefetch(
+                (serializer.fields, serializer.initial_data)
+                for _, serializer in chunk_serializers
+            )
+            with transaction.atomic():
+                for index, serializer in chunk_serializers:
+                    if not serializer.is_valid():
+                        errors[index] = serializer.errors
+                        continue
+                    try:
+                        # A failing record must not roll back the other records of the chunk.
+                        with transaction.atomic():
+                            serializer.save()
+                    except serializers.ValidationError as e:
+                        errors[index] = e.detail
+                        continue
+                    except (DatabaseError, ValidationError) as e:
+                        errors[index] = getattr(e, "messages", [str(e)])
+                        continue
+                    saved += 1
+            yield MappingImportChunk(chunk_index, saved, errors)
+            chunk_index += 1
@@ -7,13 +7,17 @@ class BaseConfiguration(Configuration):
     def INSTALLED_APPS(self) -> list[str]:
         return []
 
+    CURSOR_QUERY_PARAM = values.Value("cursor")
     PAGE_QUERY_PARAM = values.Value("page")
     PAGE_SIZE_QUERY_PARAM = values.Value("page_size")
 
     CUSTOM_FIELD_ADMIN = values.BooleanValue(default=True)
     CUSTOM_FIELD_APP = values.Value("django_features.custom_fields")
 
+    CUSTOM_FIELD_GENERATION_CHECK_INTERVAL = values.FloatValue(default=1.0)
+    CUSTOM_FIELD_JSON_AGGREGATION = values.BooleanValue(default=False)
     CUSTOM_FIELD_MODEL = values.Value()
+    CUSTOM_FIELD_SYNC_INDEXES = values.BooleanValue(default=False)
     CUSTOM_FIELD_VALUE_MODEL = values.Value()
 
     @property
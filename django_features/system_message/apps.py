@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class SystemMessageAppConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "django_features.system_message"
+
+    def ready(self) -> None:
+        from django_features.system_message.signals import connect_signals
+
+        connect_signals()
@@ -0,0 +1,71 @@
+__all__ = [
+    "bump_system_message_version",
+    "get_active_system_messages",
+]
+
+
+import hashlib
+import json
+import uuid
+from typing import Any
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+from django_features.system_message import models
+from django_features.system_message import serializers
+
+
+VERSION_CACHE_KEY = "system_message:version"
+ACTIVE_CACHE_KEY = "system_message:active:{version}"
+
+
+def get_system_message_version() -> str:
+    version = cache.get(VERSION_CACHE_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        # Another process may have set the version in the meantime.
+        if not cache.add(VERSION_CACHE_KEY, version, None):
+            version = cache.get(VERSION_CACHE_KEY, version)
+    return version
+
+
+def bump_system_message_version() -> None:
+    """
+    Invalidate the cached active system messages of all processes which share the cache.
+    """
+    cache.set(VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+
+
+def get_active_system_messages() -> tuple[str, list[dict[str, Any]]]:
+    """
+    Return the ETag and the serialized data of the active system messages.
+
+    The data is cached with the version of the system messages, which is bumped whenever a message or a type
+    is saved or deleted, until the next transition of the active messages.
+    """
+    now = timezone.now()
+    key = ACTIVE_CACHE_KEY.format(version=get_system_message_version())
+    entry = cache.get(key)
+    if entry is not None and (
+        entry["valid_until"] is None or now < entry["valid_until"]
+    ):
+        return entry["etag"], entry["data"]
+
+    queryset = models.SystemMessage.objects.all()
+    data = serializers.SystemMessageSerializer(
+        queryset.select_related("type").active_at(now), many=True
+    ).data
+    valid_until = queryset.next_transition_after(now)
+    content = json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True)
+    entry = {
+        "data": list(data),
+        "etag": hashlib.md5(content.encode("utf-8"), usedforsecurity=False).hexdigest(),
+        "valid_until": valid_until,
+    }
+    timeout = None
+    if valid_until is not None:
+        timeout = max(int((valid_until - now).total_seconds()) + 1, 1)
+    cache.set(key, entry, timeout)
+    return entry["etag"], entry["data"]
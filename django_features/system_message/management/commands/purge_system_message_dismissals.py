@@ -0,0 +1,71 @@
+from datetime import timedelta
+from typing import Any
+
+import djclick as click
+from django.core.management import CommandParser
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from django_features.system_message import models
+
+
+def _delete_in_chunks(queryset: QuerySet, chunk_size: int) -> int:
+    """
+    Delete the rows of the queryset in chunks, each in its own transaction, so no lock is held for long.
+    """
+    deleted = 0
+    while True:
+        ids = list(queryset.values_list("pk", flat=True)[:chunk_size])
+        if not ids:
+            return deleted
+        queryset.model.objects.filter(pk__in=ids).delete()
+        deleted += len(ids)
+
+
+class Command(BaseCommand):
+    help = "Deletes the dismissals of system messages which ended before the retention window."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=30,
+            help="Keep the dismissals of messages which ended within the given number of days.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="Number of rows deleted per statement.",
+        )
+        parser.add_argument(
+            "--delete-messages",
+            action="store_true",
+            help="Also delete the expired system messages.",
+        )
+
+    def handle(
+        self,
+        days: int,
+        chunk_size: int,
+        delete_messages: bool,
+        *args: Any,
+        **options: Any,
+    ) -> None:
+        if chunk_size < 1:
+            raise CommandError("The chunk size must be at least 1.")
+        cutoff = timezone.now() - timedelta(days=days)
+        through = models.SystemMessage.dismissed_users.through
+
+        deleted = _delete_in_chunks(
+            through.objects.filter(systemmessage__end__lt=cutoff), chunk_size
+        )
+        click.secho(f"INFO: Deleted {deleted} dismissals", fg="green")
+
+        if delete_messages:
+            deleted = _delete_in_chunks(
+                models.SystemMessage.objects.filter(end__lt=cutoff), chunk_size
+            )
+            click.secho(f"INFO: Deleted {deleted} system messages", fg="green")
@@ -0,0 +1,19 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("system_message", "0004_allow_empty_user_relation"),
+    ]
+
+    # The through table of the dismissed users is created by Django, so the index can't be declared on a model.
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX IF NOT EXISTS system_message_dismissed_user_message_idx "
+                "ON system_message_systemmessage_dismissed_users (user_id, systemmessage_id)"
+            ),
+            reverse_sql="DROP INDEX IF EXISTS system_message_dismissed_user_message_idx",
+        ),
+    ]
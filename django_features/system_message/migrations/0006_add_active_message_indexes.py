@@ -0,0 +1,20 @@
+# Generated by Django 4.2.23 on 2026-10-18 11:47
+
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("system_message", "0005_add_dismissed_users_user_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="systemmessage",
+            index=models.Index(
+                fields=["end", "begin"], name="system_message_end_begin_idx"
+            ),
+        ),
+    ]
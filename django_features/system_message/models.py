@@ -1,5 +1,13 @@
+from datetime import datetime
+from typing import Any
+
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.db.models import Exists
+from django.db.models import OuterRef
+from django.db.models import Q
+from django.db.models import Value
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django_extensions.db.models import TimeStampedModel
 
@@ -23,6 +31,69 @@ class SystemMessageType(TimeStampedModel):
         return f"{self.name}"
 
 
+def _get_active_q(ts: datetime) -> Q:
+    return Q(begin__lte=ts) & (Q(end__gte=ts) | Q(end__isnull=True))
+
+
+class SystemMessageQuerySet(models.QuerySet):
+    def active_at(self, ts: datetime | None = None) -> "SystemMessageQuerySet":
+        """
+        Filter the messages which are active at the given time, or now.
+        """
+        return self.filter(_get_active_q(ts or timezone.now()))
+
+    def inactive_at(self, ts: datetime | None = None) -> "SystemMessageQuerySet":
+        return self.exclude(_get_active_q(ts or timezone.now()))
+
+    def next_transition_after(self, ts: datetime | None = None) -> datetime | None:
+        """
+        Return the next time at which the active messages change after the given time, or now. This is either
+        the next begin of a message, or the next end, right after which the message isn't active anymore.
+        The next end is read with an index scan on the end, the next begin without an index.
+        """
+        ts = ts or timezone.now()
+        transitions = [
+            self.filter(begin__gt=ts)
+            .order_by("begin")
+            .values_list("begin", flat=True)
+            .first(),
+            self.filter(end__gte=ts)
+            .order_by("end")
+            .values_list("end", flat=True)
+            .first(),
+        ]
+        return min(
+            (transition for transition in transitions if transition is not None),
+            default=None,
+        )
+
+    def with_dismissed(self, user: Any) -> "SystemMessageQuerySet":
+        """
+        Annotate whether the given user dismissed the messages as 'is_dismissed'.
+        """
+        if user is None or not user.is_authenticated:
+            return self.annotate(is_dismissed=Value(False))
+        through = self.model.dismissed_users.through
+        return self.annotate(
+            is_dismissed=Exists(
+                through.objects.filter(systemmessage_id=OuterRef("pk"), user_id=user.pk)
+            )
+        )
+
+    def dismiss(self, user: Any) -> None:
+        """
+        Dismiss the messages of this queryset for the given user with one insert.
+        """
+        through = self.model.dismissed_users.through
+        through.objects.bulk_create(
+            [
+                through(systemmessage_id=message_id, user_id=user.pk)
+                for message_id in self.values_list("id", flat=True)
+            ],
+            ignore_conflicts=True,
+        )
+
+
 class SystemMessage(TimeStampedModel):
     background_color = models.CharField(
         verbose_name=_("Hintergrundfarbe"), default="#0000FF", max_length=7
@@ -47,10 +118,23 @@ class SystemMessage(TimeStampedModel):
         blank=True,
     )
 
+    objects = SystemMessageQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Systemmeldung")
         verbose_name_plural = _("Systemmeldungen")
         ordering = ("order", "end", "begin", "title")
+        indexes = [
+            # The active messages are filtered with begin <= ts AND (end >= ts OR end IS NULL). Both branches
+            # of the OR are range scans on this index, since a btree index also holds the rows without end.
+            models.Index(fields=["end", "begin"], name="system_message_end_begin_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.title}"
+
+    def dismiss(self, user: Any) -> None:
+        through = self.dismissed_users.through
+        through.objects.bulk_create(
+            [through(systemmessage_id=self.pk, user_id=user.pk)], ignore_conflicts=True
+        )
@@ -6,7 +6,7 @@ from rest_framework.request import Request
 
 
 class CanManageSystemMessage(DjangoModelPermissions):
-    allowed_actions = ["list", "retrieve"]
+    allowed_actions = ["active", "list", "retrieve"]
 
     def has_permission(self, request: Request, view: Any) -> bool:
         if not config.ENABLE_SYSTEM_MESSAGE:
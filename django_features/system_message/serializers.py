@@ -14,6 +14,8 @@ class SystemMessageTypeSerializer(serializers.ModelSerializer):
 
 
 class SystemMessageSerializer(serializers.ModelSerializer):
+    # Only available if the queryset is annotated with 'with_dismissed'.
+    is_dismissed = serializers.BooleanField(read_only=True)
     type = SystemMessageTypeSerializer(read_only=True)
     type_id = serializers.IntegerField()
 
@@ -24,9 +26,14 @@ class SystemMessageSerializer(serializers.ModelSerializer):
             "begin",
             "end",
             "id",
+            "is_dismissed",
             "text",
             "text_color",
             "title",
             "type",
             "type_id",
         ]
+
+
+class SystemMessageDismissSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False)
@@ -0,0 +1,25 @@
+from typing import Any
+
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+
+from django_features.system_message import models
+from django_features.system_message.cache import bump_system_message_version
+
+
+def invalidate_active_system_messages(sender: Any, **kwargs: Any) -> None:
+    bump_system_message_version()
+
+
+def connect_signals() -> None:
+    for model in (models.SystemMessage, models.SystemMessageType):
+        post_save.connect(
+            invalidate_active_system_messages,
+            sender=model,
+            dispatch_uid=f"active_system_messages_post_save_{model._meta.model_name}",
+        )
+        post_delete.connect(
+            invalidate_active_system_messages,
+            sender=model,
+            dispatch_uid=f"active_system_messages_post_delete_{model._meta.model_name}",
+        )
@@ -1,8 +1,8 @@
 from typing import Any
 
-from django.db.models import Q
 from django.db.models import QuerySet
-from django.utils import timezone
+from django.utils.http import parse_etags
+from django.utils.http import quote_etag
 from django_filters import rest_framework as filters
 from django_filters.rest_framework import DjangoFilterBackend
 from django_filters.widgets import QueryArrayWidget
@@ -18,6 +18,7 @@ from rest_framework.viewsets import ReadOnlyModelViewSet
 from django_features.pagination import PageNumberPaginator
 from django_features.system_message import models
 from django_features.system_message import serializers
+from django_features.system_message.cache import get_active_system_messages
 from django_features.system_message.permissions import CanManageSystemMessage
 
 
@@ -36,20 +37,14 @@ class SystemMessageFilter(filters.FilterSet):
         fields = ["id", "type"]
 
     def filter_active(self, queryset: QuerySet, name: str, value: bool) -> QuerySet:
-        q = Q(begin__lte=timezone.now()) & (
-            Q(end__gte=timezone.now()) | Q(end__isnull=True)
-        )
         if not value:
-            return queryset.exclude(q)
-        return queryset.filter(q)
+            return queryset.inactive_at()
+        return queryset.active_at()
 
     def filter_dismissed(self, queryset: QuerySet, name: str, value: bool) -> QuerySet:
         if not self.request.user.is_authenticated:
             return queryset
-        q = Q(dismissed_users=self.request.user)
-        if not value:
-            return queryset.exclude(q)
-        return queryset.filter(q)
+        return queryset.filter(is_dismissed=value)
 
 
 class SystemMessageViewSet(ModelViewSet):
@@ -71,8 +66,46 @@ class SystemMessageViewSet(ModelViewSet):
     search_fields = ("background_color", "message", "message_color", "title", "type")
     serializer_class = serializers.SystemMessageSerializer
 
+    @action(methods=["get"], detail=False)
+    def active(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """
+        The active system messages from the cache. Clients which send the ETag of their last response
+        in the If-None-Match header get a 304 response if the active messages didn't change.
+        """
+        etag, data = get_active_system_messages()
+        etag = quote_etag(etag)
+        if_none_match = parse_etags(request.headers.get("If-None-Match", ""))
+        if etag in if_none_match or "*" in if_none_match:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(data)
+        response["ETag"] = etag
+        response["Cache-Control"] = "no-cache"
+        return response
+
+    def get_queryset(self) -> QuerySet:
+        return (
+            super()
+            .get_queryset()
+            .select_related("type")
+            .with_dismissed(self.request.user)
+        )
+
     @action(methods=["patch"], detail=True)
     def dismiss(self, request: Request, pk: int, *args: Any, **kwargs: Any) -> Response:
         if self.request.user.is_authenticated:
-            self.get_object().dismissed_users.add(self.request.user)
+            self.get_object().dismiss(self.request.user)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @action(methods=["patch"], detail=False, url_path="dismiss")
+    def dismiss_many(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """
+        Dismiss all system messages with the given ids.
+        """
+        serializer = serializers.SystemMessageDismissSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        if self.request.user.is_authenticated:
+            models.SystemMessage.objects.filter(
+                pk__in=serializer.validated_data["ids"]
+            ).dismiss(self.request.user)
         return Response(status=status.HTTP_204_NO_CONTENT)
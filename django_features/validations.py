@@ -10,7 +10,7 @@ from django.db.models.fields import NOT_PROVIDED
 from django.db.models.fields.related import RelatedField
 from rest_framework.utils.model_meta import get_field_info
 
-from django_features.custom_fields.helpers import get_custom_field_model
+from django_features.custom_fields.registry import custom_field_registry
 
 
 class MappingValidationMixin:
@@ -65,13 +65,7 @@ class MappingValidationMixin:
         if not self.validate_custom_fields or not settings.CUSTOM_FIELDS_FEATURE:
             return []
 
-        content_type = ContentType.objects.get_for_model(model)
-        return list(
-            get_custom_field_model()
-            .objects.filter(content_type=content_type)
-            .values_list("identifier", flat=True)
-            .distinct()
-        )
+        return custom_field_registry.get_identifiers(model)
 
     def validate_field(self, field_path: str, model: type[Model] | Any) -> None:
         split = field_path.split(self.relation_separator)